@@ -5,6 +5,19 @@ import math
 import time
 import json
 import os
+import struct
+import array
+import threading
+import atexit
+import collections
+import queue
+
+# Headless simulation (python SpaceInvaders.py --headless --ticks N) runs without a window or audio device.
+# --replay FILE re-simulates a recorded run, which is always headless.
+HEADLESS = "--headless" in sys.argv or "--replay" in sys.argv
+if HEADLESS:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
 
 # Initialize Pygame
 pygame.init()
@@ -49,14 +62,27 @@ BASE_BULLET_SPEED = 10
 BASE_ENEMY_SPEED = 0.15
 BASE_SHOOT_COOLDOWN = 300
 ENEMY_DROP_SPEED = 30
+ENEMY_WIDTH = 45
+ENEMY_HEIGHT = 30
+ENEMY_FIRE_CHANCE = 2 / 1500  # Chance per alien per tick of firing (the old randint(1, 1500) < 3 roll)
+ENEMY_FIRE_FRONT_ONLY = False  # If True, only the lowest alien in each column fires
 RAPID_FIRE_COOLDOWN = 100
 AUTO_FIRE_COOLDOWN = 150  # Cooldown for auto-fire powerup (faster than normal, slower than rapid fire)
 AFTERIMAGE_INTERVAL = 80
+SPINNING_SQUARE_ROTATION_STEPS = 36  # Cached angles; the 10 degree spin lands on every one exactly
+SPINNING_SQUARE_AFTERIMAGE_LIFETIME = 500  # Milliseconds an afterimage stays visible
+SPINNING_SQUARE_ALPHA_STEP = 32  # Afterimage alpha is quantized to this step so sprites can be cached
 RESPAWN_IMMUNITY_DURATION = 3000
 SHIELD_BREAK_IMMUNITY_DURATION = 1500  # Invincibility frames after boss shield breaks to prevent instant death
 BASE_LUCKY_DROP_CHANCE = 5  # Base percentage chance for powerup drops (affected by upgrades and co-op mode)
 ALIEN_SHIMMER_INTENSITY = 0.50  # Shimmer brightness increase for aliens (0.0 to 1.0, where 0.30 = 30% brighter at peak)
 ALIEN_SHIMMER_BRIGHTEN = False  # If True, aliens brighten; if False, aliens dim (original color is brightest)
+ALIEN_SHIMMER_STEPS = 16  # Number of pre-rendered brightness steps per alien sprite
+ALIEN_SPRITE_PADDING = 5  # Alien shapes overhang their ENEMY_WIDTH x ENEMY_HEIGHT rect by up to this many pixels
+BARRIER_ROWS = 5  # Each barrier is a BARRIER_ROWS x BARRIER_COLS grid of blocks
+BARRIER_COLS = 8
+BARRIER_BLOCK_WIDTH = 11
+BARRIER_BLOCK_HEIGHT = 12
 
 # XP and Leveling System Configuration
 XP_BASE_REQUIREMENT = 500  # Starting XP needed for level 2
@@ -71,6 +97,7 @@ BOSS_HEALTH_BASE = 50  # Base boss health
 BOSS_HEALTH_PER_LEVEL = 10  # Additional health per boss level
 BOSS_SPEED_BASE = 2.0  # Base boss speed
 BOSS_SHOOT_FREQUENCY = 50  # Lower = more frequent shooting
+BOSS_HULL_TINT_STEPS = 16  # Health tints the UFO hull is pre-rendered in (white at full health, red at none)
 
 # Enemy In-Combat Speed Progression (as enemies are destroyed)
 ENEMY_GRID_TOTAL = 60  # Total enemies in a standard grid (5 rows × 12 columns)
@@ -177,6 +204,7 @@ SNAKE_BOSS_FINAL_PHASE_FIREBALL_MULTIPLIER = 2.0  # Fireball frequency multiplie
 SNAKE_BOSS_FIREBALL_RADIUS = 27  # Fireball size (same as Rubik's orange fireballs)
 SNAKE_BOSS_CURVE_CHANGE_INTERVAL_MIN = 1000  # Minimum time between direction changes (ms)
 SNAKE_BOSS_CURVE_CHANGE_INTERVAL_MAX = 3000  # Maximum time between direction changes (ms)
+SNAKE_BOSS_SPACING_OVERLAP = 0.9  # Segment spacing as a fraction of the two radii (0.9 = slight overlap, 1.0 = touching)
 SNAKE_BOSS_CURVE_STRENGTH = 2.0  # How sharply the snake curves during movement (higher = tighter curves, 0.5 = gentle, 1.0 = normal, 2.0 = sharp)
 
 # Rogue Terminal Boss Configuration (ASCII/text-art supercomputer)
@@ -198,6 +226,8 @@ ROGUE_TERMINAL_BOSS_SCAN_SHOT_COOLDOWN = 850
 ROGUE_TERMINAL_BOSS_MELTDOWN_SHOT_COOLDOWN = 650
 ROGUE_TERMINAL_BOSS_BULLET_SPEED = 7.5
 ROGUE_TERMINAL_BOSS_CUSTOM_ART_FILE = "rogue_terminal_art.json"  # Optional JSON file for custom forms
+ROGUE_TERMINAL_BOSS_GLITCH_CHARS = "#@$%!?&*01/\\|_-=+<>[]{}~^"  # Symbols swapped in while glitching
+ROGUE_TERMINAL_BOSS_GLITCH_COLORS = [RED, WHITE, CYAN, YELLOW, (0, 255, 80), ORANGE]
 
 # High scores files
 SINGLE_SCORES_FILE = "high_scores_single.json"
@@ -209,6 +239,8 @@ STAR_SIZE_MIN = 1  # Minimum star size
 STAR_SIZE_MAX = 3  # Maximum star size
 STAR_SHIMMER_INTENSITY = 0.70  # Shimmer brightness change for stars (0.0 to 1.0)
 STAR_SHIMMER_BRIGHTEN = False  # If True, stars brighten; if False, stars dim (original brightness is brightest)
+STAR_SHIMMER_PHASES = 32  # Shimmer steps per cycle (each step is a palette update, not a surface)
+STAR_SHIMMER_GROUPS = 16  # Stars are split into this many shimmer offsets, one palette entry each
 
 # Layer 1 (Back/Darkest/Slowest)
 STAR_LAYER1_BRIGHTNESS = 80  # Darkest (0-255)
@@ -234,6 +266,627 @@ AXIS_RIGHT = "axis_right"
 AXIS_UP = "axis_up"
 AXIS_DOWN = "axis_down"
 
+# Headless simulation settings
+HEADLESS_DEFAULT_TICKS = 3600  # One minute of gameplay at 60 ticks per second
+SIMULATION_TICK_MS = 1000 / 60  # Game time that passes per update tick (fixed timestep)
+GAME_CLOCK_START_MS = 10000  # Game clock start value so zero-initialised cooldown timers begin expired
+
+# Per-tick input bitmask (each player gets INPUT_BITS_PER_PLAYER bits, player 1 in the low bits)
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_FIRE = 4  # Fire held (fires through the auto-fire upgrade)
+INPUT_FIRE_PRESS = 8  # Fresh fire press (same as a KEYDOWN / JOYBUTTONDOWN event)
+INPUT_BITS_PER_PLAYER = 4
+
+# Fonts
+FONT_PATH = "assets/fonts/PressStart2P-Regular.ttf"
+FONT_PRELOAD_SIZES = (10, 11, 12, 14, 16, 18, 20, 24, 28, 32, 36, 48, ROGUE_TERMINAL_BOSS_SYMBOL_SIZE)
+TEXT_CACHE_SIZE = 512  # Rendered text surfaces kept by TextCache before the least recently used is dropped
+DEBUG_OVERLAY_KEY = pygame.K_F3  # Toggles the in-game debug overlay
+
+# Replay files (--record FILE / --replay FILE)
+REPLAY_MAGIC = b"SIRP"
+REPLAY_VERSION = 2  # Bump whenever gameplay RNG use changes, since older replays would desync
+REPLAY_MAX_SEED = 2 ** 32  # Random seeds are drawn below this when none is given
+
+# Collision broad-phase
+SPATIAL_HASH_CELL_SIZE = 96  # Grid cell size in pixels (about one alien plus spacing)
+
+# Particles
+PARTICLE_ALPHA_STEP = 16  # Alpha is quantized to this step so particle sprites can be cached
+EFFECT_RADIUS_STEP = 4  # Explosion circles above EFFECT_EXACT_RADIUS are rounded to this step so they can be cached
+EFFECT_EXACT_RADIUS = 16  # Smaller circles (debris, muzzle flashes) keep their exact radius
+EFFECT_SPRITE_MAX_RADIUS = 96  # Larger circles are blended as horizontal spans instead of cached
+EFFECT_SPAN_ROWS = 2  # Height of each span band of a large circle
+
+# Logging (--log category=level,... enables categories, --log-file FILE also appends to a file)
+LOG_DEBUG = 10
+LOG_INFO = 20
+LOG_WARNING = 30
+LOG_ERROR = 40
+LOG_OFF = 100
+LOG_LEVEL_NAMES = {LOG_DEBUG: "debug", LOG_INFO: "info", LOG_WARNING: "warning", LOG_ERROR: "error", LOG_OFF: "off"}
+LOG_DEFAULT_LEVEL = LOG_INFO  # Level for categories not listed below
+# Gameplay categories log per shot, kill or stat update, so they stay off unless enabled
+LOG_CATEGORY_LEVELS = {
+    "fire": LOG_OFF,
+    "achievements": LOG_OFF,
+    "powerups": LOG_OFF,
+    "levels": LOG_OFF,
+    "boss": LOG_OFF,
+}
+LOG_RING_SIZE = 512  # Most recent messages kept in memory
+
+# Frame profiler (enabled from the debug menu)
+PROFILER_FRAME_BUDGET_MS = 1000 / 60  # Work per frame that still holds 60 FPS
+PROFILER_WINDOW = 300  # Most recent samples per phase the overlay percentiles cover
+PROFILER_OVERLAY_REFRESH = 30  # Frames between overlay text refreshes
+PROFILER_CSV_FILE = "frame_profile_{}.csv"  # Filled with the game's start time
+
+
+class GameClock:
+    """Gameplay time source owned by Game.
+
+    Time only moves when Game.update() calls advance(), by a fixed SIMULATION_TICK_MS
+    per tick (times the time scale), so timers, particle lifetimes and movement stay in
+    step whatever the real frame rate is. Supports pause, time scaling and manual stepping.
+    """
+    active = None  # Clock that get_game_ticks() reads; None falls back to pygame's clock
+
+    def __init__(self, tick_ms=SIMULATION_TICK_MS, start_ms=GAME_CLOCK_START_MS):
+        self.tick_ms = tick_ms
+        self.time_ms = float(start_ms)
+        self.time_scale = 1.0
+        self.paused = False
+        self.delta_ms = 0  # Whole milliseconds that passed on the last advance
+        self.tick_count = 0
+
+    def install(self):
+        """Make this the clock every entity reads through get_game_ticks()"""
+        GameClock.active = self
+
+    def uninstall(self):
+        if GameClock.active is self:
+            GameClock.active = None
+
+    def get_ticks(self):
+        """Current game time in milliseconds (same units as pygame.time.get_ticks)"""
+        return int(self.time_ms)
+
+    def advance(self):
+        """Advance one update tick unless paused. Returns the elapsed milliseconds."""
+        if self.paused:
+            self.delta_ms = 0
+            return 0
+        return self._advance_tick()
+
+    def step(self, ticks=1):
+        """Manually advance the clock by a number of ticks, even while paused"""
+        for _ in range(ticks):
+            self._advance_tick()
+        return self.delta_ms
+
+    def _advance_tick(self):
+        previous = int(self.time_ms)
+        self.time_ms += self.tick_ms * self.time_scale
+        self.delta_ms = int(self.time_ms) - previous
+        self.tick_count += 1
+        return self.delta_ms
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def set_time_scale(self, scale):
+        """Scale how much game time passes per tick (0.5 = half speed timers, 2.0 = double)"""
+        self.time_scale = max(0.0, scale)
+
+
+def get_game_ticks():
+    """Current gameplay time in ms from the active GameClock (pygame's clock outside a game)"""
+    clock = GameClock.active
+    if clock:
+        return clock.get_ticks()
+    return pygame.time.get_ticks()
+
+
+def get_game_delta_ms():
+    """Milliseconds of gameplay time that passed on the current tick"""
+    clock = GameClock.active
+    if clock:
+        return clock.delta_ms
+    return 16  # Assume 60 FPS outside a game
+
+
+class GameRandom(random.Random):
+    """Seeded random stream owned by Game.
+
+    Everything that changes gameplay state (enemy fire, spawns, boss patterns, explosions
+    created during update) draws from the active GameRandom, so a seed plus the recorded
+    input reproduces a run exactly. Draw-only effects and menus keep using the global
+    random module so rendering never shifts the gameplay stream.
+    """
+    active = None  # Stream that get_game_random() returns; None falls back to the random module
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.randrange(REPLAY_MAX_SEED)
+        self.initial_seed = seed
+        super().__init__(seed)
+
+    def install(self):
+        """Make this the stream every entity reads through get_game_random()"""
+        GameRandom.active = self
+
+    def uninstall(self):
+        if GameRandom.active is self:
+            GameRandom.active = None
+
+
+def get_game_random():
+    """Gameplay random stream from the active GameRandom (the random module outside a game)"""
+    rng = GameRandom.active
+    if rng:
+        return rng
+    return random
+
+
+class FontCache:
+    """Process-wide cache of loaded fonts keyed by (path, size).
+
+    Opening a TTF file means disk I/O plus FreeType setup, so every screen and entity
+    asks get_font() instead of constructing pygame.font.Font itself. misses counts
+    fonts that had to be loaded after the startup preload.
+    """
+    def __init__(self):
+        self.fonts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, size, path=FONT_PATH):
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            self.misses += 1
+            font = pygame.font.Font(path, size)
+            self.fonts[key] = font
+        else:
+            self.hits += 1
+        return font
+
+    def preload(self, sizes=FONT_PRELOAD_SIZES, path=FONT_PATH):
+        """Load the sizes the game uses up front (not counted as misses)"""
+        for size in sizes:
+            key = (path, size)
+            if key not in self.fonts:
+                self.fonts[key] = pygame.font.Font(path, size)
+
+
+FONT_CACHE = FontCache()
+
+
+def get_font(size, path=FONT_PATH):
+    """Shared font for this path and size from the process-wide FontCache"""
+    return FONT_CACHE.get(size, path)
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text keyed by (font, text, antialias, color, background).
+
+    Menus, the level up screen and the HUD draw the same strings every frame; a cache hit
+    turns a FreeType rasterization into a blit. Returned surfaces are shared between
+    callers, so they must not be modified (set_alpha, fill, ...); copy them first.
+    """
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, antialias, tuple(color), tuple(background) if background else None)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            surface = font.render(text, antialias, color, background)
+            self.surfaces[key] = surface
+            if len(self.surfaces) > self.max_size:
+                self.surfaces.popitem(last=False)
+        else:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+TEXT_CACHE = TextCache()
+
+
+def render_text(font, text, antialias, color, background=None):
+    """font.render() through the process-wide TextCache (shared surface, do not modify)"""
+    return TEXT_CACHE.render(font, text, antialias, color, background)
+
+
+class Logger:
+    """Leveled, per-category logging for the game.
+
+    Each category has a minimum level (LOG_CATEGORY_LEVELS, changed with configure()).
+    A message below it costs one dict lookup and is never formatted, so hot paths pass
+    printf-style arguments instead of building f-strings. Enabled messages go into an
+    in-memory ring buffer (recent()) and onto a queue for a writer thread that prints
+    them and appends them to the log file, keeping console I/O off the game loop.
+    """
+    def __init__(self):
+        self.levels = dict(LOG_CATEGORY_LEVELS)
+        self.entries = collections.deque(maxlen=LOG_RING_SIZE)  # Appends are atomic, no lock needed
+        self.queue = queue.Queue()
+        self.console = True
+        self.file = None
+        self.thread = None
+
+    def configure(self, spec):
+        """Apply a "category=level,..." spec; the category "all" sets every known category"""
+        for item in spec.split(","):
+            category, _, level_name = item.strip().partition("=")
+            level = next((level for level, name in LOG_LEVEL_NAMES.items() if name == level_name.lower()), None)
+            if level is None:
+                self.warning("log", "Unknown log level %r for category %r", level_name, category)
+                continue
+            if category == "all":
+                for known in list(self.levels):
+                    self.levels[known] = level
+            else:
+                self.levels[category] = level
+
+    def open_file(self, filename):
+        try:
+            self.file = open(filename, 'a')
+        except OSError as e:
+            self.error("log", "Could not open log file %s: %s", filename, e)
+
+    def enabled(self, category, level=LOG_DEBUG):
+        return level >= self.levels.get(category, LOG_DEFAULT_LEVEL)
+
+    def log(self, category, level, message, *args):
+        if level < self.levels.get(category, LOG_DEFAULT_LEVEL):
+            return
+        if args:
+            message = message % args
+        entry = (pygame.time.get_ticks(), level, category, message)
+        self.entries.append(entry)
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="Logger", daemon=True)
+            self.thread.start()
+        self.queue.put(entry)
+
+    def debug(self, category, message, *args):
+        self.log(category, LOG_DEBUG, message, *args)
+
+    def info(self, category, message, *args):
+        self.log(category, LOG_INFO, message, *args)
+
+    def warning(self, category, message, *args):
+        self.log(category, LOG_WARNING, message, *args)
+
+    def error(self, category, message, *args):
+        self.log(category, LOG_ERROR, message, *args)
+
+    def recent(self, count=None):
+        """Newest-last list of the last count ring buffer entries (all of them by default)"""
+        entries = list(self.entries)
+        return entries[-count:] if count else entries
+
+    def flush(self):
+        """Wait until the writer thread has output every queued message"""
+        if self.thread is not None:
+            self.queue.join()
+
+    def _run(self):
+        while True:
+            ticks, level, category, message = self.queue.get()
+            line = f"[{ticks / 1000:9.3f}] {LOG_LEVEL_NAMES[level].upper():<7} {category}: {message}"
+            try:
+                if self.console:
+                    print(line)
+                if self.file:
+                    self.file.write(line + "\n")
+                    if self.queue.empty():
+                        self.file.flush()
+            except Exception:
+                pass
+            self.queue.task_done()
+
+
+LOG = Logger()
+atexit.register(LOG.flush)
+
+
+class PersistenceWriter:
+    """Background writer for the JSON save files.
+
+    save_json() encodes on the caller's thread, so later changes to the saved objects
+    can't leak into the file, and queues the text for a worker thread. The worker writes a
+    temp file, fsyncs it and renames it over the target, so a crash or power cut leaves
+    either the old or the new file. A save of a file that is still queued replaces the
+    queued one. flush() blocks until the queue is on disk; it runs at exit and before a
+    save file is read back.
+    """
+    def __init__(self):
+        self.pending = {}  # filename -> text, or None to delete the file
+        self.busy = False
+        self.condition = threading.Condition()
+        self.thread = None
+        self.writes = 0
+        self.coalesced = 0
+
+    def save_json(self, filename, data, indent):
+        """Queue data as JSON; callers pass the indent each file has always been written with"""
+        self._queue(filename, json.dumps(data, indent=indent))
+
+    def save_text(self, filename, text):
+        self._queue(filename, text)
+
+    def remove(self, filename):
+        """Delete filename after any queued save of it (missing files are ignored)"""
+        self._queue(filename, None)
+
+    def _queue(self, filename, text):
+        with self.condition:
+            if filename in self.pending:
+                self.coalesced += 1
+            self.pending[filename] = text
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="PersistenceWriter", daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+
+    def flush(self):
+        """Wait until every queued save and delete has finished"""
+        with self.condition:
+            while self.pending or self.busy:
+                self.condition.wait()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                filename = next(iter(self.pending))
+                text = self.pending.pop(filename)
+                self.busy = True
+            try:
+                if text is None:
+                    if os.path.exists(filename):
+                        os.remove(filename)
+                else:
+                    self._write(filename, text)
+            except Exception as e:
+                LOG.error("persistence", "Error saving %s: %s", filename, e)
+            with self.condition:
+                self.busy = False
+                self.writes += 1
+                self.condition.notify_all()
+
+    def _write(self, filename, text):
+        temp_filename = filename + ".tmp"
+        with open(temp_filename, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_filename, filename)
+        # Sync the directory too so the rename itself survives a power cut
+        if hasattr(os, "O_DIRECTORY"):
+            directory = os.open(os.path.dirname(os.path.abspath(filename)), os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+
+
+PERSISTENCE = PersistenceWriter()
+atexit.register(PERSISTENCE.flush)
+
+
+class FrameProfiler:
+    """Opt-in per-phase frame timings for one Game.
+
+    The game loop brackets each frame with begin_frame()/end_frame() and each phase with
+    start(name)/stop(name); a phase timed several times in one frame is summed. "frame"
+    is the work from handle_events through draw, not the wait in clock.tick(). Samples
+    (ms) are kept per segment, a level or boss encounter, so the overlay can show
+    percentiles of the last PROFILER_WINDOW frames and set_segment() can append a
+    summary of the finished segment to the CSV file. Every method returns immediately
+    while disabled.
+    """
+    CSV_HEADER = "segment,phase,frames,mean_ms,p50_ms,p95_ms,p99_ms,max_ms,over_budget"
+
+    def __init__(self):
+        self.enabled = False
+        self.segment = None
+        self.samples = {}  # Phase -> array('d') of ms, in first-timed order
+        self.started = {}
+        self.frame_totals = {}
+        self.frame_start = 0.0
+        self.frames = 0
+        self.csv_filename = PROFILER_CSV_FILE.format(time.strftime("%Y%m%d_%H%M%S"))
+        self.csv_lines = [self.CSV_HEADER]
+        self.overlay_lines = []
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_totals.clear()
+            self.frame_start = time.perf_counter()
+
+    def start(self, phase):
+        if self.enabled:
+            self.started[phase] = time.perf_counter()
+
+    def stop(self, phase):
+        if self.enabled:
+            started = self.started.pop(phase, None)
+            if started is not None:
+                self.frame_totals[phase] = self.frame_totals.get(phase, 0.0) + time.perf_counter() - started
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.frame_totals["frame"] = time.perf_counter() - self.frame_start
+        for phase, seconds in self.frame_totals.items():
+            samples = self.samples.get(phase)
+            if samples is None:
+                samples = self.samples[phase] = array.array('d')
+            samples.append(seconds * 1000)
+        self.frames += 1
+        if self.frames % PROFILER_OVERLAY_REFRESH == 0:
+            self.overlay_lines = self.get_overlay_lines()
+
+    @staticmethod
+    def percentile(sorted_samples, fraction):
+        """Nearest-rank percentile of an already sorted sequence"""
+        index = max(0, math.ceil(fraction * len(sorted_samples)) - 1)
+        return sorted_samples[index]
+
+    def get_overlay_lines(self):
+        lines = [f"{self.segment or ''}  p50/p95/p99/max ms"]
+        # Slowest phases first, with the frame total on top
+        windows = [(phase, sorted(samples[-PROFILER_WINDOW:])) for phase, samples in self.samples.items()]
+        windows.sort(key=lambda window: window[1][-1], reverse=True)
+        for phase, window in windows:
+            lines.append(f"{phase:<14}{self.percentile(window, 0.5):6.2f}{self.percentile(window, 0.95):6.2f}"
+                         f"{self.percentile(window, 0.99):6.2f}{window[-1]:7.2f}")
+        return lines
+
+    def set_segment(self, segment):
+        """Close the current segment (writing its CSV rows) and start timing a new one"""
+        if not self.enabled:
+            return
+        self.finish()
+        self.segment = segment
+
+    def finish(self):
+        """Append the current segment's summary to the CSV file and drop its samples"""
+        if not self.enabled or not self.samples:
+            return
+        for phase, samples in self.samples.items():
+            ordered = sorted(samples)
+            over_budget = sum(1 for sample in samples if sample > PROFILER_FRAME_BUDGET_MS)
+            self.csv_lines.append(
+                f"{self.segment},{phase},{len(samples)},{sum(samples) / len(samples):.3f},"
+                f"{self.percentile(ordered, 0.5):.3f},{self.percentile(ordered, 0.95):.3f},"
+                f"{self.percentile(ordered, 0.99):.3f},{ordered[-1]:.3f},{over_budget}")
+        PERSISTENCE.save_text(self.csv_filename, "\n".join(self.csv_lines) + "\n")
+        self.samples = {}
+        self.overlay_lines = []
+
+    def draw(self, screen, font):
+        """Draw the last computed percentiles in the top right corner"""
+        x = SCREEN_WIDTH - 10
+        y = 10
+        for line in self.overlay_lines:
+            text = render_text(font, line, True, CYAN)
+            background = pygame.Rect(x - text.get_width() - 2, y - 2, text.get_width() + 4, text.get_height() + 4)
+            pygame.draw.rect(screen, BLACK, background)
+            screen.blit(text, (x - text.get_width(), y))
+            y += text.get_height() + 6
+
+
+class ReplayRecorder:
+    """Records one run as a seed plus a per-tick input bitmask.
+
+    File layout (little endian): REPLAY_MAGIC, version byte, u16 header length and a JSON
+    header (seed, mode, debug config), u32 tick count followed by one input byte per
+    tick, then u16 event count and per event u32 tick, u16 length and a JSON payload.
+    Events hold the player upgrade state after each level up, since those choices are
+    made on the level up screen rather than through per-tick input.
+    """
+    def __init__(self, seed, mode="single", debug_config=None):
+        self.header = {"seed": seed, "mode": mode, "debug_config": debug_config}
+        self.inputs = bytearray()
+        self.events = []
+
+    def record_tick(self, bits):
+        self.inputs.append(bits & 0xFF)
+
+    def record_level_up(self, players):
+        state = []
+        for player in players:
+            state.append({
+                "upgrades": dict(vars(player.upgrades)),
+                "lives": player.lives,
+            })
+        self.events.append((len(self.inputs), state))
+
+    def save(self, filename):
+        header = json.dumps(self.header).encode("utf-8")
+        data = bytearray(REPLAY_MAGIC)
+        data += struct.pack("<BH", REPLAY_VERSION, len(header)) + header
+        data += struct.pack("<I", len(self.inputs)) + self.inputs
+        data += struct.pack("<H", len(self.events))
+        for tick, state in self.events:
+            payload = json.dumps(state).encode("utf-8")
+            data += struct.pack("<IH", tick, len(payload)) + payload
+        try:
+            with open(filename, "wb") as f:
+                f.write(data)
+            LOG.info("replay", "Replay saved to %s (%d ticks, %d bytes)", filename, len(self.inputs), len(data))
+        except OSError as e:
+            LOG.error("replay", "Error saving replay: %s", e)
+
+
+class ReplayScript:
+    """Input script that plays back a file written by ReplayRecorder"""
+    def __init__(self, filename):
+        with open(filename, "rb") as f:
+            data = f.read()
+        if data[:len(REPLAY_MAGIC)] != REPLAY_MAGIC:
+            raise ValueError(f"{filename} is not a replay file")
+
+        offset = len(REPLAY_MAGIC)
+        version, header_length = struct.unpack_from("<BH", data, offset)
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+        offset += 3
+        self.header = json.loads(data[offset:offset + header_length].decode("utf-8"))
+        offset += header_length
+
+        (tick_count,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        self.inputs = bytes(data[offset:offset + tick_count])
+        offset += tick_count
+
+        (event_count,) = struct.unpack_from("<H", data, offset)
+        offset += 2
+        self.level_ups = {}
+        for _ in range(event_count):
+            tick, length = struct.unpack_from("<IH", data, offset)
+            offset += 6
+            state = json.loads(data[offset:offset + length].decode("utf-8"))
+            offset += length
+            self.level_ups.setdefault(tick, []).append(state)
+
+        self.seed = self.header["seed"]
+        self.mode = self.header.get("mode", "single")
+        self.debug_config = self.header.get("debug_config")
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def get_input(self, tick):
+        if tick < len(self.inputs):
+            return self.inputs[tick]
+        return 0
+
+    def get_level_up(self, tick):
+        """Next recorded level up state for this tick, or None to fall back to auto_level_up"""
+        pending = self.level_ups.get(tick)
+        if pending:
+            return pending.pop(0)
+        return None
+
 
 class ProfileManager:
     """Manages control profiles with save/load functionality"""
@@ -268,6 +921,7 @@ class ProfileManager:
 
     def load_profiles(self):
         """Load profiles from file"""
+        PERSISTENCE.flush()
         try:
             if os.path.exists(self.filename):
                 with open(self.filename, 'r') as f:
@@ -278,7 +932,7 @@ class ProfileManager:
                     for profile_name, bindings in saved_profiles.items():
                         self.profiles[profile_name] = bindings
         except Exception as e:
-            print(f"Error loading profiles: {e}")
+            LOG.error("persistence", "Error loading profiles: %s", e)
             self.profiles = {}
             self.last_profile = None
 
@@ -289,10 +943,9 @@ class ProfileManager:
                 'last_profile': self.last_profile,
                 'profiles': self.profiles
             }
-            with open(self.filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            PERSISTENCE.save_json(self.filename, data, indent=2)
         except Exception as e:
-            print(f"Error saving profiles: {e}")
+            LOG.error("persistence", "Error saving profiles: %s", e)
 
     def save_profile(self, name, bindings):
         """Save a new profile"""
@@ -349,6 +1002,7 @@ class UserManager:
 
     def load_users(self):
         """Load users from file"""
+        PERSISTENCE.flush()
         if os.path.exists(self.filename):
             try:
                 with open(self.filename, 'r') as f:
@@ -358,7 +1012,7 @@ class UserManager:
                     self.player1_user_id = data.get("player1_user_id")
                     self.player2_user_id = data.get("player2_user_id")
             except Exception as e:
-                print(f"Error loading users: {e}")
+                LOG.error("persistence", "Error loading users: %s", e)
                 self.users = []
                 self.last_user_id = None
                 self.player1_user_id = None
@@ -380,10 +1034,9 @@ class UserManager:
             "player2_user_id": self.player2_user_id
         }
         try:
-            with open(self.filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            PERSISTENCE.save_json(self.filename, data, indent=2)
         except Exception as e:
-            print(f"Error saving users: {e}")
+            LOG.error("persistence", "Error saving users: %s", e)
 
     def get_users(self):
         return list(self.users)
@@ -421,12 +1074,7 @@ class UserManager:
 
     def delete_user(self, user_id):
         self.users = [user for user in self.users if user["id"] != user_id]
-        achievement_file = self.get_achievement_filename(user_id)
-        if os.path.exists(achievement_file):
-            try:
-                os.remove(achievement_file)
-            except Exception as e:
-                print(f"Error deleting achievements for user {user_id}: {e}")
+        PERSISTENCE.remove(self.get_achievement_filename(user_id))
         if self.last_user_id == user_id:
             self.last_user_id = self.users[0]["id"] if self.users else None
         # Clear player slot assignments if this user was assigned
@@ -483,7 +1131,17 @@ class StarField:
     Three-layer starfield with parallax scrolling effect.
     Each layer has different brightness to create depth without size variation.
     Parallax scrolling is activated during specific boss levels (e.g., Asteroid Field).
+
+    Each layer is pre-rendered once into an 8-bit palettized surface shared by every
+    StarField. A star's pixels hold the palette index of its shimmer group, so shimmer is
+    a palette update per phase. Only the stars' rects are blitted, at the scrolled
+    position and again one screen over, so the layer wraps around like a tile.
     """
+    # Shared by every StarField: one 8-bit surface per layer and the rects of its stars
+    layer_surfaces = None
+    layer_star_rects = None
+    palette_phase = None  # Shimmer phase the layer palettes were last set for
+
     def __init__(self, direction='vertical'):
         """
         Initialize starfield with a scrolling direction.
@@ -493,80 +1151,123 @@ class StarField:
         """
         self.direction = direction
 
-        # Layer configuration: (brightness, speed, star_count)
+        # Layer configuration: (brightness, speed, star_count) plus this starfield's scroll offset
         self.layers = [
             {
                 'brightness': STAR_LAYER1_BRIGHTNESS,
                 'speed': STAR_LAYER1_SPEED,
                 'count': STAR_COUNT_PER_LAYER,
-                'stars': []
+                'offset': 0.0
             },
             {
                 'brightness': STAR_LAYER2_BRIGHTNESS,
                 'speed': STAR_LAYER2_SPEED,
                 'count': STAR_COUNT_PER_LAYER,
-                'stars': []
+                'offset': 0.0
             },
             {
                 'brightness': STAR_LAYER3_BRIGHTNESS,
                 'speed': STAR_LAYER3_SPEED,
                 'count': STAR_COUNT_PER_LAYER,
-                'stars': []
+                'offset': 0.0
             }
         ]
 
-        # Generate stars for each layer
+    def render_layers(self):
+        """Generate the stars and draw each layer once into its palettized surface"""
+        layer_surfaces = []
+        layer_star_rects = []
         for layer in self.layers:
+            surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 8)
+            surface.fill(0)  # Palette index 0 stays black and is the colorkey
+            star_rects = []
             for _ in range(layer['count']):
-                star = {
-                    'x': random.randint(0, SCREEN_WIDTH),
-                    'y': random.randint(0, SCREEN_HEIGHT),
-                    'size': random.randint(STAR_SIZE_MIN, STAR_SIZE_MAX),
-                    'shimmer_offset': random.uniform(0, math.pi * 2)
-                }
-                layer['stars'].append(star)
+                star_x = random.randint(0, SCREEN_WIDTH)
+                star_y = random.randint(0, SCREEN_HEIGHT)
+                size = random.randint(STAR_SIZE_MIN, STAR_SIZE_MAX)
+                color_index = 1 + random.randrange(STAR_SHIMMER_GROUPS)
+                # Repeat stars that straddle an edge on the far side so the layer tiles seamlessly
+                x_positions = [star_x]
+                if star_x < size:
+                    x_positions.append(star_x + SCREEN_WIDTH)
+                elif star_x > SCREEN_WIDTH - size:
+                    x_positions.append(star_x - SCREEN_WIDTH)
+                y_positions = [star_y]
+                if star_y < size:
+                    y_positions.append(star_y + SCREEN_HEIGHT)
+                elif star_y > SCREEN_HEIGHT - size:
+                    y_positions.append(star_y - SCREEN_HEIGHT)
+                for x in x_positions:
+                    for y in y_positions:
+                        star_rect = pygame.draw.circle(surface, color_index, (x, y), size)
+                        if star_rect.width and star_rect.height:
+                            star_rects.append(star_rect)
+            surface.set_colorkey(0)
+            layer_surfaces.append(surface)
+            layer_star_rects.append(star_rects)
+        StarField.layer_surfaces = layer_surfaces
+        StarField.layer_star_rects = layer_star_rects
+        StarField.palette_phase = None
+
+    @staticmethod
+    def get_palette(brightness, phase):
+        """Palette for one layer at a shimmer phase: black, then one gray per shimmer group"""
+        palette = [BLACK]
+        for group in range(STAR_SHIMMER_GROUPS):
+            time_factor = (phase / STAR_SHIMMER_PHASES + group / STAR_SHIMMER_GROUPS) * math.pi * 2
+            sine_wave = (math.sin(time_factor) + 1) / 2
+            if STAR_SHIMMER_BRIGHTEN:
+                shimmer = 1.0 + (sine_wave * STAR_SHIMMER_INTENSITY)
+            else:
+                shimmer = 1.0 - (sine_wave * STAR_SHIMMER_INTENSITY)
+            level = max(1, min(255, int(brightness * shimmer)))
+            palette.append((level, level, level))
+        return palette
 
     def update(self, parallax_active=False):
         """
-        Update star positions. If parallax_active is True, stars move based on direction
-        at different speeds based on their layer (creating parallax effect).
+        Update layer scroll offsets. If parallax_active is True, layers move based on direction
+        at different speeds (creating parallax effect).
         """
         if parallax_active:
             for layer in self.layers:
-                for star in layer['stars']:
-                    if self.direction == 'horizontal':
-                        # Move star left (right to left) based on layer speed
-                        star['x'] -= layer['speed']
-
-                        # Wrap around when star goes off left side of screen
-                        if star['x'] < 0:
-                            star['x'] = SCREEN_WIDTH
-                            star['y'] = random.randint(0, SCREEN_HEIGHT)
-                    else:
-                        # Move star downward based on layer speed
-                        star['y'] += layer['speed']
-
-                        # Wrap around when star goes off bottom of screen
-                        if star['y'] > SCREEN_HEIGHT:
-                            star['y'] = 0
-                            star['x'] = random.randint(0, SCREEN_WIDTH)
+                if self.direction == 'horizontal':
+                    # Move layer left (right to left), wrapping after a full screen width
+                    layer['offset'] = (layer['offset'] - layer['speed']) % SCREEN_WIDTH
+                else:
+                    # Move layer downward, wrapping after a full screen height
+                    layer['offset'] = (layer['offset'] + layer['speed']) % SCREEN_HEIGHT
 
     def draw(self, screen):
         """Draw all three layers of stars with their respective brightness levels."""
-        for layer in self.layers:
-            # Draw each star in the layer
-            for star in layer['stars']:
-                time_factor = pygame.time.get_ticks() * 0.002 + star['shimmer_offset']
-                sine_wave = (math.sin(time_factor) + 1) / 2
-                if STAR_SHIMMER_BRIGHTEN:
-                    shimmer = 1.0 + (sine_wave * STAR_SHIMMER_INTENSITY)
+        if StarField.layer_surfaces is None:
+            self.render_layers()
+
+        time_factor = get_game_ticks() * 0.002
+        phase = int(time_factor / (math.pi * 2) * STAR_SHIMMER_PHASES) % STAR_SHIMMER_PHASES
+        if phase != StarField.palette_phase:
+            for layer, surface in zip(self.layers, StarField.layer_surfaces):
+                surface.set_palette(self.get_palette(layer['brightness'], phase))
+            StarField.palette_phase = phase
+
+        blits = []
+        horizontal = self.direction == 'horizontal'
+        for layer, surface, star_rects in zip(self.layers, StarField.layer_surfaces, StarField.layer_star_rects):
+            offset = int(layer['offset'])
+            for star_rect in star_rects:
+                if horizontal:
+                    x = star_rect.x + offset
+                    if x < SCREEN_WIDTH:
+                        blits.append((surface, (x, star_rect.y), star_rect))
+                    if x + star_rect.width > SCREEN_WIDTH:
+                        blits.append((surface, (x - SCREEN_WIDTH, star_rect.y), star_rect))
                 else:
-                    shimmer = 1.0 - (sine_wave * STAR_SHIMMER_INTENSITY)
-                brightness = max(0, min(255, int(layer['brightness'] * shimmer)))
-                color = (brightness, brightness, brightness)
-                pygame.draw.circle(screen, color,
-                                 (int(star['x']), int(star['y'])),
-                                 star['size'])
+                    y = star_rect.y + offset
+                    if y < SCREEN_HEIGHT:
+                        blits.append((surface, (star_rect.x, y), star_rect))
+                    if y + star_rect.height > SCREEN_HEIGHT:
+                        blits.append((surface, (star_rect.x, y - SCREEN_HEIGHT), star_rect))
+        screen.blits(blits, doreturn=False)
 
 
 class SoundManager:
@@ -610,9 +1311,9 @@ class SoundManager:
                 sound = pygame.mixer.Sound(file_path)
                 sound.set_volume(self.sound_volume)
                 self.sounds[sound_name] = sound
-                print(f"Loaded sound: {sound_name}")
+                LOG.debug("audio", "Loaded sound: %s", sound_name)
             except pygame.error as e:
-                print(f"Could not load sound {file_path}: {e}")
+                LOG.warning("audio", "Could not load sound %s: %s", file_path, e)
                 # Create a silent sound as fallback
                 self.sounds[sound_name] = None
     
@@ -853,12 +1554,12 @@ class PlayerStats:
     def start_invincibility(self):
         """Start tracking invincibility time"""
         if self.invincibility_start_time is None:
-            self.invincibility_start_time = pygame.time.get_ticks()
+            self.invincibility_start_time = get_game_ticks()
 
     def end_invincibility(self):
         """End tracking invincibility time"""
         if self.invincibility_start_time is not None:
-            duration = pygame.time.get_ticks() - self.invincibility_start_time
+            duration = get_game_ticks() - self.invincibility_start_time
             self.invincibility_time += duration
             self.invincibility_start_time = None
 
@@ -898,7 +1599,7 @@ class PlayerStats:
         total_time = self.invincibility_time
         # Add current invincibility session if active
         if self.invincibility_start_time is not None:
-            total_time += pygame.time.get_ticks() - self.invincibility_start_time
+            total_time += get_game_ticks() - self.invincibility_start_time
         return total_time / 1000.0
 
 
@@ -1190,6 +1891,14 @@ class AchievementManager:
             )
             self.achievements[achievement.id] = achievement
 
+        # Index achievements by track_key (definition order) so tracking only visits the relevant ones
+        self.achievements_by_key = {}
+        for achievement in self.achievements.values():
+            if achievement.track_key:
+                self.achievements_by_key.setdefault(achievement.track_key, []).append(achievement)
+        self.completed_keys = set()  # Keys whose achievements are all unlocked
+        self.checked_stats = {}  # (key, type) -> global stat value last checked against
+
         # Initialize global stats
         self.global_stats = {
             "total_kills": 0,
@@ -1229,7 +1938,7 @@ class AchievementManager:
 
     def reset_run_stats(self):
         """Reset stats that are tracked per-run"""
-        print(f"[DEBUG] reset_run_stats() called - clearing repeated_this_run")
+        LOG.debug("achievements", "reset_run_stats() called - clearing repeated_this_run")
         self.repeated_this_run.clear()  # Clear repeat achievement tracking for new run
         self.run_stats = {
             "run_bosses": 0,
@@ -1297,16 +2006,29 @@ class AchievementManager:
         self.run_stats["pinpoint_pending_shots"] = 0
         self.run_stats["pinpoint_tracking"] = not is_boss_level
 
+    def _check_global_stat(self, key, achievement_type):
+        """Check the locked achievements of one type on key against global_stats[key]"""
+        value = self.global_stats[key]
+        # Nothing can change if every achievement on the key is unlocked or the stat hasn't moved
+        if key in self.completed_keys or self.checked_stats.get((key, achievement_type)) == value:
+            return
+        self.checked_stats[key, achievement_type] = value
+
+        achievements = self.achievements_by_key.get(key, ())
+        for achievement in achievements:
+            if achievement.achievement_type == achievement_type:
+                # Cumulative and milestone achievements don't repeat - they're permanent unlocks
+                if not achievement.unlocked and achievement.update_progress(value):
+                    self.newly_unlocked.append(achievement)
+        if all(achievement.unlocked for achievement in achievements):
+            self.completed_keys.add(key)
+
     def track_cumulative(self, key, value):
         """Track cumulative stats (persist across all games)"""
         if key in self.global_stats:
             self.global_stats[key] += value
             # Check relevant achievements
-            for achievement in self.achievements.values():
-                if achievement.track_key == key and achievement.achievement_type == ACHIEVEMENT_TYPE_CUMULATIVE:
-                    # Cumulative achievements don't repeat - they're permanent progress across all playthroughs
-                    if not achievement.unlocked and achievement.update_progress(self.global_stats[key]):
-                        self.newly_unlocked.append(achievement)
+            self._check_global_stat(key, ACHIEVEMENT_TYPE_CUMULATIVE)
 
     def track_milestone(self, key, value):
         """Track milestone achievements (one-time unlocks)"""
@@ -1316,15 +2038,11 @@ class AchievementManager:
             self.global_stats[key] = value
 
         # Check relevant achievements
-        for achievement in self.achievements.values():
-            if achievement.track_key == key and achievement.achievement_type == ACHIEVEMENT_TYPE_MILESTONE:
-                # Milestone achievements don't repeat - they're one-time permanent unlocks
-                if not achievement.unlocked and achievement.update_progress(self.global_stats[key]):
-                    self.newly_unlocked.append(achievement)
+        self._check_global_stat(key, ACHIEVEMENT_TYPE_MILESTONE)
 
     def track_run_stat(self, key, value):
         """Track stats for current run only"""
-        print(f"[DEBUG] track_run_stat() called with key='{key}', value={value}")
+        LOG.debug("achievements", "track_run_stat() called with key=%r, value=%r", key, value)
         if key == "run_unique_bosses" or key == "bosses_no_death":
             # These use sets for unique boss tracking
             if isinstance(value, str):
@@ -1333,64 +2051,60 @@ class AchievementManager:
             self.run_stats[key] = value
 
         # Check relevant achievements
-        print(f"[DEBUG] Checking {len(self.achievements)} achievements for track_key='{key}'")
+        achievements = self.achievements_by_key.get(key, ())
+        LOG.debug("achievements", "Checking %d achievements for track_key=%r", len(achievements), key)
         matching_count = 0
-        for achievement in self.achievements.values():
-            if achievement.track_key == key:
-                matching_count += 1
-                print(f"[DEBUG] Found matching achievement #{matching_count}: '{achievement.name}' (type={achievement.achievement_type})")
-                if achievement.achievement_type == ACHIEVEMENT_TYPE_SINGLE_RUN:
-                    if key in ["run_unique_bosses", "bosses_no_death"]:
-                        progress_value = len(self.run_stats[key])
+        for achievement in achievements:
+            matching_count += 1
+            LOG.debug("achievements", "Found matching achievement #%d: %r (type=%s)", matching_count, achievement.name, achievement.achievement_type)
+            if achievement.achievement_type == ACHIEVEMENT_TYPE_SINGLE_RUN:
+                if key in ["run_unique_bosses", "bosses_no_death"]:
+                    progress_value = len(self.run_stats[key])
+                else:
+                    progress_value = self.run_stats[key]
+                # Check if achievement criteria are met
+                if progress_value >= achievement.target_value:
+                    LOG.debug("achievements", "SINGLE_RUN achievement %r (key=%s) criteria met: progress %s/%s, "
+                              "unlocked=%s, repeated_this_run=%s", achievement.name, key, progress_value,
+                              achievement.target_value, achievement.unlocked, self.repeated_this_run)
+                    if achievement.unlocked and achievement.id not in self.repeated_this_run:
+                        # Already unlocked - award repeat XP bonus (once per run)
+                        LOG.debug("achievements", "  -> Adding to repeated_achievements (repeat bonus!)")
+                        self.repeated_achievements.append(achievement)
+                        self.repeated_this_run.add(achievement.id)
+                    elif not achievement.unlocked and achievement.update_progress(progress_value):
+                        # First time unlock
+                        LOG.debug("achievements", "  -> Adding to newly_unlocked (first time!)")
+                        self.newly_unlocked.append(achievement)
+                        # Prevent repeat bonus in the same run for a freshly unlocked achievement
+                        self.repeated_this_run.add(achievement.id)
                     else:
-                        progress_value = self.run_stats[key]
-                    # Check if achievement criteria are met
-                    if progress_value >= achievement.target_value:
-                        print(f"[DEBUG] SINGLE_RUN Achievement '{achievement.name}' (key={key}) criteria met:")
-                        print(f"  - progress_value: {progress_value}, target: {achievement.target_value}")
-                        print(f"  - achievement.unlocked: {achievement.unlocked}")
-                        print(f"  - achievement.id in repeated_this_run: {achievement.id in self.repeated_this_run}")
-                        print(f"  - repeated_this_run contents: {self.repeated_this_run}")
-                        if achievement.unlocked and achievement.id not in self.repeated_this_run:
-                            # Already unlocked - award repeat XP bonus (once per run)
-                            print(f"  -> Adding to repeated_achievements (repeat bonus!)")
-                            self.repeated_achievements.append(achievement)
-                            self.repeated_this_run.add(achievement.id)
-                        elif not achievement.unlocked and achievement.update_progress(progress_value):
-                            # First time unlock
-                            print(f"  -> Adding to newly_unlocked (first time!)")
-                            self.newly_unlocked.append(achievement)
-                            # Prevent repeat bonus in the same run for a freshly unlocked achievement
-                            self.repeated_this_run.add(achievement.id)
-                        else:
-                            print(f"  -> Already processed this run or other condition not met")
-                elif achievement.achievement_type == ACHIEVEMENT_TYPE_CHALLENGE:
-                    if key in ["run_unique_bosses", "bosses_no_death"]:
-                        progress_value = len(self.run_stats[key])
+                        LOG.debug("achievements", "  -> Already processed this run or other condition not met")
+            elif achievement.achievement_type == ACHIEVEMENT_TYPE_CHALLENGE:
+                if key in ["run_unique_bosses", "bosses_no_death"]:
+                    progress_value = len(self.run_stats[key])
+                else:
+                    progress_value = self.run_stats[key]
+                # Check if achievement criteria are met
+                if progress_value >= achievement.target_value:
+                    LOG.debug("achievements", "CHALLENGE achievement %r (key=%s) criteria met: progress %s/%s, "
+                              "unlocked=%s, repeated_this_run=%s", achievement.name, key, progress_value,
+                              achievement.target_value, achievement.unlocked, self.repeated_this_run)
+                    if achievement.unlocked and achievement.id not in self.repeated_this_run:
+                        # Already unlocked - award repeat XP bonus (once per run)
+                        LOG.debug("achievements", "  -> Adding to repeated_achievements (repeat bonus!)")
+                        self.repeated_achievements.append(achievement)
+                        self.repeated_this_run.add(achievement.id)
+                    elif not achievement.unlocked and achievement.update_progress(progress_value):
+                        # First time unlock
+                        LOG.debug("achievements", "  -> Adding to newly_unlocked (first time!)")
+                        self.newly_unlocked.append(achievement)
+                        # Prevent repeat bonus in the same run for a freshly unlocked achievement
+                        self.repeated_this_run.add(achievement.id)
                     else:
-                        progress_value = self.run_stats[key]
-                    # Check if achievement criteria are met
-                    if progress_value >= achievement.target_value:
-                        print(f"[DEBUG] CHALLENGE Achievement '{achievement.name}' (key={key}) criteria met:")
-                        print(f"  - progress_value: {progress_value}, target: {achievement.target_value}")
-                        print(f"  - achievement.unlocked: {achievement.unlocked}")
-                        print(f"  - achievement.id in repeated_this_run: {achievement.id in self.repeated_this_run}")
-                        print(f"  - repeated_this_run contents: {self.repeated_this_run}")
-                        if achievement.unlocked and achievement.id not in self.repeated_this_run:
-                            # Already unlocked - award repeat XP bonus (once per run)
-                            print(f"  -> Adding to repeated_achievements (repeat bonus!)")
-                            self.repeated_achievements.append(achievement)
-                            self.repeated_this_run.add(achievement.id)
-                        elif not achievement.unlocked and achievement.update_progress(progress_value):
-                            # First time unlock
-                            print(f"  -> Adding to newly_unlocked (first time!)")
-                            self.newly_unlocked.append(achievement)
-                            # Prevent repeat bonus in the same run for a freshly unlocked achievement
-                            self.repeated_this_run.add(achievement.id)
-                        else:
-                            print(f"  -> Already processed this run or other condition not met")
+                        LOG.debug("achievements", "  -> Already processed this run or other condition not met")
 
-        print(f"[DEBUG] track_run_stat() finished: found {matching_count} matching achievements for key='{key}'")
+        LOG.debug("achievements", "track_run_stat() finished: found %d matching achievements for key=%r", matching_count, key)
 
     def player_died(self):
         """Called when player 1 dies - resets challenge achievements"""
@@ -1458,8 +2172,7 @@ class AchievementManager:
 
         # Track fast boss kill (less than 10 seconds)
         if self.run_stats["current_boss_start_time"] is not None:
-            import time
-            boss_kill_time = time.time() - self.run_stats["current_boss_start_time"]
+            boss_kill_time = get_game_ticks() / 1000.0 - self.run_stats["current_boss_start_time"]
             if boss_kill_time < 10:
                 self.run_stats["fast_boss_kill"] = 1
                 self.track_run_stat("fast_boss_kill", 1)
@@ -1467,8 +2180,7 @@ class AchievementManager:
 
     def start_boss_encounter(self):
         """Called when a boss encounter starts"""
-        import time
-        self.run_stats["current_boss_start_time"] = time.time()
+        self.run_stats["current_boss_start_time"] = get_game_ticks() / 1000.0
         # Reset near miss counter for this boss
         self.run_stats["asteroid_near_misses"] = 0
 
@@ -1534,20 +2246,19 @@ class AchievementManager:
         if remaining_enemies == 1:
             # Start tracking shots when only 1 enemy remains
             if not self.run_stats["tracking_last_enemy"]:
-                print(f"[DEBUG] Sharp Shooter: Starting tracking (1 enemy left)")
+                LOG.debug("achievements", "Sharp Shooter: Starting tracking (1 enemy left)")
                 self.run_stats["tracking_last_enemy"] = True
                 self.run_stats["last_enemy_shots_fired"] = 0
         elif remaining_enemies == 0:
             # Level complete - check if we killed last enemy with 1 shot
-            print(f"[DEBUG] Sharp Shooter: Level complete check")
-            print(f"  - tracking_last_enemy: {self.run_stats['tracking_last_enemy']}")
-            print(f"  - last_enemy_shots_fired: {self.run_stats['last_enemy_shots_fired']}")
+            LOG.debug("achievements", "Sharp Shooter: Level complete check (tracking_last_enemy=%s, last_enemy_shots_fired=%s)",
+                      self.run_stats['tracking_last_enemy'], self.run_stats['last_enemy_shots_fired'])
             if self.run_stats["tracking_last_enemy"] and self.run_stats["last_enemy_shots_fired"] == 1:
-                print(f"[DEBUG] Sharp Shooter: CRITERIA MET! Setting run_stats and calling track_run_stat")
+                LOG.debug("achievements", "Sharp Shooter: CRITERIA MET! Setting run_stats and calling track_run_stat")
                 self.run_stats["sharp_shooter"] = 1
                 self.track_run_stat("sharp_shooter", 1)
             else:
-                print(f"[DEBUG] Sharp Shooter: Criteria NOT met")
+                LOG.debug("achievements", "Sharp Shooter: Criteria NOT met")
             # Reset for next level
             self.run_stats["last_enemy_shots_fired"] = 0
             self.run_stats["tracking_last_enemy"] = False
@@ -1659,13 +2370,13 @@ class AchievementManager:
             "completion_percentage": self.get_completion_percentage()
         }
         try:
-            with open(self.filename, 'w') as f:
-                json.dump(data, f, indent=4)
+            PERSISTENCE.save_json(self.filename, data, indent=4)
         except Exception as e:
-            print(f"Error saving achievements: {e}")
+            LOG.error("persistence", "Error saving achievements: %s", e)
 
     def load(self):
         """Load achievements from JSON file"""
+        PERSISTENCE.flush()
         if not self.filename or not os.path.exists(self.filename):
             return
 
@@ -1686,7 +2397,7 @@ class AchievementManager:
                     achievement.unlocked = saved_data.get("unlocked", False)
                     achievement.unlocked_date = saved_data.get("unlocked_date", None)
         except Exception as e:
-            print(f"Error loading achievements: {e}")
+            LOG.error("persistence", "Error loading achievements: %s", e)
 
 
 class FloatingText:
@@ -1696,18 +2407,18 @@ class FloatingText:
         self.text = text
         self.color = color
         self.duration = duration
-        self.start_time = pygame.time.get_ticks()
-        self.font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 16)
+        self.start_time = get_game_ticks()
+        self.font = get_font(16)
         
     def update(self):
         """Update floating text position and check if expired"""
         self.y -= 1  # Float upward
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         return current_time - self.start_time < self.duration
         
     def draw(self, screen):
         """Draw the floating text with fade effect"""
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         elapsed = current_time - self.start_time
         alpha = max(0, 255 - int((elapsed / self.duration) * 255))
         
@@ -1721,12 +2432,12 @@ class AchievementNotification:
     def __init__(self, achievement, duration=3000, stack_index=0, player_id=None, is_repeat=False):
         self.achievement = achievement
         self.duration = duration
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = get_game_ticks()
         self.player_id = player_id
         self.is_repeat = is_repeat
-        self.font_title = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
-        self.font_text = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 14)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 12)
+        self.font_title = get_font(20)
+        self.font_text = get_font(14)
+        self.font_small = get_font(12)
 
         # Position at top-middle of screen, stacked vertically if multiple
         # Box height is 140 (with player label), stack with 10px gap between notifications
@@ -1742,7 +2453,7 @@ class AchievementNotification:
 
     def update(self):
         """Update notification and check if expired"""
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         elapsed = current_time - self.start_time
 
         # Slide in animation
@@ -1850,9 +2561,9 @@ class PauseMenu:
         self.key_bindings = key_bindings if key_bindings else {}
         self.controllers = controllers if controllers else []
         self.coop_mode = coop_mode
-        self.font_title = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 28)
-        self.font_item = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 14)
+        self.font_title = get_font(28)
+        self.font_item = get_font(20)
+        self.font_small = get_font(14)
         # Adjust menu items based on coop mode
         if coop_mode:
             self.menu_items = ["Resume (hold)", "P1 Achievements", "P2 Achievements", "Settings", "Quit"]
@@ -2077,10 +2788,10 @@ class LevelUpScreen:
         self.xp_level = xp_level
         self.game_level = game_level
         self.score = score
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 36)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 24)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
-        self.tiny_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 16)
+        self.font_large = get_font(36)
+        self.font_medium = get_font(24)
+        self.font_small = get_font(20)
+        self.tiny_font = get_font(16)
 
         # Track last permanent powerup per player to prevent repeats
         self.last_permanent_powerup = {}
@@ -2601,15 +3312,15 @@ class LevelUpScreen:
                                if current_time - effect['start_time'] < effect['duration']]
         
         # Title
-        title_text = self.font_large.render("LEVEL UP!", True, GOLD)
+        title_text = render_text(self.font_large, "LEVEL UP!", True, GOLD)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
         self.screen.blit(title_text, title_rect)
 
         # Display stats (game level, player level, score)
         stats_y = 140
-        game_level_text = self.tiny_font.render(f"Game Level: {self.game_level}", True, CYAN)
-        player_level_text = self.tiny_font.render(f"Player Level: {self.xp_level}", True, CYAN)
-        score_text = self.tiny_font.render(f"Score: {self.score:,}", True, CYAN)
+        game_level_text = render_text(self.tiny_font, f"Game Level: {self.game_level}", True, CYAN)
+        player_level_text = render_text(self.tiny_font, f"Player Level: {self.xp_level}", True, CYAN)
+        score_text = render_text(self.tiny_font, f"Score: {self.score:,}", True, CYAN)
 
         game_level_rect = game_level_text.get_rect(center=(SCREEN_WIDTH // 2 - 300, stats_y))
         player_level_rect = player_level_text.get_rect(center=(SCREEN_WIDTH // 2, stats_y))
@@ -2622,7 +3333,7 @@ class LevelUpScreen:
         # Input delay indicator
         if pygame.time.get_ticks() - self.start_time < self.input_delay:
             remaining = (self.input_delay - (pygame.time.get_ticks() - self.start_time)) / 1000.0
-            delay_text = self.font_medium.render(f"Input unlocks in {remaining:.1f}s", True, YELLOW)
+            delay_text = render_text(self.font_medium, f"Input unlocks in {remaining:.1f}s", True, YELLOW)
             delay_rect = delay_text.get_rect(center=(SCREEN_WIDTH // 2, 180))
             self.screen.blit(delay_text, delay_rect)
             return  # Don't draw the rest during input delay
@@ -2637,9 +3348,9 @@ class LevelUpScreen:
             row_height = 80
 
             # Headers
-            p1_header = self.font_medium.render("PLAYER 1", True, GREEN)
-            desc_header = self.font_medium.render("UPGRADE", True, WHITE)
-            p2_header = self.font_medium.render("PLAYER 2", True, BLUE)
+            p1_header = render_text(self.font_medium, "PLAYER 1", True, GREEN)
+            desc_header = render_text(self.font_medium, "UPGRADE", True, WHITE)
+            p2_header = render_text(self.font_medium, "PLAYER 2", True, BLUE)
 
             self.screen.blit(p1_header, p1_header.get_rect(center=(left_col_x, header_y)))
             self.screen.blit(desc_header, desc_header.get_rect(center=(table_center, header_y)))
@@ -2682,8 +3393,8 @@ class LevelUpScreen:
                     pygame.draw.polygon(self.screen, BLUE, arrow_points)
 
                 # Middle column - Upgrade description
-                name_text = self.tiny_font.render(display_name, True, WHITE)
-                desc_text = self.tiny_font.render(description, True, GRAY)
+                name_text = render_text(self.tiny_font, display_name, True, WHITE)
+                desc_text = render_text(self.tiny_font, description, True, GRAY)
                 name_rect = name_text.get_rect(center=(table_center, y + 15))
                 desc_rect = desc_text.get_rect(center=(table_center, y + 35))
                 self.screen.blit(name_text, name_rect)
@@ -2693,31 +3404,31 @@ class LevelUpScreen:
                 p1_stat_name = p1_option[0] if p1_option else None
                 p1_display_name = p1_option[1] if p1_option else ""
                 if p1_display_name:
-                    name_surface = self.tiny_font.render(p1_display_name, True, WHITE)
+                    name_surface = render_text(self.tiny_font, p1_display_name, True, WHITE)
                     self.screen.blit(name_surface, name_surface.get_rect(topleft=(left_col_x - 70, y)))
 
                 if p1_stat_name == "extra_life":
                     p1_color = WHITE
                     if self.player1_confirmed and i == self.player1_selection:
-                        confirm_text = self.tiny_font.render("✓ SELECTED", True, GREEN)
+                        confirm_text = render_text(self.tiny_font, "✓ SELECTED", True, GREEN)
                         self.screen.blit(confirm_text, confirm_text.get_rect(topleft=(left_col_x - 70, y + 25)))
                     elif p1_option:
-                        lives_text = self.tiny_font.render(f"Lives: {self.players[0].lives}", True, p1_color)
+                        lives_text = render_text(self.tiny_font, f"Lives: {self.players[0].lives}", True, p1_color)
                         self.screen.blit(lives_text, lives_text.get_rect(topleft=(left_col_x - 70, y + 25)))
                 elif p1_stat_name == "save_and_quit":
                     # No stats needed for save and quit option
                     if self.player1_confirmed and i == self.player1_selection:
-                        confirm_text = self.tiny_font.render("✓ SELECTED", True, GREEN)
+                        confirm_text = render_text(self.tiny_font, "✓ SELECTED", True, GREEN)
                         self.screen.blit(confirm_text, confirm_text.get_rect(topleft=(left_col_x - 70, y + 25)))
                 elif p1_option:
                     if p1_stat_name == "boss_shield":
                         p1_color = WHITE if self.players[0].upgrades.can_upgrade(p1_stat_name) else GRAY
                         p1_status = "Unlocked" if self.players[0].upgrades.boss_shield_level > 0 else "Locked"
                         if self.player1_confirmed and i == self.player1_selection:
-                            confirm_text = self.tiny_font.render("✓ SELECTED", True, GREEN)
+                            confirm_text = render_text(self.tiny_font, "✓ SELECTED", True, GREEN)
                             self.screen.blit(confirm_text, confirm_text.get_rect(topleft=(left_col_x - 70, y + 25)))
                         else:
-                            p1_status_text = self.tiny_font.render(p1_status, True, p1_color)
+                            p1_status_text = render_text(self.tiny_font, p1_status, True, p1_color)
                             self.screen.blit(p1_status_text, p1_status_text.get_rect(topleft=(left_col_x - 70, y + 25)))
                         continue
                     p1_can_upgrade = self.players[0].upgrades.can_upgrade(p1_stat_name)
@@ -2726,11 +3437,11 @@ class LevelUpScreen:
                     p1_color = WHITE if p1_can_upgrade else GRAY
 
                     if self.player1_confirmed and i == self.player1_selection:
-                        confirm_text = self.tiny_font.render("✓ SELECTED", True, GREEN)
+                        confirm_text = render_text(self.tiny_font, "✓ SELECTED", True, GREEN)
                         self.screen.blit(confirm_text, confirm_text.get_rect(topleft=(left_col_x - 70, y + 25)))
                     else:
-                        p1_level_text = self.tiny_font.render(f"Lv {p1_level}", True, p1_color)
-                        p1_bonus_text = self.tiny_font.render(f"+{int((p1_multiplier - 1) * 100)}%", True, YELLOW if p1_can_upgrade else GRAY)
+                        p1_level_text = render_text(self.tiny_font, f"Lv {p1_level}", True, p1_color)
+                        p1_bonus_text = render_text(self.tiny_font, f"+{int((p1_multiplier - 1) * 100)}%", True, YELLOW if p1_can_upgrade else GRAY)
                         self.screen.blit(p1_level_text, p1_level_text.get_rect(topleft=(left_col_x - 70, y + 15)))
                         self.screen.blit(p1_bonus_text, p1_bonus_text.get_rect(topleft=(left_col_x - 70, y + 35)))
 
@@ -2738,7 +3449,7 @@ class LevelUpScreen:
                 p2_stat_name = p2_option[0] if p2_option else None
                 p2_display_name = p2_option[1] if p2_option else ""
                 if p2_display_name:
-                    name_surface = self.tiny_font.render(p2_display_name, True, WHITE)
+                    name_surface = render_text(self.tiny_font, p2_display_name, True, WHITE)
                     name_rect = name_surface.get_rect()
                     name_rect.right = right_col_x + 70
                     name_rect.y = y
@@ -2747,17 +3458,17 @@ class LevelUpScreen:
                 if p2_stat_name == "extra_life":
                     p2_color = WHITE
                     if self.player2_confirmed and i == self.player2_selection:
-                        confirm_text = self.tiny_font.render("✓ SELECTED", True, BLUE)
+                        confirm_text = render_text(self.tiny_font, "✓ SELECTED", True, BLUE)
                         confirm_rect = confirm_text.get_rect()
                         confirm_rect.topleft = (right_col_x - 70, y + 25)
                         self.screen.blit(confirm_text, confirm_rect)
                     elif p2_option:
-                        lives_text = self.tiny_font.render(f"Lives: {self.players[1].lives}", True, p2_color)
+                        lives_text = render_text(self.tiny_font, f"Lives: {self.players[1].lives}", True, p2_color)
                         self.screen.blit(lives_text, lives_text.get_rect(topleft=(right_col_x - 70, y + 25)))
                 elif p2_stat_name == "save_and_quit":
                     # No stats needed for save and quit option
                     if self.player2_confirmed and i == self.player2_selection:
-                        confirm_text = self.tiny_font.render("✓ SELECTED", True, BLUE)
+                        confirm_text = render_text(self.tiny_font, "✓ SELECTED", True, BLUE)
                         confirm_rect = confirm_text.get_rect()
                         confirm_rect.topleft = (right_col_x - 70, y + 25)
                         self.screen.blit(confirm_text, confirm_rect)
@@ -2766,12 +3477,12 @@ class LevelUpScreen:
                         p2_color = WHITE if self.players[1].upgrades.can_upgrade(p2_stat_name) else GRAY
                         p2_status = "Unlocked" if self.players[1].upgrades.boss_shield_level > 0 else "Locked"
                         if self.player2_confirmed and i == self.player2_selection:
-                            confirm_text = self.tiny_font.render("✓ SELECTED", True, BLUE)
+                            confirm_text = render_text(self.tiny_font, "✓ SELECTED", True, BLUE)
                             confirm_rect = confirm_text.get_rect()
                             confirm_rect.topleft = (right_col_x - 70, y + 25)
                             self.screen.blit(confirm_text, confirm_rect)
                         else:
-                            p2_status_text = self.tiny_font.render(p2_status, True, p2_color)
+                            p2_status_text = render_text(self.tiny_font, p2_status, True, p2_color)
                             self.screen.blit(p2_status_text, p2_status_text.get_rect(topleft=(right_col_x - 70, y + 25)))
                         continue
                     p2_can_upgrade = self.players[1].upgrades.can_upgrade(p2_stat_name)
@@ -2780,13 +3491,13 @@ class LevelUpScreen:
                     p2_color = WHITE if p2_can_upgrade else GRAY
 
                     if self.player2_confirmed and i == self.player2_selection:
-                        confirm_text = self.tiny_font.render("✓ SELECTED", True, BLUE)
+                        confirm_text = render_text(self.tiny_font, "✓ SELECTED", True, BLUE)
                         confirm_rect = confirm_text.get_rect()
                         confirm_rect.topleft = (right_col_x - 70, y + 25)
                         self.screen.blit(confirm_text, confirm_rect)
                     else:
-                        p2_level_text = self.tiny_font.render(f"Lv {p2_level}", True, p2_color)
-                        p2_bonus_text = self.tiny_font.render(f"+{int((p2_multiplier - 1) * 100)}%", True, YELLOW if p2_can_upgrade else GRAY)
+                        p2_level_text = render_text(self.tiny_font, f"Lv {p2_level}", True, p2_color)
+                        p2_bonus_text = render_text(self.tiny_font, f"+{int((p2_multiplier - 1) * 100)}%", True, YELLOW if p2_can_upgrade else GRAY)
                         self.screen.blit(p2_level_text, p2_level_text.get_rect(topleft=(right_col_x - 70, y + 15)))
                         self.screen.blit(p2_bonus_text, p2_bonus_text.get_rect(topleft=(right_col_x - 70, y + 35)))
 
@@ -2796,19 +3507,19 @@ class LevelUpScreen:
                 # Countdown when both players ready
                 elapsed = pygame.time.get_ticks() - self.countdown_start
                 remaining = max(0, (self.countdown_duration - elapsed) / 1000.0)
-                countdown_text = self.font_large.render(f"Next level in {remaining:.1f}s", True, GOLD)
+                countdown_text = render_text(self.font_large, f"Next level in {remaining:.1f}s", True, GOLD)
                 countdown_rect = countdown_text.get_rect(center=(SCREEN_WIDTH // 2, instructions_y))
                 self.screen.blit(countdown_text, countdown_rect)
             else:
                 # Instructions (only show when NOT counting down)
                 if not self.player1_confirmed or not self.player2_confirmed:
-                    inst_text = self.tiny_font.render("P1: WASD + Enter  |  P2: Arrows + Right Ctrl  |  Controllers: D-pad + A", True, GRAY)
+                    inst_text = render_text(self.tiny_font, "P1: WASD + Enter  |  P2: Arrows + Right Ctrl  |  Controllers: D-pad + A", True, GRAY)
                     inst_rect = inst_text.get_rect(center=(SCREEN_WIDTH // 2, instructions_y))
                     self.screen.blit(inst_text, inst_rect)
         
         else:
             # Single player layout
-            desc_header = self.font_medium.render("UPGRADES", True, WHITE)
+            desc_header = render_text(self.font_medium, "UPGRADES", True, WHITE)
             self.screen.blit(desc_header, desc_header.get_rect(center=(SCREEN_WIDTH // 2, 170)))
 
             start_y = 230
@@ -2834,14 +3545,14 @@ class LevelUpScreen:
                     pygame.draw.polygon(self.screen, GREEN, arrow_points)
 
                 # Upgrade info
-                name_text = self.tiny_font.render(display_name, True, WHITE)
-                desc_text = self.tiny_font.render(description, True, GRAY)
+                name_text = render_text(self.tiny_font, display_name, True, WHITE)
+                desc_text = render_text(self.tiny_font, description, True, GRAY)
                 self.screen.blit(name_text, name_text.get_rect(topleft=(panel_margin_x + 40, y + 10)))
                 self.screen.blit(desc_text, desc_text.get_rect(topleft=(panel_margin_x + 40, y + 30)))
 
                 # Stats
                 if stat_name == "extra_life":
-                    lives_text = self.tiny_font.render(f"Lives: {self.players[0].lives}", True, WHITE)
+                    lives_text = render_text(self.tiny_font, f"Lives: {self.players[0].lives}", True, WHITE)
                     self.screen.blit(lives_text, lives_text.get_rect(topleft=(panel_margin_x + 40, y + 50)))
                 elif stat_name == "save_and_quit":
                     # No stats needed for save and quit option
@@ -2850,14 +3561,14 @@ class LevelUpScreen:
                     if stat_name == "boss_shield":
                         can_upgrade = self.players[0].upgrades.can_upgrade(stat_name)
                         status = "Unlocked" if self.players[0].upgrades.boss_shield_level > 0 else "Locked"
-                        status_text = self.tiny_font.render(status, True, WHITE if can_upgrade else GRAY)
+                        status_text = render_text(self.tiny_font, status, True, WHITE if can_upgrade else GRAY)
                         self.screen.blit(status_text, status_text.get_rect(topleft=(panel_margin_x + 40, y + 50)))
                         continue
                     can_upgrade = self.players[0].upgrades.can_upgrade(stat_name)
                     level = getattr(self.players[0].upgrades, f"{stat_name}_level")
                     multiplier = self.players[0].upgrades.get_multiplier(stat_name)
 
-                    level_text = self.tiny_font.render(f"Level {level} (+{int((multiplier - 1) * 100)}%)", True, WHITE if can_upgrade else GRAY)
+                    level_text = render_text(self.tiny_font, f"Level {level} (+{int((multiplier - 1) * 100)}%)", True, WHITE if can_upgrade else GRAY)
                     self.screen.blit(level_text, level_text.get_rect(topleft=(panel_margin_x + 40, y + 50)))
 
             # FIXED: Only show ONE countdown or instruction section for single player
@@ -2866,12 +3577,12 @@ class LevelUpScreen:
                 # Countdown for single player after upgrade
                 elapsed = pygame.time.get_ticks() - self.countdown_start
                 remaining = max(0, (self.countdown_duration - elapsed) / 1000.0)
-                countdown_text = self.font_large.render(f"Continuing in {remaining:.1f}s", True, GOLD)
+                countdown_text = render_text(self.font_large, f"Continuing in {remaining:.1f}s", True, GOLD)
                 countdown_rect = countdown_text.get_rect(center=(SCREEN_WIDTH // 2, instructions_y))
                 self.screen.blit(countdown_text, countdown_rect)
             else:
                 # Instructions (only show when NOT counting down)
-                inst_text = self.tiny_font.render("WASD/Arrows: Navigate  |  Enter/Space: Select  |  Controller: D-pad + A", True, GRAY)
+                inst_text = render_text(self.tiny_font, "WASD/Arrows: Navigate  |  Enter/Space: Select  |  Controller: D-pad + A", True, GRAY)
                 inst_rect = inst_text.get_rect(center=(SCREEN_WIDTH // 2, instructions_y))
                 self.screen.blit(inst_text, inst_rect)
         
@@ -2894,7 +3605,39 @@ class LevelUpScreen:
         
         pygame.display.flip()
 
-class TargetedBullet:
+class PooledProjectile:
+    """Base for enemy projectiles, recycled through a per-class free list.
+
+    Subclasses declare __slots__ and their own `pool = []`. Constructing one pops a
+    released instance when one is free and __init__ reinitializes it, so call sites
+    are unchanged. Game calls release() when a projectile leaves enemy_bullets;
+    classes that stay referenced afterwards keep pool = None and are never reused.
+    """
+    __slots__ = ()
+    pool = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls.pool:
+            return cls.pool.pop()
+        return super().__new__(cls)
+
+    def release(self):
+        """Return this projectile to its free list"""
+        if self.pool is not None:
+            self.pool.append(self)
+
+    def place_rect(self, x, y, width, height):
+        """Set the collision rect, reusing the one a recycled projectile already owns"""
+        rect = getattr(self, 'rect', None)
+        if rect is None:
+            self.rect = pygame.Rect(x, y, width, height)
+        else:
+            rect.update(x, y, width, height)
+
+class TargetedBullet(PooledProjectile):
+    __slots__ = ('x', 'y', 'width', 'height', 'vel_x', 'vel_y', 'rect')
+    pool = []
+
     def __init__(self, x, y, vel_x, vel_y):
         self.x = x
         self.y = y
@@ -2902,7 +3645,7 @@ class TargetedBullet:
         self.height = 8
         self.vel_x = vel_x
         self.vel_y = vel_y
-        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.place_rect(x, y, self.width, self.height)
         
     def move(self):
         self.x += self.vel_x
@@ -2918,14 +3661,17 @@ class TargetedBullet:
         pygame.draw.circle(screen, RED, (int(self.x), int(self.y)), 4)
         pygame.draw.circle(screen, ORANGE, (int(self.x), int(self.y)), 2)
 
-class LargeBullet:
+class LargeBullet(PooledProjectile):
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', 'rect')
+    pool = []
+
     def __init__(self, x, y, speed):
         self.x = x
         self.y = y
         self.width = 15
         self.height = 20
         self.speed = speed
-        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.place_rect(x, y, self.width, self.height)
         
     def move(self):
         self.y += self.speed
@@ -2940,7 +3686,10 @@ class LargeBullet:
         pygame.draw.ellipse(screen, ORANGE, (self.x - 4, self.y - 7, 9, 14))
         pygame.draw.ellipse(screen, YELLOW, (self.x - 2, self.y - 5, 5, 10))
 
-class FireballProjectile:
+class FireballProjectile(PooledProjectile):
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', 'vel_x', 'vel_y', 'rect')
+    pool = []
+
     def __init__(self, x, y, target_x, target_y, speed):
         self.x = x
         self.y = y
@@ -2952,7 +3701,7 @@ class FireballProjectile:
         distance = math.hypot(dx, dy) or 1
         self.vel_x = (dx / distance) * speed
         self.vel_y = (dy / distance) * speed
-        self.rect = pygame.Rect(int(self.x - self.width // 2), int(self.y - self.height // 2), self.width, self.height)
+        self.place_rect(int(self.x - self.width // 2), int(self.y - self.height // 2), self.width, self.height)
 
     def move(self):
         self.x += self.vel_x
@@ -2970,15 +3719,18 @@ class FireballProjectile:
         pygame.draw.circle(screen, (255, 140, 0), center, 10)
         pygame.draw.circle(screen, (255, 220, 120), center, 6)
 
-class SlowFallingBullet:
+class SlowFallingBullet(PooledProjectile):
     """Slow-falling bullet for the Bullet Hell Boss"""
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', 'rect')
+    pool = []
+
     def __init__(self, x, y, speed):
         self.x = x
         self.y = y
         self.width = 12
         self.height = 16
         self.speed = speed  # Slow downward speed
-        self.rect = pygame.Rect(int(self.x - self.width // 2), int(self.y - self.height // 2), self.width, self.height)
+        self.place_rect(int(self.x - self.width // 2), int(self.y - self.height // 2), self.width, self.height)
 
     def move(self):
         self.y += self.speed  # Only moves downward
@@ -3000,8 +3752,16 @@ class SlowFallingBullet:
         # Bright center
         pygame.draw.circle(screen, WHITE, center, 2)
 
-class SpinningRedSquare:
+class SpinningRedSquare(PooledProjectile):
     """Spinning red square projectile for Rubik's Cube Boss red attack - same size as boss squares"""
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', 'rotation', 'rotation_speed', 'vel_x', 'vel_y',
+                 'rect', 'afterimage_positions', 'afterimage_index', 'last_afterimage_time')
+    pool = []
+    # Rotated sprites shared by every square: (angle_step, alpha) -> Surface, alpha None is the main square
+    sprite_cache = {}
+    # Afterimages are recorded every AFTERIMAGE_INTERVAL, so this many cover their whole lifetime
+    afterimage_slots = SPINNING_SQUARE_AFTERIMAGE_LIFETIME // AFTERIMAGE_INTERVAL + 1
+
     def __init__(self, x, y, target_x, target_y, speed):
         self.x = x
         self.y = y
@@ -3017,11 +3777,12 @@ class SpinningRedSquare:
         distance = math.hypot(dx, dy) or 1
         self.vel_x = (dx / distance) * speed
         self.vel_y = (dy / distance) * speed
-        self.rect = pygame.Rect(int(self.x - self.width // 2), int(self.y - self.height // 2), self.width, self.height)
+        self.place_rect(int(self.x - self.width // 2), int(self.y - self.height // 2), self.width, self.height)
 
-        # Afterimage tracking
-        self.afterimage_positions = []
-        self.last_afterimage_time = pygame.time.get_ticks()
+        # Afterimage tracking: a ring buffer of (x, y, rotation, time), oldest at afterimage_index
+        self.afterimage_positions = [None] * self.afterimage_slots
+        self.afterimage_index = 0
+        self.last_afterimage_time = get_game_ticks()
 
     def move(self):
         self.x += self.vel_x
@@ -3030,51 +3791,66 @@ class SpinningRedSquare:
         self.rect.x = int(self.x - self.width // 2)
         self.rect.y = int(self.y - self.height // 2)
 
-        # Record afterimage positions
-        current_time = pygame.time.get_ticks()
+        # Record afterimage positions, overwriting the oldest (already expired) slot
+        current_time = get_game_ticks()
         if current_time - self.last_afterimage_time >= AFTERIMAGE_INTERVAL:
-            self.afterimage_positions.append((self.x, self.y, self.rotation, current_time))
+            self.afterimage_positions[self.afterimage_index] = (self.x, self.y, self.rotation, current_time)
+            self.afterimage_index = (self.afterimage_index + 1) % self.afterimage_slots
             self.last_afterimage_time = current_time
 
-        # Clean up old afterimages (keep only those less than 500ms old)
-        self.afterimage_positions = [(x, y, rot, t) for x, y, rot, t in self.afterimage_positions
-                                     if current_time - t < 500]
-
     def is_off_screen(self):
         return (self.x < -100 or self.x > SCREEN_WIDTH + 100 or
                 self.y < -100 or self.y > SCREEN_HEIGHT + 100)
 
+    def get_sprite(self, rotation, alpha=None):
+        """Cached rotated square; with an alpha it is the borderless afterimage faded to that alpha"""
+        step_angle = 360 / SPINNING_SQUARE_ROTATION_STEPS
+        angle_step = int(rotation // step_angle) % SPINNING_SQUARE_ROTATION_STEPS
+        if alpha is not None:
+            alpha = min(255, -(-alpha // SPINNING_SQUARE_ALPHA_STEP) * SPINNING_SQUARE_ALPHA_STEP)
+        key = (angle_step, alpha)
+        sprite = SpinningRedSquare.sprite_cache.get(key)
+        if sprite is None:
+            surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            pygame.draw.rect(surface, (255, 0, 0), (0, 0, self.width, self.height))
+            pygame.draw.rect(surface, (180, 0, 0), (4, 4, self.width - 8, self.height - 8))
+            if alpha is None:
+                # Draw black border
+                pygame.draw.rect(surface, (0, 0, 0), (0, 0, self.width, self.height), 2)
+            sprite = pygame.transform.rotate(surface, angle_step * step_angle)
+            if alpha is not None:
+                sprite.set_alpha(alpha)
+            SpinningRedSquare.sprite_cache[key] = sprite
+        return sprite
+
     def draw(self, screen):
-        # Draw afterimages first (behind the main square)
-        current_time = pygame.time.get_ticks()
-        for x, y, rotation, timestamp in self.afterimage_positions:
+        # Draw afterimages first (behind the main square), oldest first
+        current_time = get_game_ticks()
+        blits = []
+        for i in range(self.afterimage_slots):
+            afterimage = self.afterimage_positions[(self.afterimage_index + i) % self.afterimage_slots]
+            if afterimage is None:
+                continue
+            x, y, rotation, timestamp = afterimage
             age = current_time - timestamp
-            alpha = max(0, 255 - (age * 255 // 500))
-
-            # Create afterimage surface with red color and alpha
-            afterimage_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            pygame.draw.rect(afterimage_surface, (255, 0, 0, alpha), (0, 0, self.width, self.height))
-            pygame.draw.rect(afterimage_surface, (180, 0, 0, alpha), (4, 4, self.width - 8, self.height - 8))
-
-            # Rotate the afterimage
-            rotated_afterimage = pygame.transform.rotate(afterimage_surface, rotation)
-            afterimage_rect = rotated_afterimage.get_rect(center=(int(x), int(y)))
-            screen.blit(rotated_afterimage, afterimage_rect.topleft)
-
-        # Create a rotating red square (main projectile)
-        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        pygame.draw.rect(surface, (255, 0, 0), (0, 0, self.width, self.height))
-        pygame.draw.rect(surface, (180, 0, 0), (4, 4, self.width - 8, self.height - 8))
-        # Draw black border
-        pygame.draw.rect(surface, (0, 0, 0), (0, 0, self.width, self.height), 2)
-
-        # Rotate the surface
-        rotated = pygame.transform.rotate(surface, self.rotation)
-        rect = rotated.get_rect(center=(int(self.x), int(self.y)))
-        screen.blit(rotated, rect.topleft)
-
-class BlueBullet:
+            if age >= SPINNING_SQUARE_AFTERIMAGE_LIFETIME:
+                continue
+            alpha = 255 - (age * 255 // SPINNING_SQUARE_AFTERIMAGE_LIFETIME)
+            if alpha <= 0:
+                continue
+            sprite = self.get_sprite(rotation, alpha)
+            blits.append((sprite, sprite.get_rect(center=(int(x), int(y)))))
+
+        # Rotating red square (main projectile)
+        sprite = self.get_sprite(self.rotation)
+        blits.append((sprite, sprite.get_rect(center=(int(self.x), int(self.y)))))
+        screen.blits(blits, doreturn=False)
+
+class BlueBullet(PooledProjectile):
     """Blue rapid-fire bullet for Rubik's Cube Boss blue attack"""
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', 'vel_x', 'vel_y', 'rect')
+    pool = []
+
     def __init__(self, x, y, target_x, target_y, speed):
         self.x = x
         self.y = y
@@ -3088,7 +3864,7 @@ class BlueBullet:
         distance = math.hypot(dx, dy) or 1
         self.vel_x = (dx / distance) * speed
         self.vel_y = (dy / distance) * speed
-        self.rect = pygame.Rect(int(self.x - self.width // 2), int(self.y - self.height // 2), self.width, self.height)
+        self.place_rect(int(self.x - self.width // 2), int(self.y - self.height // 2), self.width, self.height)
 
     def move(self):
         self.x += self.vel_x
@@ -3105,13 +3881,16 @@ class BlueBullet:
         pygame.draw.circle(screen, (0, 100, 255), center, 5)
         pygame.draw.circle(screen, (100, 180, 255), center, 3)
 
-class GreenLaser:
+class GreenLaser(PooledProjectile):
     """Green laser beam for Rubik's Cube Boss green attack"""
+    __slots__ = ('boss', 'width', 'duration', 'start_time', 'rect')
+    # Not pooled: the boss keeps its green_laser reference after the beam expires
+
     def __init__(self, boss, duration):
         self.boss = boss  # Reference to boss to track movement
         self.width = 15  # Width of the laser beam
         self.duration = duration  # How long the laser stays active (ms)
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = get_game_ticks()
         self.update_rect()
 
     def update_rect(self):
@@ -3120,7 +3899,7 @@ class GreenLaser:
         center_y = self.boss.center_y
         # Laser starts from center of boss and goes to bottom of screen
         laser_height = SCREEN_HEIGHT - center_y
-        self.rect = pygame.Rect(int(center_x - self.width // 2), int(center_y), self.width, int(laser_height))
+        self.place_rect(int(center_x - self.width // 2), int(center_y), self.width, int(laser_height))
 
     def move(self):
         # Update position to follow boss
@@ -3128,7 +3907,7 @@ class GreenLaser:
 
     def is_off_screen(self):
         # Check if duration expired
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         return (current_time - self.start_time) > self.duration
 
     def draw(self, screen):
@@ -3140,7 +3919,7 @@ class GreenLaser:
         laser_height = SCREEN_HEIGHT - center_y
 
         # Flashing effect - alternate between bright and dim green
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         flash_cycle = (current_time // 100) % 2  # Flash every 100ms
 
         if flash_cycle == 0:
@@ -3173,15 +3952,18 @@ class GreenLaser:
         # Draw marker at top of laser (where it originates from center cube) for debugging
         pygame.draw.circle(screen, (255, 0, 0), (int(center_x), int(center_y)), 5)  # Red dot at laser origin
 
-class YellowBall:
+class YellowBall(PooledProjectile):
     """Slow-falling yellow ball for Rubik's Cube Boss yellow attack (bullet hell)"""
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', 'rect')
+    pool = []
+
     def __init__(self, x, y, speed):
         self.x = x
         self.y = y
         self.width = 14
         self.height = 14
         self.speed = speed  # Very slow falling speed
-        self.rect = pygame.Rect(int(self.x - self.width // 2), int(self.y - self.height // 2), self.width, self.height)
+        self.place_rect(int(self.x - self.width // 2), int(self.y - self.height // 2), self.width, self.height)
 
     def move(self):
         self.y += self.speed
@@ -3200,9 +3982,14 @@ class YellowBall:
         # Inner core
         pygame.draw.circle(screen, (255, 255, 200), center, 3)
 
-class WhiteBall:
+class WhiteBall(PooledProjectile):
     """Bouncing white ball for Rubik's Cube Boss white attack (screensaver style)"""
+    __slots__ = ('x', 'y', 'radius', 'width', 'height', 'speed', 'duration', 'start_time', 'vel_x',
+                 'vel_y', 'rect')
+    pool = []
+
     def __init__(self, x, y, speed, duration=20000):
+        rng = get_game_random()
         self.x = x
         self.y = y
         self.radius = 25  # Large ball
@@ -3212,14 +3999,14 @@ class WhiteBall:
 
         # Duration tracking
         self.duration = duration  # 20 seconds by default
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = get_game_ticks()
 
         # Random initial direction
-        angle = random.uniform(0, 2 * math.pi)
+        angle = rng.uniform(0, 2 * math.pi)
         self.vel_x = math.cos(angle) * speed
         self.vel_y = math.sin(angle) * speed
 
-        self.rect = pygame.Rect(int(self.x - self.radius), int(self.y - self.radius), self.width, self.height)
+        self.place_rect(int(self.x - self.radius), int(self.y - self.radius), self.width, self.height)
 
     def move(self):
         self.x += self.vel_x
@@ -3241,7 +4028,7 @@ class WhiteBall:
 
     def is_off_screen(self):
         # Check if duration expired
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         return (current_time - self.start_time) > self.duration
 
     def draw(self, screen):
@@ -3252,8 +4039,11 @@ class WhiteBall:
         # Shiny spot
         pygame.draw.circle(screen, (255, 255, 255), (int(self.x - 8), int(self.y - 8)), 8)
 
-class OrangeFireball:
+class OrangeFireball(PooledProjectile):
     """Orange fireball for Rubik's Cube Boss orange attack - shoots from rotating barrel"""
+    __slots__ = ('x', 'y', 'radius', 'width', 'height', 'speed', 'vel_x', 'vel_y', 'rect')
+    pool = []
+
     def __init__(self, x, y, angle_degrees, speed, radius=None):
         self.x = x
         self.y = y
@@ -3266,7 +4056,7 @@ class OrangeFireball:
         angle_rad = math.radians(angle_degrees)
         self.vel_x = math.cos(angle_rad) * speed
         self.vel_y = math.sin(angle_rad) * speed
-        self.rect = pygame.Rect(int(self.x - self.radius), int(self.y - self.radius), self.width, self.height)
+        self.place_rect(int(self.x - self.radius), int(self.y - self.radius), self.width, self.height)
 
     def move(self):
         self.x += self.vel_x
@@ -3291,6 +4081,7 @@ class OrangeFireball:
 
 class Boss:
     def __init__(self, encounter):
+        rng = get_game_random()
         # Boss configuration
         self.width = SCREEN_WIDTH // 3  # One third of screen width
         self.height = int(self.width * 0.6)  # Proportional height
@@ -3313,9 +4104,9 @@ class Boss:
         
         # Movement
         self.speed = BOSS_SPEED_BASE
-        self.direction = random.choice([-1, 1])
-        self.last_direction_change = pygame.time.get_ticks()
-        self.direction_change_cooldown = random.randint(1000, 3000)
+        self.direction = rng.choice([-1, 1])
+        self.last_direction_change = get_game_ticks()
+        self.direction_change_cooldown = rng.randint(1000, 3000)
         
         # Main body shooting (when turrets destroyed)
         self.main_body_last_shot = 0
@@ -3360,6 +4151,7 @@ class Boss:
         return nearest_player
         
     def update(self, players=None, sound_manager=None):
+        rng = get_game_random()
         if self.destruction_complete:
             # Update explosion effects during destruction
             self.explosion_effects = [exp for exp in self.explosion_effects if exp['life'] > 0]
@@ -3377,12 +4169,12 @@ class Boss:
         if self.x <= 0 or self.x >= SCREEN_WIDTH - self.width:
             self.direction *= -1
         
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         if current_time - self.last_direction_change > self.direction_change_cooldown:
-            if random.randint(1, 100) <= 15:  # Reduced from 30% to 15% chance
+            if rng.randint(1, 100) <= 15:  # Reduced from 30% to 15% chance
                 self.direction *= -1
                 self.last_direction_change = current_time
-                self.direction_change_cooldown = random.randint(2000, 6000)  # Changed from (1000, 3000)
+                self.direction_change_cooldown = rng.randint(2000, 6000)  # Changed from (1000, 3000)
         
         self.rect.x = self.x
         self.rect.y = self.y
@@ -3409,7 +4201,7 @@ class Boss:
             return []
             
         bullets = []
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         turret_positions = self.get_turret_positions()
         
         # Count active turrets for fire rate calculation
@@ -3500,50 +4292,53 @@ class Boss:
         
     def create_debris_effect(self, turret_index):
         """Create debris when turret is destroyed"""
+        rng = get_game_random()
         turret_pos = self.get_turret_positions()[turret_index]
         
         for _ in range(8):
             debris = {
-                'x': turret_pos[0] + random.randint(-20, 20),
-                'y': turret_pos[1] + random.randint(-10, 10),
-                'vel_x': random.uniform(-3, 3),
-                'vel_y': random.uniform(-5, -1),
-                'size': random.randint(3, 8),
-                'color': random.choice([ORANGE, RED, YELLOW]),
-                'life': random.randint(30, 60)
+                'x': turret_pos[0] + rng.randint(-20, 20),
+                'y': turret_pos[1] + rng.randint(-10, 10),
+                'vel_x': rng.uniform(-3, 3),
+                'vel_y': rng.uniform(-5, -1),
+                'size': rng.randint(3, 8),
+                'color': rng.choice([ORANGE, RED, YELLOW]),
+                'life': rng.randint(30, 60)
             }
             self.debris_effects.append(debris)
             
     def start_destruction_sequence(self):
         """Start the dramatic destruction sequence"""
+        rng = get_game_random()
         self.destruction_complete = True
-        self.destruction_start_time = pygame.time.get_ticks()
+        self.destruction_start_time = get_game_ticks()
         
         # Create multiple MASSIVE explosion effects 
         for _ in range(20):  # Even more explosions
             explosion = {
-                'x': self.x + random.randint(-50, self.width + 50),  # Extend beyond UFO
-                'y': self.y + random.randint(-30, self.height + 30),
+                'x': self.x + rng.randint(-50, self.width + 50),  # Extend beyond UFO
+                'y': self.y + rng.randint(-30, self.height + 30),
                 'radius': 0,
-                'growth': random.uniform(6, 12),  # Much faster growth
-                'color': random.choice([ORANGE, RED, YELLOW, WHITE, (255, 100, 0)]),
-                'life': random.randint(80, 150),  # Longer lasting
-                'max_radius': random.randint(60, 120)  # Different max sizes
+                'growth': rng.uniform(6, 12),  # Much faster growth
+                'color': rng.choice([ORANGE, RED, YELLOW, WHITE, (255, 100, 0)]),
+                'life': rng.randint(80, 150),  # Longer lasting
+                'max_radius': rng.randint(60, 120)  # Different max sizes
             }
             self.explosion_effects.append(explosion)
 
     def create_final_explosion(self):
         """Create a massive particle explosion when boss is completely destroyed"""
+        rng = get_game_random()
         explosion_particles = []
         
         # Create TONS of particles across a huge area
         for _ in range(50):  # Way more particles
             particle = {
-                'x': self.x + random.randint(-100, self.width + 100),  # Much wider spread
-                'y': self.y + random.randint(-50, self.height + 50),
-                'vel_x': random.uniform(-8, 8),  # Faster and wider spread
-                'vel_y': random.uniform(-8, 3),
-                'color': random.choice([
+                'x': self.x + rng.randint(-100, self.width + 100),  # Much wider spread
+                'y': self.y + rng.randint(-50, self.height + 50),
+                'vel_x': rng.uniform(-8, 8),  # Faster and wider spread
+                'vel_y': rng.uniform(-8, 3),
+                'color': rng.choice([
                     (255, 150, 0),   # Bright Orange
                     (255, 80, 80),   # Bright Red  
                     (255, 255, 100), # Bright Yellow
@@ -3552,9 +4347,9 @@ class Boss:
                     (255, 200, 0),   # Gold
                     (255, 0, 0),     # Pure Red
                 ]),
-                'size': random.randint(4, 12),  # Much bigger particles
-                'life': random.randint(1000, 1800),  # Much longer lasting
-                'gravity': random.uniform(0.1, 0.3)  # Variable gravity
+                'size': rng.randint(4, 12),  # Much bigger particles
+                'life': rng.randint(1000, 1800),  # Much longer lasting
+                'gravity': rng.uniform(0.1, 0.3)  # Variable gravity
             }
             explosion_particles.append(particle)
         
@@ -3564,7 +4359,7 @@ class Boss:
         """Check if destruction sequence is finished"""
         if not self.destruction_complete:
             return False
-        return pygame.time.get_ticks() - self.destruction_start_time > 2000  # 2 second sequence
+        return get_game_ticks() - self.destruction_start_time > 2000  # 2 second sequence
         
     def get_turret_rects(self):
         """Get collision rectangles for each turret"""
@@ -3588,109 +4383,186 @@ class Boss:
             return None  # Main body protected
         return self.rect
         
-    def get_health_color(self):
-        """Get UFO color based on health (white to red)"""
-        if self.destruction_complete:
-            return RED
-            
-        health_ratio = self.health / self.max_health
-        # Interpolate from white (255,255,255) to red (255,0,0)
-        red = 255
-        green = int(255 * health_ratio)
-        blue = int(255 * health_ratio)
-        return (red, green, blue)
-        
-    def draw(self, screen):
-        # DON'T draw the UFO if destruction is complete
-        if self.destruction_complete:
-            # Only draw explosion effects during destruction
-            for explosion in self.explosion_effects:
-                if explosion['radius'] > 0:
-                    alpha = int(255 * (explosion['life'] / 150))
-                    explosion_surface = pygame.Surface((explosion['radius']*2, explosion['radius']*2), pygame.SRCALPHA)
-                    pygame.draw.circle(explosion_surface, explosion['color'], (explosion['radius'], explosion['radius']), explosion['radius'])
-                    explosion_surface.set_alpha(alpha)
-                    screen.blit(explosion_surface, (explosion['x'] - explosion['radius'], explosion['y'] - explosion['radius']))
-            return  # Don't draw anything else
-            
-        if self.is_destruction_complete():
-            return  # Don't draw if destruction is complete
-            
-        # Get UFO color based on health
-        ufo_color = self.get_health_color()
-        
+    # Pre-rendered UFO parts, shared by every Boss (all have the same size)
+    hull_cache = {}  # Tint color -> hull surface
+    turret_cache = {}  # (turret index, damage state) -> turret surface
+    HULL_SPRITE_TOP = 15  # Rows above self.y in the hull sprite (antenna tips)
+    HULL_SPRITE_COLORKEY = (255, 0, 255)
+    TURRET_SPRITE_RADIUS = 25
+
+    def get_hull_tint(self):
+        """get_health_color() rounded up to one of BOSS_HULL_TINT_STEPS cached tints"""
+        health_ratio = math.ceil(self.health / self.max_health * BOSS_HULL_TINT_STEPS) / BOSS_HULL_TINT_STEPS
+        return (255, int(255 * health_ratio), int(255 * health_ratio))
+
+    def get_hull_sprite(self, ufo_color):
+        """Hull, dome, bridge, panels and antennas in ufo_color, drawn relative to (self.x, self.y - HULL_SPRITE_TOP)"""
+        sprite = self.hull_cache.get(ufo_color)
+        if sprite is not None:
+            return sprite
+
+        top = self.HULL_SPRITE_TOP
+        hull_y = top + int(self.height * 0.4)
+        hull_height = int(self.height * 0.4)
+        sprite = pygame.Surface((self.width, hull_y + hull_height))
+        sprite.fill(self.HULL_SPRITE_COLORKEY)
+
         # IMPROVED PIXEL ART UFO DESIGN
-        
+
         # 1. MAIN HULL - Detailed segmented design
         hull_segments = 8
         segment_width = self.width // hull_segments
-        hull_y = self.y + int(self.height * 0.4)
-        hull_height = int(self.height * 0.4)
-        
+
         # Draw hull segments with alternating colors for detail
         for i in range(hull_segments):
-            segment_x = self.x + i * segment_width
+            segment_x = i * segment_width
             # Alternate between main color and slightly darker
             if i % 2 == 0:
                 color = ufo_color
             else:
                 color = (max(0, ufo_color[0] - 30), max(0, ufo_color[1] - 30), max(0, ufo_color[2] - 30))
-            
-            pygame.draw.rect(screen, color, (segment_x, hull_y, segment_width, hull_height))
-            
+
+            pygame.draw.rect(sprite, color, (segment_x, hull_y, segment_width, hull_height))
+
         # Hull outline
-        pygame.draw.rect(screen, (100, 100, 100), (self.x, hull_y, self.width, hull_height), 3)
-        
+        pygame.draw.rect(sprite, (100, 100, 100), (0, hull_y, self.width, hull_height), 3)
+
         # 2. UPPER DOME - Multi-layered with details
         dome_width = int(self.width * 0.6)
         dome_height = int(self.height * 0.5)
-        dome_x = self.x + (self.width - dome_width) // 2
-        dome_y = self.y
-        
+        dome_x = (self.width - dome_width) // 2
+        dome_y = top
+
         # Outer dome layer
-        pygame.draw.ellipse(screen, (80, 150, 200), (dome_x - 10, dome_y - 5, dome_width + 20, dome_height + 10))
+        pygame.draw.ellipse(sprite, (80, 150, 200), (dome_x - 10, dome_y - 5, dome_width + 20, dome_height + 10))
         # Main dome
-        pygame.draw.ellipse(screen, (120, 200, 255), (dome_x, dome_y, dome_width, dome_height))
+        pygame.draw.ellipse(sprite, (120, 200, 255), (dome_x, dome_y, dome_width, dome_height))
         # Inner dome highlight
-        pygame.draw.ellipse(screen, (180, 220, 255), (dome_x + 20, dome_y + 10, dome_width - 40, dome_height - 20))
+        pygame.draw.ellipse(sprite, (180, 220, 255), (dome_x + 20, dome_y + 10, dome_width - 40, dome_height - 20))
         # Dome outline
-        pygame.draw.ellipse(screen, WHITE, (dome_x, dome_y, dome_width, dome_height), 2)
-        
+        pygame.draw.ellipse(sprite, WHITE, (dome_x, dome_y, dome_width, dome_height), 2)
+
         # 3. COMMAND BRIDGE/COCKPIT in center of dome
         bridge_width = dome_width // 3
         bridge_height = dome_height // 2
         bridge_x = dome_x + (dome_width - bridge_width) // 2
         bridge_y = dome_y + dome_height // 4
-        
-        pygame.draw.ellipse(screen, (50, 50, 50), (bridge_x, bridge_y, bridge_width, bridge_height))
-        pygame.draw.ellipse(screen, (150, 150, 150), (bridge_x + 5, bridge_y + 3, bridge_width - 10, bridge_height - 6))
-        pygame.draw.ellipse(screen, WHITE, (bridge_x, bridge_y, bridge_width, bridge_height), 2)
-        
+
+        pygame.draw.ellipse(sprite, (50, 50, 50), (bridge_x, bridge_y, bridge_width, bridge_height))
+        pygame.draw.ellipse(sprite, (150, 150, 150), (bridge_x + 5, bridge_y + 3, bridge_width - 10, bridge_height - 6))
+        pygame.draw.ellipse(sprite, WHITE, (bridge_x, bridge_y, bridge_width, bridge_height), 2)
+
         # 4. DETAILED HULL PANELS
         panel_width = self.width // 6
         panel_height = hull_height // 2
         panel_y = hull_y + panel_height // 2
-        
+
         for i in range(0, 6):
-            panel_x = self.x + i * panel_width + panel_width // 4
+            panel_x = i * panel_width + panel_width // 4
             # Hull panels with rivets/details
-            pygame.draw.rect(screen, (max(0, ufo_color[0] - 20), max(0, ufo_color[1] - 20), max(0, ufo_color[2] - 20)), 
-                           (panel_x, panel_y, panel_width // 2, panel_height))
-            pygame.draw.rect(screen, GRAY, (panel_x, panel_y, panel_width // 2, panel_height), 1)
-            
+            pygame.draw.rect(sprite, (max(0, ufo_color[0] - 20), max(0, ufo_color[1] - 20), max(0, ufo_color[2] - 20)),
+                             (panel_x, panel_y, panel_width // 2, panel_height))
+            pygame.draw.rect(sprite, GRAY, (panel_x, panel_y, panel_width // 2, panel_height), 1)
+
             # Rivets/bolts on panels
-            pygame.draw.circle(screen, (80, 80, 80), (panel_x + 8, panel_y + 8), 3)
-            pygame.draw.circle(screen, (80, 80, 80), (panel_x + panel_width//2 - 8, panel_y + panel_height - 8), 3)
+            pygame.draw.circle(sprite, (80, 80, 80), (panel_x + 8, panel_y + 8), 3)
+            pygame.draw.circle(sprite, (80, 80, 80), (panel_x + panel_width//2 - 8, panel_y + panel_height - 8), 3)
+
+        # 8. ANTENNA/COMMUNICATION ARRAYS on dome (nothing drawn later overlaps them)
+        antenna_count = 3
+        for i in range(antenna_count):
+            antenna_x = dome_x + (i + 1) * (dome_width // (antenna_count + 1))
+            antenna_base_y = dome_y + dome_height // 3
+            antenna_tip_y = dome_y - 10
+
+            # Antenna structure
+            pygame.draw.line(sprite, GRAY, (antenna_x, antenna_base_y), (antenna_x, antenna_tip_y), 3)
+            pygame.draw.circle(sprite, RED, (antenna_x, antenna_tip_y), 4)  # Antenna tip
+            pygame.draw.circle(sprite, WHITE, (antenna_x, antenna_tip_y), 4, 1)
+
+        sprite.set_colorkey(self.HULL_SPRITE_COLORKEY, pygame.RLEACCEL)
+        self.hull_cache[ufo_color] = sprite
+        return sprite
+
+    def get_turret_sprite(self, index, damage_state):
+        """Turret `index` (0-2) with its barrel aimed away from the hull center; damage_state 1/2 adds the orange/red ring"""
+        key = (index, damage_state)
+        sprite = self.turret_cache.get(key)
+        if sprite is not None:
+            return sprite
+
+        radius = self.TURRET_SPRITE_RADIUS
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pos = (radius, radius)
+
+        # Turret base (larger)
+        pygame.draw.circle(sprite, (60, 60, 60), pos, 25)
+        pygame.draw.circle(sprite, DARK_GREEN, pos, 20)
+
+        # Turret gun barrel
+        turret_x, turret_y = self.get_turret_positions()[index]
+        barrel_length = 15
+        barrel_angle = math.atan2(turret_y - (self.y + self.height//2), turret_x - (self.x + self.width//2))
+        barrel_end_x = pos[0] + int(math.cos(barrel_angle) * barrel_length)
+        barrel_end_y = pos[1] + int(math.sin(barrel_angle) * barrel_length)
+
+        pygame.draw.line(sprite, (40, 40, 40), pos, (barrel_end_x, barrel_end_y), 8)
+        pygame.draw.line(sprite, (80, 80, 80), pos, (barrel_end_x, barrel_end_y), 4)
+
+        # Turret details
+        pygame.draw.circle(sprite, GREEN, pos, 15)
+        pygame.draw.circle(sprite, (0, 100, 0), pos, 10)
+        pygame.draw.circle(sprite, WHITE, pos, 20, 2)
+
+        # Turret health indicator
+        if damage_state:
+            damage_color = RED if damage_state == 2 else ORANGE
+            pygame.draw.circle(sprite, damage_color, pos, 22, 4)
+
+        self.turret_cache[key] = sprite
+        return sprite
+
+    def get_health_color(self):
+        """Get UFO color based on health (white to red)"""
+        if self.destruction_complete:
+            return RED
+            
+        health_ratio = self.health / self.max_health
+        # Interpolate from white (255,255,255) to red (255,0,0)
+        red = 255
+        green = int(255 * health_ratio)
+        blue = int(255 * health_ratio)
+        return (red, green, blue)
         
+    def draw(self, screen):
+        # DON'T draw the UFO if destruction is complete
+        if self.destruction_complete:
+            # Only draw explosion effects during destruction
+            for explosion in self.explosion_effects:
+                if explosion['radius'] > 0:
+                    alpha = int(255 * (explosion['life'] / 150))
+                    EffectSprites.draw_circle(screen, explosion['color'], (explosion['x'], explosion['y']), explosion['radius'], alpha)
+            return  # Don't draw anything else
+            
+        if self.is_destruction_complete():
+            return  # Don't draw if destruction is complete
+            
+        # Static hull, dome, panels and antennas, pre-rendered per health tint
+        hull_sprite = self.get_hull_sprite(self.get_hull_tint())
+        screen.blit(hull_sprite, (self.x, self.y - self.HULL_SPRITE_TOP))
+        hull_y = self.y + int(self.height * 0.4)
+        hull_height = int(self.height * 0.4)
+
         # 5. ENHANCED LIGHTING SYSTEM
         light_count = 12
+        pulse_time = get_game_ticks() * 0.008
         for i in range(light_count):
             angle = (i / light_count) * 2 * math.pi
             light_x = self.x + self.width // 2 + int(math.cos(angle) * (self.width // 2 - 15))
             light_y = hull_y + hull_height // 2 + int(math.sin(angle) * 20)
             
             # Animated pulse based on time and position
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.008 + i * 0.5)) * 0.6 + 0.4
+            pulse = abs(math.sin(pulse_time + i * 0.5)) * 0.6 + 0.4
             
             # Different colored lights around the perimeter
             if i % 3 == 0:
@@ -3703,51 +4575,33 @@ class Boss:
             pygame.draw.circle(screen, light_color, (light_x, light_y), 8)
             pygame.draw.circle(screen, WHITE, (light_x, light_y), 8, 2)
         
-        # 6. IMPROVED TURRETS with more detail
+        # 6. IMPROVED TURRETS with more detail (cached per damage state)
         turret_positions = self.get_turret_positions()
+        radius = self.TURRET_SPRITE_RADIUS
         for i, (turret, pos) in enumerate(zip(self.turrets, turret_positions)):
             if not turret['destroyed']:
-                # Turret base (larger)
-                pygame.draw.circle(screen, (60, 60, 60), pos, 25)
-                pygame.draw.circle(screen, DARK_GREEN, pos, 20)
-                
-                # Turret gun barrel
-                barrel_length = 15
-                barrel_angle = math.atan2(pos[1] - (self.y + self.height//2), pos[0] - (self.x + self.width//2))
-                barrel_end_x = pos[0] + int(math.cos(barrel_angle) * barrel_length)
-                barrel_end_y = pos[1] + int(math.sin(barrel_angle) * barrel_length)
-                
-                pygame.draw.line(screen, (40, 40, 40), pos, (barrel_end_x, barrel_end_y), 8)
-                pygame.draw.line(screen, (80, 80, 80), pos, (barrel_end_x, barrel_end_y), 4)
-                
-                # Turret details
-                pygame.draw.circle(screen, GREEN, pos, 15)
-                pygame.draw.circle(screen, (0, 100, 0), pos, 10)
-                pygame.draw.circle(screen, WHITE, pos, 20, 2)
-                
-                # Turret health indicator
                 health_ratio = turret['health'] / turret['max_health']
-                if health_ratio < 0.7:
-                    damage_color = RED if health_ratio < 0.3 else ORANGE
-                    pygame.draw.circle(screen, damage_color, pos, 22, 4)
-                    
-                    # Damage sparks/effects
-                    if health_ratio < 0.5:
-                        for _ in range(3):
-                            spark_x = pos[0] + random.randint(-15, 15)
-                            spark_y = pos[1] + random.randint(-15, 15)
-                            pygame.draw.circle(screen, YELLOW, (spark_x, spark_y), 2)
+                damage_state = 0 if health_ratio >= 0.7 else 1 if health_ratio >= 0.3 else 2
+                screen.blit(self.get_turret_sprite(i, damage_state), (pos[0] - radius, pos[1] - radius))
+
+                # Damage sparks/effects
+                if health_ratio < 0.5:
+                    for _ in range(3):
+                        spark_x = pos[0] + random.randint(-15, 15)
+                        spark_y = pos[1] + random.randint(-15, 15)
+                        pygame.draw.circle(screen, YELLOW, (spark_x, spark_y), 2)
         
         # 7. ENGINE GLOW/EXHAUST at bottom
         engine_count = 4
         engine_spacing = self.width // (engine_count + 1)
         engine_y = hull_y + hull_height
         
+        glow_time = get_game_ticks() * 0.01
         for i in range(engine_count):
             engine_x = self.x + engine_spacing * (i + 1)
             
             # Engine glow effect
-            glow_intensity = abs(math.sin(pygame.time.get_ticks() * 0.01 + i)) * 0.5 + 0.5
+            glow_intensity = abs(math.sin(glow_time + i)) * 0.5 + 0.5
             engine_color = (int(100 * glow_intensity), int(150 * glow_intensity), int(255 * glow_intensity))
             
             # Multiple engine glow layers
@@ -3755,34 +4609,16 @@ class Boss:
             pygame.draw.circle(screen, (int(150 * glow_intensity), int(200 * glow_intensity), 255), (engine_x, engine_y), 8)
             pygame.draw.circle(screen, WHITE, (engine_x, engine_y), 4)
         
-        # 8. ANTENNA/COMMUNICATION ARRAYS on dome
-        antenna_count = 3
-        for i in range(antenna_count):
-            antenna_x = dome_x + (i + 1) * (dome_width // (antenna_count + 1))
-            antenna_base_y = dome_y + dome_height // 3
-            antenna_tip_y = dome_y - 10
-            
-            # Antenna structure
-            pygame.draw.line(screen, GRAY, (antenna_x, antenna_base_y), (antenna_x, antenna_tip_y), 3)
-            pygame.draw.circle(screen, RED, (antenna_x, antenna_tip_y), 4)  # Antenna tip
-            pygame.draw.circle(screen, WHITE, (antenna_x, antenna_tip_y), 4, 1)
-        
         # Draw debris effects
         for debris in self.debris_effects:
             alpha = int(255 * (debris['life'] / 60))
-            debris_surface = pygame.Surface((debris['size']*2, debris['size']*2), pygame.SRCALPHA)
-            color_with_alpha = (*debris['color'], alpha)
-            pygame.draw.circle(debris_surface, color_with_alpha, (debris['size'], debris['size']), debris['size'])
-            screen.blit(debris_surface, (debris['x'] - debris['size'], debris['y'] - debris['size']))
+            EffectSprites.draw_circle(screen, debris['color'], (debris['x'], debris['y']), debris['size'], alpha)
             
         # Draw explosion effects (for turret destruction)
         for explosion in self.explosion_effects:
             if explosion['radius'] > 0:
                 alpha = int(255 * (explosion['life'] / 80))
-                explosion_surface = pygame.Surface((explosion['radius']*2, explosion['radius']*2), pygame.SRCALPHA)
-                pygame.draw.circle(explosion_surface, explosion['color'], (explosion['radius'], explosion['radius']), explosion['radius'])
-                explosion_surface.set_alpha(alpha)
-                screen.blit(explosion_surface, (explosion['x'] - explosion['radius'], explosion['y'] - explosion['radius']))
+                EffectSprites.draw_circle(screen, explosion['color'], (explosion['x'], explosion['y']), explosion['radius'], alpha)
         
         # Health bars
         self.draw_health_bars(screen)
@@ -3808,8 +4644,8 @@ class Boss:
         pygame.draw.rect(screen, WHITE, (main_bar_x, main_bar_y, main_bar_width, main_bar_height), 2)
         
         # Health text
-        font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 16)
-        health_text = font.render(f"UFO: {self.health}/{self.max_health}", True, WHITE)
+        font = get_font(16)
+        health_text = render_text(font, f"UFO: {self.health}/{self.max_health}", True, WHITE)
         text_rect = health_text.get_rect(center=(self.x + self.width // 2, main_bar_y - 20))
         screen.blit(health_text, text_rect)
         
@@ -3840,6 +4676,7 @@ class HighScoreManager:
         
     def load_scores(self, filename):
         """Load high scores from file"""
+        PERSISTENCE.flush()
         if os.path.exists(filename):
             try:
                 with open(filename, 'r') as f:
@@ -3851,8 +4688,7 @@ class HighScoreManager:
     def save_scores(self, filename, scores):
         """Save high scores to file"""
         try:
-            with open(filename, 'w') as f:
-                json.dump(scores, f, indent=2)
+            PERSISTENCE.save_json(filename, scores, indent=2)
         except:
             pass
     
@@ -3893,9 +4729,9 @@ class NameInputScreen:
         self.level = level
         self.is_coop = is_coop
         self.key_bindings = key_bindings if key_bindings else {}
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 36)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 24)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
+        self.font_large = get_font(36)
+        self.font_medium = get_font(24)
+        self.font_small = get_font(20)
         
         # Name input system
         self.name = ["A", "A", "A"]
@@ -4109,9 +4945,9 @@ class UserNameInputScreen:
         self.screen = screen
         self.sound_manager = sound_manager
         self.key_bindings = key_bindings if key_bindings else {}
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 36)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 24)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
+        self.font_large = get_font(36)
+        self.font_medium = get_font(24)
+        self.font_small = get_font(20)
 
         self.max_name_length = 10
         self.name = [" "] * self.max_name_length
@@ -4298,9 +5134,9 @@ class HighScoreScreen:
         self.score_manager = score_manager
         self.sound_manager = sound_manager
         self.key_bindings = key_bindings if key_bindings else {}
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 36)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 24)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
+        self.font_large = get_font(36)
+        self.font_medium = get_font(24)
+        self.font_small = get_font(20)
         self.viewing_coop = False
         self.player_stats = player_stats  # Optional stats to display
         self.players = players  # Optional player objects for colors
@@ -4336,12 +5172,12 @@ class HighScoreScreen:
 
     def draw_player_stats(self, stats, x, y):
         """Draw comprehensive stats for a single player"""
-        stats_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 12)
-        header_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 16)
+        stats_font = get_font(12)
+        header_font = get_font(16)
 
         # Player header
         player_color = GREEN if stats.player_id == 1 else BLUE
-        header_text = header_font.render(f"PLAYER {stats.player_id} STATS", True, player_color)
+        header_text = render_text(header_font, f"PLAYER {stats.player_id} STATS", True, player_color)
         self.screen.blit(header_text, (x, y))
         y += 45
 
@@ -4375,7 +5211,7 @@ class HighScoreScreen:
         # Draw all stats
         for line in stat_lines:
             if line:  # Skip empty lines
-                text = stats_font.render(line, True, WHITE)
+                text = render_text(stats_font, line, True, WHITE)
                 self.screen.blit(text, (x, y))
             y += 25
 
@@ -4394,21 +5230,21 @@ class HighScoreScreen:
         """Draw the normal high scores screen without player stats"""
         # Title
         mode_text = "CO-OP" if self.viewing_coop else "SINGLE PLAYER"
-        title_text = self.font_large.render(f"{mode_text} HIGH SCORES", True, YELLOW)
+        title_text = render_text(self.font_large, f"{mode_text} HIGH SCORES", True, YELLOW)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 120))
         self.screen.blit(title_text, title_rect)
 
         # Mode toggle instruction
-        toggle_text = self.font_small.render("Press TAB or Left/Right to switch modes", True, CYAN)
+        toggle_text = render_text(self.font_small, "Press TAB or Left/Right to switch modes", True, CYAN)
         toggle_rect = toggle_text.get_rect(center=(SCREEN_WIDTH // 2, 180))
         self.screen.blit(toggle_text, toggle_rect)
 
         # Headers
-        rank_header = self.font_medium.render("RANK", True, WHITE)
-        name_header = self.font_medium.render("NAME", True, WHITE)
-        score_header = self.font_medium.render("SCORE", True, WHITE)
-        level_header = self.font_medium.render("LEVEL", True, WHITE)
-        date_header = self.font_medium.render("DATE", True, WHITE)
+        rank_header = render_text(self.font_medium, "RANK", True, WHITE)
+        name_header = render_text(self.font_medium, "NAME", True, WHITE)
+        score_header = render_text(self.font_medium, "SCORE", True, WHITE)
+        level_header = render_text(self.font_medium, "LEVEL", True, WHITE)
+        date_header = render_text(self.font_medium, "DATE", True, WHITE)
 
         header_y = 250
         self.screen.blit(rank_header, (200, header_y))
@@ -4429,34 +5265,34 @@ class HighScoreScreen:
                 row_rect = pygame.Rect(150, y - 10, SCREEN_WIDTH - 300, 50)
                 pygame.draw.rect(self.screen, (20, 20, 20), row_rect)
 
-            rank_text = self.font_small.render(f"{i + 1}.", True, YELLOW if i < 3 else WHITE)
+            rank_text = render_text(self.font_small, f"{i + 1}.", True, YELLOW if i < 3 else WHITE)
             self.screen.blit(rank_text, (200, y))
 
-            name_text = self.font_small.render(score_entry['name'], True, WHITE)
+            name_text = render_text(self.font_small, score_entry['name'], True, WHITE)
             self.screen.blit(name_text, (400, y))
 
-            score_text = self.font_small.render(f"{score_entry['score']:,}", True, WHITE)
+            score_text = render_text(self.font_small, f"{score_entry['score']:,}", True, WHITE)
             self.screen.blit(score_text, (700, y))
 
-            level_text = self.font_small.render(f"{score_entry['level']}", True, WHITE)
+            level_text = render_text(self.font_small, f"{score_entry['level']}", True, WHITE)
             self.screen.blit(level_text, (1000, y))
 
-            date_text = self.font_small.render(score_entry['date'][:10], True, GRAY)
+            date_text = render_text(self.font_small, score_entry['date'][:10], True, GRAY)
             self.screen.blit(date_text, (1300, y))
 
         if not scores:
-            no_scores_text = self.font_medium.render(f"No {mode_text.lower()} high scores yet!", True, GRAY)
+            no_scores_text = render_text(self.font_medium, f"No {mode_text.lower()} high scores yet!", True, GRAY)
             no_scores_rect = no_scores_text.get_rect(center=(SCREEN_WIDTH // 2, 500))
             self.screen.blit(no_scores_text, no_scores_rect)
 
-        instruction_text = self.font_small.render("Press ESC, ENTER, or controller button to return", True, GRAY)
+        instruction_text = render_text(self.font_small, "Press ESC, ENTER, or controller button to return", True, GRAY)
         instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80))
         self.screen.blit(instruction_text, instruction_rect)
 
     def draw_with_stats(self):
         """Draw the high scores screen with player stats displayed"""
         # Title (smaller)
-        title_text = self.font_medium.render("NEW HIGH SCORE!", True, YELLOW)
+        title_text = render_text(self.font_medium, "NEW HIGH SCORE!", True, YELLOW)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 40))
         self.screen.blit(title_text, title_rect)
 
@@ -4474,14 +5310,14 @@ class HighScoreScreen:
             self.draw_compact_high_scores(640, 100)
 
         # Instructions at bottom
-        instruction_text = self.font_small.render("Press ESC, ENTER, or controller button to return", True, GRAY)
+        instruction_text = render_text(self.font_small, "Press ESC, ENTER, or controller button to return", True, GRAY)
         instruction_rect = instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
         self.screen.blit(instruction_text, instruction_rect)
 
     def draw_compact_high_scores(self, x, y):
         """Draw a compact version of the high scores table"""
-        header_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 14)
-        compact_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 10)
+        header_font = get_font(14)
+        compact_font = get_font(10)
 
         # Determine which scores to show based on game mode
         is_coop = len(self.player_stats) > 1 if self.player_stats else False
@@ -4489,16 +5325,16 @@ class HighScoreScreen:
 
         # Header
         mode_text = "CO-OP" if is_coop else "SINGLE"
-        header_text = header_font.render(f"{mode_text} HIGH SCORES", True, CYAN)
+        header_text = render_text(header_font, f"{mode_text} HIGH SCORES", True, CYAN)
         header_rect = header_text.get_rect(centerx=x + 200)
         header_rect.y = y
         self.screen.blit(header_text, header_rect)
         y += 50
 
         # Column headers
-        rank_text = compact_font.render("RANK", True, GRAY)
-        name_text = compact_font.render("NAME", True, GRAY)
-        score_text = compact_font.render("SCORE", True, GRAY)
+        rank_text = render_text(compact_font, "RANK", True, GRAY)
+        name_text = render_text(compact_font, "NAME", True, GRAY)
+        score_text = render_text(compact_font, "SCORE", True, GRAY)
 
         self.screen.blit(rank_text, (x, y))
         self.screen.blit(name_text, (x + 80, y))
@@ -4512,9 +5348,9 @@ class HighScoreScreen:
         for i, score_entry in enumerate(scores[:10]):
             color = YELLOW if i < 3 else WHITE
 
-            rank_line = compact_font.render(f"{i + 1}.", True, color)
-            name_line = compact_font.render(score_entry['name'], True, color)
-            score_line = compact_font.render(f"{score_entry['score']:,}", True, color)
+            rank_line = render_text(compact_font, f"{i + 1}.", True, color)
+            name_line = render_text(compact_font, score_entry['name'], True, color)
+            score_line = render_text(compact_font, f"{score_entry['score']:,}", True, color)
 
             self.screen.blit(rank_line, (x, y))
             self.screen.blit(name_line, (x + 80, y))
@@ -4522,7 +5358,7 @@ class HighScoreScreen:
             y += 30
 
         if not scores:
-            no_scores = compact_font.render("No scores yet!", True, GRAY)
+            no_scores = render_text(compact_font, "No scores yet!", True, GRAY)
             no_scores_rect = no_scores.get_rect(centerx=x + 200)
             no_scores_rect.y = y
             self.screen.blit(no_scores, no_scores_rect)
@@ -4535,10 +5371,10 @@ class AchievementScreen:
         self.achievement_manager = achievement_manager
         self.sound_manager = sound_manager
         self.key_bindings = key_bindings if key_bindings else {}
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 36)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 16)
-        self.font_tiny = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 12)
+        self.font_large = get_font(36)
+        self.font_medium = get_font(20)
+        self.font_small = get_font(16)
+        self.font_tiny = get_font(12)
 
         # Scrolling support
         self.scroll_offset = 0
@@ -4794,9 +5630,9 @@ class NoUserAchievementScreen:
         self.screen = screen
         self.sound_manager = sound_manager
         self.key_bindings = key_bindings if key_bindings else {}
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 32)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 16)
+        self.font_large = get_font(32)
+        self.font_medium = get_font(20)
+        self.font_small = get_font(16)
 
         self.starfield = StarField(direction='horizontal')
 
@@ -4852,6 +5688,7 @@ class Player:
         self.last_shot_time = 0
         self.shot_queued = False  # Input buffer for fire button
         self.shot_queue_time = 0
+        self.input_bits = 0  # INPUT_* actions taken since the last update tick (for replays)
         self.invincible = False
         self.invincible_end_time = 0
         self.rapid_fire = False
@@ -4884,7 +5721,7 @@ class Player:
     def show_level_up_indicator(self):
         """Show level up indicator at player"""
         self.level_up_indicator = True
-        self.level_up_indicator_time = pygame.time.get_ticks()
+        self.level_up_indicator_time = get_game_ticks()
 
     def clear_ammo_power_ups(self):
         self.rapid_fire = False
@@ -4962,13 +5799,13 @@ class Player:
         self.is_alive = True
         self.reset_position()
         self.respawn_immunity = True
-        self.respawn_immunity_end_time = pygame.time.get_ticks() + RESPAWN_IMMUNITY_DURATION
+        self.respawn_immunity_end_time = get_game_ticks() + RESPAWN_IMMUNITY_DURATION
         self.clear_all_power_ups()
 
     def activate_boss_shield(self):
         """Grant a one-hit shield after defeating a boss"""
         self.boss_shield_active = True
-        self.boss_shield_flash_time = pygame.time.get_ticks()
+        self.boss_shield_flash_time = get_game_ticks()
 
     def clear_boss_shield(self):
         """Remove boss shield (e.g., at the start of a boss fight or when consumed)"""
@@ -4988,7 +5825,7 @@ class Player:
             self.clear_boss_shield()
             # Grant invincibility frames to prevent instant death from continuous collision
             self.respawn_immunity = True
-            self.respawn_immunity_end_time = pygame.time.get_ticks() + SHIELD_BREAK_IMMUNITY_DURATION
+            self.respawn_immunity_end_time = get_game_ticks() + SHIELD_BREAK_IMMUNITY_DURATION
             if sound_manager:
                 sound_manager.play_sound('explosion_small', volume_override=0.5)
             return True, None
@@ -5008,6 +5845,7 @@ class Player:
         return True, explosion_particles
         
     def move_left(self):
+        self.input_bits |= INPUT_LEFT
         if not self.is_alive:
             return
         if self.x > 0:
@@ -5016,6 +5854,7 @@ class Player:
             self.update_afterimage()
             
     def move_right(self):
+        self.input_bits |= INPUT_RIGHT
         if not self.is_alive:
             return
         if self.x < SCREEN_WIDTH - self.width:
@@ -5025,7 +5864,7 @@ class Player:
             
     def update_afterimage(self):
         if self.invincible:
-            current_time = pygame.time.get_ticks()
+            current_time = get_game_ticks()
             if current_time - self.last_afterimage_time >= AFTERIMAGE_INTERVAL:
                 self.afterimage_positions.append((self.x, self.y, current_time))
                 self.last_afterimage_time = current_time
@@ -5036,15 +5875,16 @@ class Player:
     def can_shoot(self):
         if not self.is_alive:
             return False
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         cooldown = self.get_shoot_cooldown()
         time_since_last = current_time - self.last_shot_time
         can_fire = time_since_last >= cooldown
 
         # DEBUG: Log when shot is blocked by cooldown
-        if not can_fire and time_since_last > 0:
+        if not can_fire and time_since_last > 0 and LOG.enabled("fire"):
             fire_rate_mult = self.upgrades.get_multiplier('fire_rate')
-            print(f"[FIRE DEBUG P{self.player_id}] Shot BLOCKED - cooldown={cooldown:.1f}ms, time_since_last={time_since_last}ms, needs={cooldown-time_since_last:.1f}ms more, fire_rate_mult={fire_rate_mult:.2f}, rapid_fire={self.rapid_fire}")
+            LOG.debug("fire", "P%d Shot BLOCKED - cooldown=%.1fms, time_since_last=%sms, needs=%.1fms more, fire_rate_mult=%.2f, rapid_fire=%s",
+                      self.player_id, cooldown, time_since_last, cooldown - time_since_last, fire_rate_mult, self.rapid_fire)
 
         return can_fire
         
@@ -5053,13 +5893,14 @@ class Player:
             return []
 
         # DEBUG: Log fire rate information
-        current_time = pygame.time.get_ticks()
-        cooldown = self.get_shoot_cooldown()
-        time_since_last = current_time - self.last_shot_time
-        fire_rate_mult = self.upgrades.get_multiplier('fire_rate')
-        print(f"[FIRE DEBUG P{self.player_id}] Shot fired! cooldown={cooldown:.1f}ms, time_since_last={time_since_last}ms, fire_rate_mult={fire_rate_mult:.2f}, rapid_fire={self.rapid_fire}, rapid_ammo={self.rapid_fire_ammo}")
+        if LOG.enabled("fire"):
+            cooldown = self.get_shoot_cooldown()
+            time_since_last = get_game_ticks() - self.last_shot_time
+            fire_rate_mult = self.upgrades.get_multiplier('fire_rate')
+            LOG.debug("fire", "P%d Shot fired! cooldown=%.1fms, time_since_last=%sms, fire_rate_mult=%.2f, rapid_fire=%s, rapid_ammo=%s",
+                      self.player_id, cooldown, time_since_last, fire_rate_mult, self.rapid_fire, self.rapid_fire_ammo)
 
-        self.last_shot_time = pygame.time.get_ticks()
+        self.last_shot_time = get_game_ticks()
         bullets = []
         bullet_speed = -self.get_bullet_speed()
         pierce_hits = self.upgrades.get_pierce_hits()
@@ -5137,7 +5978,7 @@ class Player:
         if not self.is_alive:
             return
 
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         cooldown = self.get_shoot_cooldown()
         time_since_last = current_time - self.last_shot_time
 
@@ -5150,9 +5991,9 @@ class Player:
         if not self.shot_queued:
             self.shot_queued = True
             self.shot_queue_time = current_time
-            time_remaining = cooldown - time_since_last
-            fire_rate_mult = self.upgrades.get_multiplier('fire_rate')
-            print(f"[FIRE DEBUG P{self.player_id}] Shot QUEUED - will fire in {time_remaining:.1f}ms, fire_rate_mult={fire_rate_mult:.2f}")
+            if LOG.enabled("fire"):
+                LOG.debug("fire", "P%d Shot QUEUED - will fire in %.1fms, fire_rate_mult=%.2f",
+                          self.player_id, cooldown - time_since_last, self.upgrades.get_multiplier('fire_rate'))
         else:
             # Update queue time to keep it fresh if player keeps pressing
             self.shot_queue_time = current_time
@@ -5162,13 +6003,13 @@ class Player:
         if not self.shot_queued:
             return []
 
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
 
         # Clear stale queued shots (older than 300ms - roughly 2 cooldown cycles)
         # This prevents shots from firing after player stops pressing
         if current_time - self.shot_queue_time > 300:
             self.shot_queued = False
-            print(f"[FIRE DEBUG P{self.player_id}] Cleared STALE queued shot")
+            LOG.debug("fire", "P%d Cleared STALE queued shot", self.player_id)
             return []
 
         # Check if we can shoot now
@@ -5177,13 +6018,14 @@ class Player:
 
         if time_since_last >= cooldown:
             self.shot_queued = False
-            print(f"[FIRE DEBUG P{self.player_id}] Processing QUEUED shot (queued {current_time - self.shot_queue_time}ms ago)")
+            LOG.debug("fire", "P%d Processing QUEUED shot (queued %sms ago)", self.player_id, current_time - self.shot_queue_time)
             return self.shoot()
 
         return []
 
     def create_muzzle_flash(self, offsets):
         """Create muzzle flash particles and bright flash circles for bullet firing"""
+        rng = get_game_random()
         particles = []
         flashes = []
         base_x = self.x + self.width // 2
@@ -5194,10 +6036,10 @@ class Player:
             gun_x = base_x + offset
 
             # Create 5-8 particles per gun barrel
-            num_particles = random.randint(5, 8)
+            num_particles = rng.randint(5, 8)
             for _ in range(num_particles):
                 # Muzzle flash colors: bright white/yellow/orange
-                color = random.choice([
+                color = rng.choice([
                     (255, 255, 255),  # Bright white
                     (255, 255, 150),  # Yellow-white
                     (255, 200, 100),  # Yellow-orange
@@ -5206,13 +6048,13 @@ class Player:
 
                 # Small, fast particles shooting upward and slightly outward
                 particle = {
-                    'x': gun_x + random.uniform(-3, 3),
-                    'y': muzzle_y + random.uniform(-2, 2),
-                    'vel_x': random.uniform(-1.5, 1.5),
-                    'vel_y': random.uniform(-4, -1),  # Mostly upward
+                    'x': gun_x + rng.uniform(-3, 3),
+                    'y': muzzle_y + rng.uniform(-2, 2),
+                    'vel_x': rng.uniform(-1.5, 1.5),
+                    'vel_y': rng.uniform(-4, -1),  # Mostly upward
                     'color': color,
-                    'size': random.randint(2, 4),
-                    'life': random.randint(100, 250)  # Short-lived (100-250ms)
+                    'size': rng.randint(2, 4),
+                    'life': rng.randint(100, 250)  # Short-lived (100-250ms)
                 }
                 particles.append(particle)
 
@@ -5231,7 +6073,7 @@ class Player:
         return particles, flashes
 
     def update_power_ups(self):
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         
         # Update respawn immunity
         if self.respawn_immunity and current_time >= self.respawn_immunity_end_time:
@@ -5265,7 +6107,7 @@ class Player:
     def activate_invincibility(self):
         self.invincible = True
         duration = BASE_POWERUP_DURATION * self.get_powerup_duration_multiplier()
-        self.invincible_end_time = pygame.time.get_ticks() + duration
+        self.invincible_end_time = get_game_ticks() + duration
         
     def activate_rapid_fire(self):
         # Apply powerup duration multiplier to ammo count
@@ -5346,7 +6188,7 @@ class Player:
             
         # Draw afterimages if invincible
         if self.invincible:
-            current_time = pygame.time.get_ticks()
+            current_time = get_game_ticks()
             for i, (x, y, timestamp) in enumerate(self.afterimage_positions):
                 age = current_time - timestamp
                 alpha = max(0, 255 - (age * 255 // 500))
@@ -5364,11 +6206,11 @@ class Player:
         
         # ADDED: Draw level up indicator
         if self.level_up_indicator:
-            current_time = pygame.time.get_ticks()
+            current_time = get_game_ticks()
             if current_time - self.level_up_indicator_time < 3000:  # Show for 3 seconds
                 # Pulsing "LEVEL UP!" text above player
                 pulse = abs(math.sin(current_time * 0.01)) * 50 + 50
-                font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
+                font = get_font(20)
                 level_up_text = font.render("LEVEL UP!", True, (255, 255, int(pulse)))
                 text_rect = level_up_text.get_rect(center=(self.x + self.width // 2, self.y - 30))
                 screen.blit(level_up_text, text_rect)
@@ -5385,7 +6227,7 @@ class Player:
 
         # Boss shield visual
         if self.boss_shield_active:
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.006))
+            pulse = abs(math.sin(get_game_ticks() * 0.006))
             ring_alpha = int(130 + 100 * pulse)
             steady_alpha = 140
 
@@ -5416,7 +6258,7 @@ class Player:
         
         # Flashing effects
         flash_interval = 100
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
 
         if self.invincible and (current_time // flash_interval) % 2:
             color = PURPLE
@@ -5442,7 +6284,7 @@ class Player:
 
             # Invincibility timer (in seconds)
             if self.invincible:
-                time_left = (self.invincible_end_time - pygame.time.get_ticks()) / 1000
+                time_left = (self.invincible_end_time - get_game_ticks()) / 1000
                 powerup_texts.append(f"I:{time_left:.0f}")
 
             # Combine all powerup texts
@@ -5459,16 +6301,17 @@ class Player:
 
     def create_death_explosion(self):
         """Create a small-scale particle explosion when player dies (similar to boss explosions)"""
+        rng = get_game_random()
         explosion_particles = []
 
         # Create particles - smaller scale than boss explosions
         for _ in range(20):  # Fewer particles than boss (boss has 50-70)
             particle = {
-                'x': self.x + random.randint(-20, self.width + 20),  # Smaller spread than boss
-                'y': self.y + random.randint(-10, self.height + 10),
-                'vel_x': random.uniform(-4, 4),  # Slower than boss particles
-                'vel_y': random.uniform(-4, 2),
-                'color': random.choice([
+                'x': self.x + rng.randint(-20, self.width + 20),  # Smaller spread than boss
+                'y': self.y + rng.randint(-10, self.height + 10),
+                'vel_x': rng.uniform(-4, 4),  # Slower than boss particles
+                'vel_y': rng.uniform(-4, 2),
+                'color': rng.choice([
                     (255, 150, 0),   # Bright Orange
                     (255, 80, 80),   # Bright Red
                     (255, 255, 100), # Bright Yellow
@@ -5476,9 +6319,9 @@ class Player:
                     (100, 255, 255), # Bright Cyan
                     (255, 200, 0),   # Gold
                 ]),
-                'size': random.randint(2, 6),  # Smaller particles than boss (boss is 4-12)
-                'life': random.randint(500, 900),  # Shorter duration than boss (boss is 1000-1800)
-                'gravity': random.uniform(0.1, 0.3)  # Same gravity as boss
+                'size': rng.randint(2, 6),  # Smaller particles than boss (boss is 4-12)
+                'life': rng.randint(500, 900),  # Shorter duration than boss (boss is 1000-1800)
+                'gravity': rng.uniform(0.1, 0.3)  # Same gravity as boss
             }
             explosion_particles.append(particle)
 
@@ -5486,6 +6329,7 @@ class Player:
 
 class AlienOverlordBoss:
     def __init__(self, encounter):
+        rng = get_game_random()
         self.encounter = max(1, encounter)
         self.width = SCREEN_WIDTH // 4
         self.height = int(self.width * 1.3)
@@ -5503,9 +6347,9 @@ class AlienOverlordBoss:
         self.fireball_cooldown = int(ALIEN_BOSS_FIREBALL_COOLDOWN_BASE * (ALIEN_BOSS_FIREBALL_COOLDOWN_SCALE ** (self.encounter - 1)))
         self.fireball_speed = 6 + self.encounter
 
-        self.last_fireball = pygame.time.get_ticks() - random.randint(0, 1000)
+        self.last_fireball = get_game_ticks() - rng.randint(0, 1000)
 
-        self.direction = random.choice([-1, 1])
+        self.direction = rng.choice([-1, 1])
         self.head_speed = 1.5 + (self.encounter - 1) * 0.25
 
         self.destruction_complete = False
@@ -5516,7 +6360,7 @@ class AlienOverlordBoss:
         hand_height = 110
         offsets = [-self.width // 2 - 120, self.width // 2 + 120]
         base_y = self.y + self.head_height - hand_height // 2
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         self.hands = []
         for offset in offsets:
             hand_x = self.x + self.width // 2 + offset - hand_width // 2
@@ -5529,8 +6373,8 @@ class AlienOverlordBoss:
                 'max_health': self.max_hand_health,
                 'state': 'idle',
                 'target_x': hand_x,
-                'last_drop': current_time + random.randint(-800, 0),
-                'drop_cooldown': self.hand_drop_cooldown + random.randint(-600, 600),
+                'last_drop': current_time + rng.randint(-800, 0),
+                'drop_cooldown': self.hand_drop_cooldown + rng.randint(-600, 600),
                 'rect': pygame.Rect(hand_x, base_y, hand_width, hand_height),
                 'home_offset': offset,
                 'destroyed': False
@@ -5540,20 +6384,21 @@ class AlienOverlordBoss:
     def is_destruction_complete(self):
         if not self.destruction_complete:
             return False
-        return pygame.time.get_ticks() - self.destruction_start_time > 2000
+        return get_game_ticks() - self.destruction_start_time > 2000
 
     def create_final_explosion(self):
+        rng = get_game_random()
         explosion_particles = []
         for _ in range(60):
             particle = {
-                'x': self.x + random.randint(-100, self.width + 100),
-                'y': self.y + random.randint(-50, self.height + 50),
-                'vel_x': random.uniform(-8, 8),
-                'vel_y': random.uniform(-8, 3),
-                'color': random.choice([(255, 150, 0), (255, 80, 80), (255, 255, 100), (255, 255, 255)]),
-                'size': random.randint(4, 12),
-                'life': random.randint(1000, 1800),
-                'gravity': random.uniform(0.1, 0.3)
+                'x': self.x + rng.randint(-100, self.width + 100),
+                'y': self.y + rng.randint(-50, self.height + 50),
+                'vel_x': rng.uniform(-8, 8),
+                'vel_y': rng.uniform(-8, 3),
+                'color': rng.choice([(255, 150, 0), (255, 80, 80), (255, 255, 100), (255, 255, 255)]),
+                'size': rng.randint(4, 12),
+                'life': rng.randint(1000, 1800),
+                'gravity': rng.uniform(0.1, 0.3)
             }
             explosion_particles.append(particle)
         return explosion_particles
@@ -5588,21 +6433,22 @@ class AlienOverlordBoss:
         return False
 
     def take_main_damage(self, damage=1):
+        rng = get_game_random()
         if any(not hand['destroyed'] for hand in self.hands):
             return False
         self.health -= damage
         if self.health <= 0 and not self.destruction_complete:
             self.health = 0
             self.destruction_complete = True
-            self.destruction_start_time = pygame.time.get_ticks()
+            self.destruction_start_time = get_game_ticks()
             for _ in range(8):
                 explosion = {
-                    'x': self.x + random.randint(0, self.width),
-                    'y': self.y + random.randint(0, self.head_height),
+                    'x': self.x + rng.randint(0, self.width),
+                    'y': self.y + rng.randint(0, self.head_height),
                     'radius': 10,
-                    'growth': random.uniform(4, 8),
-                    'color': random.choice([ORANGE, RED, YELLOW, WHITE]),
-                    'life': random.randint(80, 150)
+                    'growth': rng.uniform(4, 8),
+                    'color': rng.choice([ORANGE, RED, YELLOW, WHITE]),
+                    'life': rng.randint(80, 150)
                 }
                 self.explosion_effects.append(explosion)
         return self.destruction_complete
@@ -5614,10 +6460,11 @@ class AlienOverlordBoss:
         return home_x, home_y
 
     def _start_hand_attack(self, hand, players):
+        rng = get_game_random()
         alive_players = [p for p in players if p and p.is_alive]
         if not alive_players:
             return
-        target_player = random.choice(alive_players)
+        target_player = rng.choice(alive_players)
         hand['target_x'] = target_player.x + target_player.width // 2 - hand['width'] // 2
         hand['state'] = 'seeking'
         hand['target_player'] = target_player
@@ -5664,7 +6511,7 @@ class AlienOverlordBoss:
         self.rect.y = self.y
 
         alive_players = [p for p in players if p and p.is_alive] if players else []
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
 
         # Collect player explosion particles
         player_explosion_particles = []
@@ -5717,7 +6564,7 @@ class AlienOverlordBoss:
         alive_players = [p for p in players if p and p.is_alive]
         if not alive_players:
             return []
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         if current_time - self.last_fireball < self.fireball_cooldown:
             return []
         head_center_x = self.x + self.width // 2
@@ -5733,10 +6580,7 @@ class AlienOverlordBoss:
             for explosion in self.explosion_effects:
                 if explosion['radius'] > 0:
                     alpha = int(255 * (explosion['life'] / 150))
-                    explosion_surface = pygame.Surface((explosion['radius']*2, explosion['radius']*2), pygame.SRCALPHA)
-                    pygame.draw.circle(explosion_surface, explosion['color'], (explosion['radius'], explosion['radius']), explosion['radius'])
-                    explosion_surface.set_alpha(alpha)
-                    screen.blit(explosion_surface, (explosion['x'] - explosion['radius'], explosion['y'] - explosion['radius']))
+                    EffectSprites.draw_circle(screen, explosion['color'], (explosion['x'], explosion['y']), explosion['radius'], alpha)
             return
 
         shield_active = any(not hand['destroyed'] for hand in self.hands)
@@ -5779,8 +6623,8 @@ class AlienOverlordBoss:
         pygame.draw.rect(screen, GREEN, (x, y, int(width * ratio), height))
         pygame.draw.rect(screen, WHITE, (x, y, width, height), 2)
         if label:
-            font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 14)
-            text = font.render(f"{label}: {int(ratio * 100)}%", True, WHITE)
+            font = get_font(14)
+            text = render_text(font, f"{label}: {int(ratio * 100)}%", True, WHITE)
             text_rect = text.get_rect(center=(x + width // 2, y - 18))
             screen.blit(text, text_rect)
 
@@ -5788,6 +6632,7 @@ class AlienOverlordBoss:
 class BulletHellBoss:
     """Third boss - Fast-moving bullet hell boss that creates a field of slow-falling projectiles"""
     def __init__(self, encounter):
+        rng = get_game_random()
         self.encounter = max(1, encounter)
 
         # Size - 5x the size of a normal alien
@@ -5811,12 +6656,12 @@ class BulletHellBoss:
         self.movement_zone_bottom = BULLET_HELL_BOSS_MOVEMENT_ZONE_BOTTOM
         self.target_x = self.x
         self.target_y = self.y
-        self.last_target_change = pygame.time.get_ticks()
-        self.target_change_cooldown = random.randint(800, 1500)  # Change direction frequently
+        self.last_target_change = get_game_ticks()
+        self.target_change_cooldown = rng.randint(800, 1500)  # Change direction frequently
 
         # Shooting system - rapid fire, slow falling bullets
         self.shot_cooldown = int(BULLET_HELL_BOSS_SHOT_COOLDOWN_BASE * (BULLET_HELL_BOSS_SHOT_COOLDOWN_SCALE ** (self.encounter - 1)))
-        self.last_shot = pygame.time.get_ticks() - random.randint(0, 200)
+        self.last_shot = get_game_ticks() - rng.randint(0, 200)
         self.bullet_speed = BULLET_HELL_BOSS_BULLET_SPEED
 
         # Visual effects
@@ -5829,12 +6674,14 @@ class BulletHellBoss:
 
     def _pick_new_target(self):
         """Pick a new random target position within the movement zone"""
+        rng = get_game_random()
         margin = 100  # Keep away from edges
-        self.target_x = random.randint(margin, SCREEN_WIDTH - margin - self.width)
-        self.target_y = random.randint(self.movement_zone_top, self.movement_zone_bottom - self.height)
+        self.target_x = rng.randint(margin, SCREEN_WIDTH - margin - self.width)
+        self.target_y = rng.randint(self.movement_zone_top, self.movement_zone_bottom - self.height)
 
     def update(self, players=None, sound_manager=None):
         """Update boss position and behavior"""
+        rng = get_game_random()
         if self.destruction_complete:
             # Update explosion effects during destruction
             self.explosion_effects = [exp for exp in self.explosion_effects if exp['life'] > 0]
@@ -5843,13 +6690,13 @@ class BulletHellBoss:
                 explosion['life'] -= 1
             return
 
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
 
         # Check if it's time to pick a new target
         if current_time - self.last_target_change > self.target_change_cooldown:
             self._pick_new_target()
             self.last_target_change = current_time
-            self.target_change_cooldown = random.randint(800, 1500)
+            self.target_change_cooldown = rng.randint(800, 1500)
 
         # Move towards target with smooth movement
         dx = self.target_x - self.x
@@ -5889,7 +6736,7 @@ class BulletHellBoss:
             return []
 
         bullets = []
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
 
         # Check if it's time to shoot
         if current_time - self.last_shot > self.shot_cooldown:
@@ -5926,19 +6773,20 @@ class BulletHellBoss:
 
     def start_destruction_sequence(self):
         """Start the dramatic destruction sequence"""
+        rng = get_game_random()
         self.destruction_complete = True
-        self.destruction_start_time = pygame.time.get_ticks()
+        self.destruction_start_time = get_game_ticks()
 
         # Create massive explosions
         for _ in range(25):
             explosion = {
-                'x': self.x + random.randint(-50, self.width + 50),
-                'y': self.y + random.randint(-30, self.height + 30),
+                'x': self.x + rng.randint(-50, self.width + 50),
+                'y': self.y + rng.randint(-30, self.height + 30),
                 'radius': 0,
-                'growth': random.uniform(6, 12),
-                'color': random.choice([ORANGE, RED, YELLOW, WHITE, (255, 100, 0), CYAN]),
-                'life': random.randint(80, 150),
-                'max_radius': random.randint(60, 120)
+                'growth': rng.uniform(6, 12),
+                'color': rng.choice([ORANGE, RED, YELLOW, WHITE, (255, 100, 0), CYAN]),
+                'life': rng.randint(80, 150),
+                'max_radius': rng.randint(60, 120)
             }
             self.explosion_effects.append(explosion)
 
@@ -5946,19 +6794,20 @@ class BulletHellBoss:
         """Check if destruction sequence is finished"""
         if not self.destruction_complete:
             return False
-        return pygame.time.get_ticks() - self.destruction_start_time > 2000
+        return get_game_ticks() - self.destruction_start_time > 2000
 
     def create_final_explosion(self):
         """Create a massive particle explosion when boss is completely destroyed"""
+        rng = get_game_random()
         explosion_particles = []
 
         for _ in range(70):
             particle = {
-                'x': self.x + random.randint(-100, self.width + 100),
-                'y': self.y + random.randint(-50, self.height + 50),
-                'vel_x': random.uniform(-8, 8),
-                'vel_y': random.uniform(-8, 3),
-                'color': random.choice([
+                'x': self.x + rng.randint(-100, self.width + 100),
+                'y': self.y + rng.randint(-50, self.height + 50),
+                'vel_x': rng.uniform(-8, 8),
+                'vel_y': rng.uniform(-8, 3),
+                'color': rng.choice([
                     (255, 150, 0),   # Bright Orange
                     (255, 80, 80),   # Bright Red
                     (255, 255, 100), # Bright Yellow
@@ -5966,9 +6815,9 @@ class BulletHellBoss:
                     (100, 255, 255), # Bright Cyan
                     (255, 200, 0),   # Gold
                 ]),
-                'size': random.randint(4, 12),
-                'life': random.randint(1000, 1800),
-                'gravity': random.uniform(0.1, 0.3)
+                'size': rng.randint(4, 12),
+                'life': rng.randint(1000, 1800),
+                'gravity': rng.uniform(0.1, 0.3)
             }
             explosion_particles.append(particle)
 
@@ -5991,10 +6840,7 @@ class BulletHellBoss:
             for explosion in self.explosion_effects:
                 if explosion['radius'] > 0:
                     alpha = int(255 * (explosion['life'] / 150))
-                    explosion_surface = pygame.Surface((explosion['radius']*2, explosion['radius']*2), pygame.SRCALPHA)
-                    pygame.draw.circle(explosion_surface, explosion['color'], (explosion['radius'], explosion['radius']), explosion['radius'])
-                    explosion_surface.set_alpha(alpha)
-                    screen.blit(explosion_surface, (explosion['x'] - explosion['radius'], explosion['y'] - explosion['radius']))
+                    EffectSprites.draw_circle(screen, explosion['color'], (explosion['x'], explosion['y']), explosion['radius'], alpha)
             return
 
         # Color changes based on health (green to red)
@@ -6052,8 +6898,8 @@ class BulletHellBoss:
         pygame.draw.rect(screen, GREEN, (x, y, int(width * ratio), height))
         pygame.draw.rect(screen, WHITE, (x, y, width, height), 2)
         if label:
-            font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 16)
-            text = font.render(f"{label}: {int(ratio * 100)}%", True, WHITE)
+            font = get_font(16)
+            text = render_text(font, f"{label}: {int(ratio * 100)}%", True, WHITE)
             text_rect = text.get_rect(center=(x + width // 2, y - 20))
             screen.blit(text, text_rect)
 
@@ -6061,8 +6907,9 @@ class BulletHellBoss:
 class Asteroid:
     """Falling asteroid for the Asteroid Field Boss"""
     def __init__(self, x, speed, size_multiplier):
+        rng = get_game_random()
         # Random size within range, scaled by multiplier
-        base_size = random.randint(ASTEROID_BOSS_SIZE_MIN, ASTEROID_BOSS_SIZE_MAX)
+        base_size = rng.randint(ASTEROID_BOSS_SIZE_MIN, ASTEROID_BOSS_SIZE_MAX)
         self.size = int(base_size * size_multiplier)
 
         self.x = x
@@ -6073,26 +6920,26 @@ class Asteroid:
         self.rect = pygame.Rect(int(self.x - self.size // 2), int(self.y - self.size // 2), self.size, self.size)
 
         # Visual properties for variety
-        self.color = random.choice([
+        self.color = rng.choice([
             (120, 120, 120),  # Gray
             (100, 100, 100),  # Dark gray
             (140, 140, 140),  # Light gray
             (100, 80, 70),    # Brown-gray
         ])
-        self.rotation = random.randint(0, 360)
-        self.rotation_speed = random.uniform(-2, 2)
+        self.rotation = rng.randint(0, 360)
+        self.rotation_speed = rng.uniform(-2, 2)
 
         # Near-miss XP tracking (one time per asteroid)
         self.near_miss_triggered = False
 
         # Randomized crater properties for visual variety
-        self.num_craters = random.randint(2, 5)
+        self.num_craters = rng.randint(2, 5)
         self.craters = []
         for i in range(self.num_craters):
             crater = {
-                'angle_offset': random.uniform(0, 360),  # Random angle position
-                'distance_factor': random.uniform(0.2, 0.5),  # How far from center (0-50% of radius)
-                'size_factor': random.uniform(0.15, 0.35)  # Size relative to asteroid radius
+                'angle_offset': rng.uniform(0, 360),  # Random angle position
+                'distance_factor': rng.uniform(0.2, 0.5),  # How far from center (0-50% of radius)
+                'size_factor': rng.uniform(0.15, 0.35)  # Size relative to asteroid radius
             }
             self.craters.append(crater)
 
@@ -6154,7 +7001,7 @@ class AsteroidFieldBoss:
 
         # Asteroid spawning system
         self.spawn_cooldown = int(ASTEROID_BOSS_SPAWN_COOLDOWN_BASE * (ASTEROID_BOSS_SPAWN_COOLDOWN_SCALE ** (self.encounter - 1)))
-        self.last_spawn = pygame.time.get_ticks()
+        self.last_spawn = get_game_ticks()
 
         # Asteroid speed
         self.asteroid_speed = ASTEROID_BOSS_SPEED_BASE + (self.encounter - 1) * ASTEROID_BOSS_SPEED_GROWTH
@@ -6180,17 +7027,18 @@ class AsteroidFieldBoss:
 
     def update(self, players=None, sound_manager=None):
         """Update asteroid field"""
+        rng = get_game_random()
         if self.destruction_complete:
             return []
 
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
 
         # Spawn new asteroids
         if current_time - self.last_spawn > self.spawn_cooldown:
             # Random X position across screen
-            x = random.randint(50, SCREEN_WIDTH - 50)
+            x = rng.randint(50, SCREEN_WIDTH - 50)
             # Add some speed variation
-            speed_variation = random.uniform(0.8, 1.2)
+            speed_variation = rng.uniform(0.8, 1.2)
             asteroid = Asteroid(x, self.asteroid_speed * speed_variation, self.size_multiplier)
             self.asteroids.append(asteroid)
             self.last_spawn = current_time
@@ -6224,7 +7072,7 @@ class AsteroidFieldBoss:
     def start_completion_sequence(self):
         """Start completion sequence (no explosion, just message)"""
         self.destruction_complete = True
-        self.destruction_start_time = pygame.time.get_ticks()
+        self.destruction_start_time = get_game_ticks()
         # Clear remaining asteroids
         self.asteroids.clear()
 
@@ -6232,7 +7080,7 @@ class AsteroidFieldBoss:
         """Check if completion sequence is finished"""
         if not self.destruction_complete:
             return False
-        return pygame.time.get_ticks() - self.destruction_start_time > self.completion_message_duration
+        return get_game_ticks() - self.destruction_start_time > self.completion_message_duration
 
     def create_final_explosion(self):
         """No explosion for asteroid field - return empty list"""
@@ -6263,8 +7111,8 @@ class AsteroidFieldBoss:
         """Draw the asteroid field"""
         if self.destruction_complete:
             # Show completion message
-            font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 32)
-            text = font.render("ASTEROID FIELD CLEARED!", True, GREEN)
+            font = get_font(32)
+            text = render_text(font, "ASTEROID FIELD CLEARED!", True, GREEN)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
             # Draw background box for text
@@ -6293,16 +7141,19 @@ class AsteroidFieldBoss:
         pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 3)
 
         # Label
-        font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 14)
+        font = get_font(14)
         label = f"ASTEROID FIELD: {int(health_ratio * 100)}%"
-        text = font.render(label, True, WHITE)
+        text = render_text(font, label, True, WHITE)
         text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, bar_y - 20))
         screen.blit(text, text_rect)
 
 
 class RubiksCubeBoss:
     """Fifth boss - Rotating Rubik's Cube with color-based attacks"""
+    FINAL_CENTER_SIZE = 100  # Center square doubles from 50px once it is the last one left
+
     def __init__(self, encounter):
+        rng = get_game_random()
         self.encounter = max(1, encounter)
 
         # Grid configuration
@@ -6318,9 +7169,9 @@ class RubiksCubeBoss:
 
         # Movement
         self.speed = RUBIKS_BOSS_SPEED_BASE
-        self.direction = random.choice([-1, 1])
-        self.last_direction_change = pygame.time.get_ticks()
-        self.direction_change_cooldown = random.randint(2000, 6000)  # Changed from (1000, 3000) for less frequent changes
+        self.direction = rng.choice([-1, 1])
+        self.last_direction_change = get_game_ticks()
+        self.direction_change_cooldown = rng.randint(2000, 6000)  # Changed from (1000, 3000) for less frequent changes
 
         # Rotation
         self.rotation_angle = 0
@@ -6359,7 +7210,7 @@ class RubiksCubeBoss:
                     color = self.center_color
                 else:
                     max_health = square_max_health
-                    color = random.choice(self.rubiks_colors)
+                    color = rng.choice(self.rubiks_colors)
 
                 square = {
                     'row': row,
@@ -6371,16 +7222,22 @@ class RubiksCubeBoss:
                     'is_center': is_center
                 }
                 self.squares.append(square)
+        self.squares_remaining = len(self.squares) - 1  # Non-center squares not yet destroyed
+
+        # cos/sin of rotation_angle, refreshed by get_rotation() when the angle changes
+        self.rotation_cache_angle = None
+        self.rotation_cos = 1.0
+        self.rotation_sin = 0.0
 
         # Attack phase system
         self.current_phase = 'mixed'  # 'mixed' or 'attack'
         self.current_attack_color = None
-        self.phase_start_time = pygame.time.get_ticks()
+        self.phase_start_time = get_game_ticks()
         self.mixed_phase_duration = RUBIKS_BOSS_MIXED_PHASE_DURATION
         self.attack_phase_duration = RUBIKS_BOSS_ATTACK_PHASE_DURATION
 
         # Attack cooldowns
-        self.last_attack_time = pygame.time.get_ticks()
+        self.last_attack_time = get_game_ticks()
         self.red_cooldown = RUBIKS_BOSS_RED_SHOOT_COOLDOWN
         self.blue_cooldown = RUBIKS_BOSS_BLUE_SHOOT_COOLDOWN
         self.yellow_cooldown = RUBIKS_BOSS_YELLOW_SHOOT_COOLDOWN
@@ -6415,6 +7272,7 @@ class RubiksCubeBoss:
 
     def update(self, players=None, sound_manager=None):
         """Update boss movement, rotation, and attack phases"""
+        rng = get_game_random()
         if self.destruction_complete:
             # Update explosion effects
             self.explosion_effects = [exp for exp in self.explosion_effects if exp['life'] > 0]
@@ -6426,9 +7284,9 @@ class RubiksCubeBoss:
             return []
 
         # Check if only center square remains (final phase)
-        only_center_remains = all(sq['destroyed'] for sq in self.squares if not sq['is_center'])
+        only_center_remains = self.squares_remaining == 0
 
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
 
         # Movement (left/right like UFO boss)
         # Stop movement during orange attack, double speed when only center remains
@@ -6443,10 +7301,10 @@ class RubiksCubeBoss:
                 self.direction *= -1
 
             if current_time - self.last_direction_change > self.direction_change_cooldown:
-                if random.randint(1, 100) <= 15:  # Reduced from 30% to 15% chance
+                if rng.randint(1, 100) <= 15:  # Reduced from 30% to 15% chance
                     self.direction *= -1
                     self.last_direction_change = current_time
-                    self.direction_change_cooldown = random.randint(2000, 6000)  # Changed from (1000, 3000)
+                    self.direction_change_cooldown = rng.randint(2000, 6000)  # Changed from (1000, 3000)
 
         # Update center position
         self.center_x = self.x + self.total_size // 2
@@ -6481,9 +7339,9 @@ class RubiksCubeBoss:
                         'White': (255, 255, 255),
                         'Orange': (255, 140, 0)
                     }
-                    self.current_attack_color = color_map.get(self.debug_forced_attack_color, random.choice(self.rubiks_colors))
+                    self.current_attack_color = color_map.get(self.debug_forced_attack_color, rng.choice(self.rubiks_colors))
                 else:
-                    self.current_attack_color = random.choice(self.rubiks_colors)
+                    self.current_attack_color = rng.choice(self.rubiks_colors)
 
                 self.phase_start_time = current_time
                 self.last_attack_time = current_time
@@ -6508,7 +7366,7 @@ class RubiksCubeBoss:
                 # Randomize colors for non-destroyed, non-center squares
                 for square in self.squares:
                     if not square['destroyed'] and not square['is_center']:
-                        square['color'] = random.choice(self.rubiks_colors)
+                        square['color'] = rng.choice(self.rubiks_colors)
 
                 # Clear special attacks
                 self.green_laser = None
@@ -6519,11 +7377,12 @@ class RubiksCubeBoss:
 
     def shoot(self, players, sound_manager=None):
         """Generate attacks based on current color"""
+        rng = get_game_random()
         if self.destruction_complete or self.current_phase != 'attack':
             return []
 
         bullets = []
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
 
         # Get closest alive player
         alive_players = [p for p in players if p.is_alive]
@@ -6577,7 +7436,7 @@ class RubiksCubeBoss:
         elif self.current_attack_color == (255, 255, 0):  # Yellow - slow falling balls
             if current_time - self.last_attack_time >= self.yellow_cooldown:
                 # Spawn at random X position near boss
-                spawn_x = self.center_x + random.randint(-100, 100)
+                spawn_x = self.center_x + rng.randint(-100, 100)
                 bullet = YellowBall(spawn_x, self.center_y, 1.0)
                 bullets.append(bullet)
                 self.last_attack_time = current_time
@@ -6641,7 +7500,7 @@ class RubiksCubeBoss:
         grid_center_y = self.total_size // 2
 
         rotated_corners = []
-        angle_rad = math.radians(self.rotation_angle)
+        cos_a, sin_a = self.get_rotation()
 
         for corner_x, corner_y in corners:
             # Translate to origin (relative to grid center)
@@ -6649,8 +7508,8 @@ class RubiksCubeBoss:
             rel_y = corner_y - grid_center_y
 
             # Rotate
-            rotated_x = rel_x * math.cos(angle_rad) - rel_y * math.sin(angle_rad)
-            rotated_y = rel_x * math.sin(angle_rad) + rel_y * math.cos(angle_rad)
+            rotated_x = rel_x * cos_a - rel_y * sin_a
+            rotated_y = rel_x * sin_a + rel_y * cos_a
 
             # Translate back and add boss position
             final_x = rotated_x + grid_center_x + self.x
@@ -6660,25 +7519,42 @@ class RubiksCubeBoss:
 
         return rotated_corners
 
-    def point_in_polygon(self, point, polygon):
-        """Check if a point is inside a polygon using ray casting"""
-        x, y = point
-        n = len(polygon)
-        inside = False
-
-        p1x, p1y = polygon[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-
-        return inside
+    def get_rotation(self):
+        """cos and sin of the current rotation angle, recomputed only when the angle changes"""
+        if self.rotation_cache_angle != self.rotation_angle:
+            angle_rad = math.radians(self.rotation_angle)
+            self.rotation_cos = math.cos(angle_rad)
+            self.rotation_sin = math.sin(angle_rad)
+            self.rotation_cache_angle = self.rotation_angle
+        return self.rotation_cos, self.rotation_sin
+
+    def get_square_at(self, x, y):
+        """Live square under a screen point, found by rotating the point back into grid space"""
+        cos_a, sin_a = self.get_rotation()
+        grid_center = self.total_size // 2
+        rel_x = x - (self.x + grid_center)
+        rel_y = y - (self.y + grid_center)
+        local_x = rel_x * cos_a + rel_y * sin_a + grid_center
+        local_y = rel_y * cos_a - rel_x * sin_a + grid_center
+
+        center_pos = self.grid_size // 2
+        if self.squares_remaining == 0:
+            # Final phase: only the enlarged center square is left
+            square = self.squares[center_pos * self.grid_size + center_pos]
+            low = center_pos * self.square_size - (self.FINAL_CENTER_SIZE - self.square_size) / 2
+            high = low + self.FINAL_CENTER_SIZE
+            if not square['destroyed'] and low < local_x <= high and low < local_y <= high:
+                return square
+            return None
+
+        # A square covers (col * size, (col + 1) * size], the same edges the old polygon test used
+        col = math.ceil(local_x / self.square_size) - 1
+        row = math.ceil(local_y / self.square_size) - 1
+        if 0 <= row < self.grid_size and 0 <= col < self.grid_size:
+            square = self.squares[row * self.grid_size + col]
+            if not square['destroyed']:
+                return square
+        return None
 
     def take_turret_damage(self, turret_index, damage=1):
         """Not used for this boss"""
@@ -6693,44 +7569,33 @@ class RubiksCubeBoss:
 
     def take_square_damage(self, bullet_rect, damage=1):
         """Check if bullet hit any square and apply damage"""
-        bullet_center = (bullet_rect.centerx, bullet_rect.centery)
-
-        # Check if only center square remains (final phase)
-        only_center_remains = all(sq['destroyed'] for sq in self.squares if not sq['is_center'])
-
-        # Check each square
-        for square in self.squares:
-            if square['destroyed']:
-                continue
-
-            # Final phase: use enlarged size for center square
-            size_override = None
-            if square['is_center'] and only_center_remains:
-                size_override = 100  # Double from 50px to 100px
-
-            # Get rotated corners for this square (with size override for final phase)
-            corners = self.get_rotated_square_corners(square['row'], square['col'], size_override)
-
-            # Check if bullet center is inside this square's polygon
-            if self.point_in_polygon(bullet_center, corners):
-                square['health'] -= damage
+        square = self.get_square_at(bullet_rect.centerx, bullet_rect.centery)
+        if square is None:
+            return False
 
-                if square['health'] <= 0:
-                    square['destroyed'] = True
+        # Final phase: use enlarged size for center square
+        size_override = None
+        if square['is_center'] and self.squares_remaining == 0:
+            size_override = self.FINAL_CENTER_SIZE
 
-                    # Create particle explosion
-                    self.create_square_explosion(square, size_override)
+        square['health'] -= damage
+        if square['health'] <= 0:
+            square['destroyed'] = True
+            if not square['is_center']:
+                self.squares_remaining -= 1
 
-                    # Check if center was destroyed (win condition)
-                    if square['is_center']:
-                        self.start_destruction()
+            # Create particle explosion
+            self.create_square_explosion(square, size_override)
 
-                return True  # Return true if we hit ANY square (damaged or destroyed)
+            # Check if center was destroyed (win condition)
+            if square['is_center']:
+                self.start_destruction()
 
-        return False
+        return True  # Return true if we hit ANY square (damaged or destroyed)
 
     def create_square_explosion(self, square, size_override=None):
         """Create particle explosion for destroyed square"""
+        rng = get_game_random()
         # Get center of square (use size override for enlarged final phase center)
         corners = self.get_rotated_square_corners(square['row'], square['col'], size_override)
         center_x = sum(c[0] for c in corners) / 4
@@ -6741,23 +7606,23 @@ class RubiksCubeBoss:
 
         # Create particles (similar to enemy explosions)
         for _ in range(num_particles):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 4)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(1, 4)
             particle = {
                 'x': center_x,
                 'y': center_y,
                 'vel_x': math.cos(angle) * speed,
                 'vel_y': math.sin(angle) * speed,
-                'life': random.randint(30, 60),
+                'life': rng.randint(30, 60),
                 'color': square['color'],
-                'size': random.randint(2, 5)
+                'size': rng.randint(2, 5)
             }
             self.explosion_effects.append(particle)
 
     def get_turret_rects(self):
         """Return rects for all non-destroyed squares (for hit detection)"""
         # Check if only center square remains (final phase)
-        only_center_remains = all(sq['destroyed'] for sq in self.squares if not sq['is_center'])
+        only_center_remains = self.squares_remaining == 0
 
         rects = []
         for i, square in enumerate(self.squares):
@@ -6765,7 +7630,7 @@ class RubiksCubeBoss:
                 # Final phase: use enlarged size for center square
                 size_override = None
                 if square['is_center'] and only_center_remains:
-                    size_override = 100  # Double from 50px to 100px
+                    size_override = self.FINAL_CENTER_SIZE
 
                 # Get rotated corners (with size override for final phase)
                 corners = self.get_rotated_square_corners(square['row'], square['col'], size_override)
@@ -6788,7 +7653,7 @@ class RubiksCubeBoss:
     def start_destruction(self):
         """Start boss destruction sequence"""
         self.destruction_complete = True
-        self.destruction_start_time = pygame.time.get_ticks()
+        self.destruction_start_time = get_game_ticks()
 
         # Create final explosion
         self.create_final_explosion()
@@ -6797,26 +7662,27 @@ class RubiksCubeBoss:
         """Check if destruction animation is complete"""
         if not self.destruction_complete:
             return False
-        return pygame.time.get_ticks() - self.destruction_start_time > 2000  # 2 second animation
+        return get_game_ticks() - self.destruction_start_time > 2000  # 2 second animation
 
     def create_final_explosion(self):
         """Create large explosion effect when boss is destroyed"""
+        rng = get_game_random()
         particles = []
 
         # Create many particles from center
         for _ in range(50):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(2, 8)
             particle = {
                 'x': self.center_x,
                 'y': self.center_y,
                 'vel_x': math.cos(angle) * speed,
                 'vel_y': math.sin(angle) * speed,
-                'life': random.randint(60, 120),
-                'color': random.choice(self.rubiks_colors + [self.center_color]),
-                'size': random.randint(3, 8),
-                'radius': random.randint(10, 30),
-                'growth': random.uniform(0.5, 2)
+                'life': rng.randint(60, 120),
+                'color': rng.choice(self.rubiks_colors + [self.center_color]),
+                'size': rng.randint(3, 8),
+                'radius': rng.randint(10, 30),
+                'growth': rng.uniform(0.5, 2)
             }
             self.explosion_effects.append(particle)
 
@@ -6847,6 +7713,8 @@ class RubiksCubeBoss:
         crack_color = (50, 50, 50)  # Dark gray cracks
 
         # Helper function to transform local point to world space (rotated and scaled)
+        cos_a, sin_a = self.get_rotation()
+
         def rotate_point(local_x, local_y):
             # Scale the coordinates first (from 0-50 to 0-actual_size)
             scaled_x = local_x * scale
@@ -6857,9 +7725,8 @@ class RubiksCubeBoss:
             rel_y = scaled_y - actual_size // 2
 
             # Rotate by current rotation angle
-            angle_rad = math.radians(self.rotation_angle)
-            rotated_x = rel_x * math.cos(angle_rad) - rel_y * math.sin(angle_rad)
-            rotated_y = rel_x * math.sin(angle_rad) + rel_y * math.cos(angle_rad)
+            rotated_x = rel_x * cos_a - rel_y * sin_a
+            rotated_y = rel_x * sin_a + rel_y * cos_a
 
             # Translate to world position
             world_x = center_x + rotated_x
@@ -6945,7 +7812,7 @@ class RubiksCubeBoss:
         show_warning_flash = False
         warning_flash_color = None
         if self.green_laser_warning:
-            current_time = pygame.time.get_ticks()
+            current_time = get_game_ticks()
             warning_elapsed = current_time - self.green_laser_warning_start_time
             warning_progress = warning_elapsed / self.green_warning_duration  # 0.0 to 1.0
 
@@ -6959,7 +7826,7 @@ class RubiksCubeBoss:
                 warning_flash_color = (255, 255, 0) if (warning_elapsed // 100) % 2 == 0 else (255, 255, 255)
 
         # Check if only center square remains (final phase)
-        only_center_remains = all(sq['destroyed'] for sq in self.squares if not sq['is_center'])
+        only_center_remains = self.squares_remaining == 0
 
         # Draw each square with rotation
         for square in self.squares:
@@ -6969,7 +7836,7 @@ class RubiksCubeBoss:
             # Final phase: enlarge center square and change behavior
             size_override = None
             if square['is_center'] and only_center_remains:
-                size_override = 100  # Double from 50px to 100px
+                size_override = self.FINAL_CENTER_SIZE
 
             # Get rotated corners (with size override for final phase center)
             corners = self.get_rotated_square_corners(square['row'], square['col'], size_override)
@@ -6983,7 +7850,7 @@ class RubiksCubeBoss:
                     base_color = self.center_color  # Light blue during mixed phase
 
                 # Add slow pulsing flash effect
-                current_time = pygame.time.get_ticks()
+                current_time = get_game_ticks()
                 pulse = (math.sin(current_time / 500) + 1) / 2  # 0.0 to 1.0, slow pulse
                 flash_intensity = int(pulse * 100)  # 0 to 100
 
@@ -7034,9 +7901,9 @@ class RubiksCubeBoss:
             pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 3)
 
             # Label
-            font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 14)
+            font = get_font(14)
             label = f"RUBIK'S CUBE CORE: {int(health_ratio * 100)}%"
-            text = font.render(label, True, WHITE)
+            text = render_text(font, label, True, WHITE)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, bar_y - 20))
             screen.blit(text, text_rect)
 
@@ -7053,6 +7920,7 @@ class RubiksCubeBoss:
 class SnakeBoss:
     """Sixth boss - Snake/Dragon with segmented body, serpentine movement, and fireball attacks"""
     def __init__(self, encounter):
+        rng = get_game_random()
         self.encounter = max(1, encounter)
 
         # Configuration
@@ -7068,32 +7936,26 @@ class SnakeBoss:
         self.head_max_health = self.head_health
 
         # Movement state - Moldorm-style constant turning
-        self.angle = random.uniform(0, 360)  # Current movement direction in degrees
-        self.turn_direction = random.choice([-1, 1])  # -1 = turn left, 1 = turn right
+        self.angle = rng.uniform(0, 360)  # Current movement direction in degrees
+        self.turn_direction = rng.choice([-1, 1])  # -1 = turn left, 1 = turn right
         self.turn_speed = 0  # Will be calculated in initialization
 
         # Random direction changes for erratic movement
-        self.last_direction_change = pygame.time.get_ticks()
-        self.direction_change_interval = random.randint(1000, 2500)  # 1-2.5 seconds
+        self.last_direction_change = get_game_ticks()
+        self.direction_change_interval = rng.randint(1000, 2500)  # 1-2.5 seconds
 
-        # Initialize segments (list of positions, head is first)
+        # Initialize segments (head is first)
         # Start in middle of screen
         start_x = SCREEN_WIDTH // 2
         start_y = 200
 
-        # Segments store position history for smooth following
-        self.segments = []
-
-        # Head
-        self.segments.append({
-            'x': start_x,
-            'y': start_y,
-            'is_head': True,
-            'radius': self.head_radius
-        })
+        # Segment columns, head first: centers and radii in parallel arrays so collision
+        # tests walk flat numbers instead of per-segment dicts
+        self.segment_xs = array.array('d', [start_x])
+        self.segment_ys = array.array('d', [start_y])
+        self.segment_radii = array.array('i', [self.head_radius])
 
         # Body segments - spacing accounts for varying radii
-        spacing_overlap_factor = 0.9  # 0.9 = slight overlap
         cumulative_x = start_x
 
         for i in range(self.num_segments):
@@ -7106,32 +7968,25 @@ class SnakeBoss:
                 prev_radius = self.segment_radius
 
             curr_radius = self.segment_radius
-            spacing = (prev_radius + curr_radius) * spacing_overlap_factor
+            spacing = (prev_radius + curr_radius) * SNAKE_BOSS_SPACING_OVERLAP
             cumulative_x -= spacing
 
-            self.segments.append({
-                'x': cumulative_x,
-                'y': start_y,
-                'is_head': False,
-                'radius': self.segment_radius
-            })
+            self.segment_xs.append(cumulative_x)
+            self.segment_ys.append(start_y)
+            self.segment_radii.append(self.segment_radius)
 
-        # Position history for smooth segment following
-        self.position_history = []
-        total_initial_distance = 0.0
-        for i in range(1, len(self.segments)):
-            prev_radius = self.segments[i - 1]['radius']
-            curr_radius = self.segments[i]['radius']
-            total_initial_distance += (prev_radius + curr_radius) * spacing_overlap_factor
+        self.update_follow_distances()
 
-        max_initial_distance = int(math.ceil(total_initial_distance))
+        # Ring buffer of (x, y) head positions, newest last, for smooth segment following
+        self.position_history = collections.deque()
+        max_initial_distance = int(math.ceil(self.follow_distances[-1]))
         for dist in range(max_initial_distance, -1, -1):
-            self.position_history.append({'x': start_x - dist, 'y': start_y})
+            self.position_history.append((start_x - dist, start_y))
 
         # Calculate turn radius and turn speed based on initial segment count (stays constant)
         # Turn radius affected by curve strength: higher curve strength = sharper turns = smaller radius
         # Turn radius = (starting segments * segment radius) / curve_strength
-        self.initial_segment_count = len(self.segments)
+        self.initial_segment_count = len(self.segment_xs)
         self.turn_radius = (self.initial_segment_count * self.segment_radius) / SNAKE_BOSS_CURVE_STRENGTH
 
         # Calculate turn speed based on movement speed and turn radius
@@ -7139,14 +7994,14 @@ class SnakeBoss:
         self.turn_speed = (self.speed / self.turn_radius) * 57.2958  # 180/pi ≈ 57.2958
 
         # Attack state
-        self.last_fireball_time = pygame.time.get_ticks()
+        self.last_fireball_time = get_game_ticks()
         self.fireball_cooldown = SNAKE_BOSS_FIREBALL_COOLDOWN
 
         # Final phase (when only head remains)
         self.final_phase = False
 
-        # Particles for segment destruction
-        self.particles = []
+        # Particles for segment destruction (life counts frames; drawn opaque)
+        self.particles = ParticleSystem(alpha_divisor=None)
 
         # Boss system compatibility attributes
         self.destruction_complete = False
@@ -7155,16 +8010,39 @@ class SnakeBoss:
         self.y = start_y - self.head_radius  # Top edge of head
         self.width = self.head_radius * 2
         self.height = self.head_radius * 2
+        self.update_bounds()
+
+    def update_follow_distances(self):
+        """Distance along the head's path at which each segment sits (head is 0)"""
+        self.follow_distances = array.array('d', [0])
+        cumulative_distance = 0
+        for i in range(1, len(self.segment_radii)):
+            # Proper center-to-center distance accounting for both radii
+            segment_spacing = (self.segment_radii[i - 1] + self.segment_radii[i]) * SNAKE_BOSS_SPACING_OVERLAP
+            cumulative_distance += segment_spacing
+            self.follow_distances.append(cumulative_distance)
+
+    def update_bounds(self):
+        """Bounding circle around all segments so far-away collision tests are rejected in one check"""
+        xs = self.segment_xs
+        ys = self.segment_ys
+        self.bounds_x = (min(xs) + max(xs)) / 2
+        self.bounds_y = (min(ys) + max(ys)) / 2
+        radius = 0
+        for x, y, segment_radius in zip(xs, ys, self.segment_radii):
+            radius = max(radius, math.hypot(x - self.bounds_x, y - self.bounds_y) + segment_radius)
+        self.bounds_radius = radius
 
     def get_nearest_player(self, players):
         """Find the nearest living player to the head"""
-        head = self.segments[0]
+        head_x = self.segment_xs[0]
+        head_y = self.segment_ys[0]
         nearest = None
         min_dist = float('inf')
 
         for player in players:
             if player.is_alive:
-                dist = math.sqrt((player.x - head['x'])**2 + (player.y - head['y'])**2)
+                dist = math.sqrt((player.x - head_x)**2 + (player.y - head_y)**2)
                 if dist < min_dist:
                     min_dist = dist
                     nearest = player
@@ -7173,25 +8051,20 @@ class SnakeBoss:
 
     def update(self, players, sound_manager):
         """Update snake position, movement, and attacks"""
+        rng = get_game_random()
         # Don't update movement if boss is destroyed
         if self.destruction_complete:
             # Only update particles during destruction
-            for particle in self.particles[:]:
-                particle['x'] += particle['vx']
-                particle['y'] += particle['vy']
-                particle['life'] -= 1
-
-                if particle['life'] <= 0:
-                    self.particles.remove(particle)
+            self.particles.update(1)
             return None
 
-        if not self.segments:
+        if not self.segment_xs:
             return None
 
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
 
         # Check if in final phase (only head remains)
-        if len(self.segments) == 1 and not self.final_phase:
+        if len(self.segment_xs) == 1 and not self.final_phase:
             self.final_phase = True
             self.speed *= SNAKE_BOSS_FINAL_PHASE_SPEED_MULTIPLIER
             self.fireball_cooldown = int(self.fireball_cooldown / SNAKE_BOSS_FINAL_PHASE_FIREBALL_MULTIPLIER)
@@ -7202,7 +8075,7 @@ class SnakeBoss:
         if current_time - self.last_direction_change > self.direction_change_interval:
             self.turn_direction *= -1  # Flip between left (-1) and right (1)
             self.last_direction_change = current_time
-            self.direction_change_interval = random.randint(1000, 2500)  # 1-2.5 seconds
+            self.direction_change_interval = rng.randint(1000, 2500)  # 1-2.5 seconds
 
         # Moldorm-style movement: Always turning in a circle
         # Apply constant turning
@@ -7210,13 +8083,12 @@ class SnakeBoss:
         self.angle = self.angle % 360
 
         # Move head in current direction
-        head = self.segments[0]
         angle_rad = math.radians(self.angle)
-        new_x = head['x'] + math.cos(angle_rad) * self.speed
-        new_y = head['y'] + math.sin(angle_rad) * self.speed
+        new_x = self.segment_xs[0] + math.cos(angle_rad) * self.speed
+        new_y = self.segment_ys[0] + math.sin(angle_rad) * self.speed
 
         # Check for screen edge collisions and bounce (reflect angle + reverse turn)
-        margin = head['radius']
+        margin = self.segment_radii[0]
         hit_left_or_right = False
         hit_top_or_bottom = False
 
@@ -7240,96 +8112,73 @@ class SnakeBoss:
             self.turn_direction *= -1  # Also reverse turn direction
 
         # Clamp position to screen bounds (full screen access)
-        head['x'] = max(margin, min(SCREEN_WIDTH - margin, new_x))
-        head['y'] = max(100 + margin, min(SCREEN_HEIGHT - margin, new_y))
+        head_x = max(margin, min(SCREEN_WIDTH - margin, new_x))
+        head_y = max(100 + margin, min(SCREEN_HEIGHT - margin, new_y))
+        self.segment_xs[0] = head_x
+        self.segment_ys[0] = head_y
 
         # Store head position in history for followers
-        self.position_history.append({'x': head['x'], 'y': head['y']})
-
-        # Update body segments to follow the head's historical path
-        # Calculate cumulative target distances for each segment based on actual radii
-        spacing_overlap_factor = 0.9  # 0.9 = slight overlap, 1.0 = touching, >1.0 = gap
-
-        target_distances = [0]  # Head is at distance 0
-        cumulative_distance = 0
-
-        for i in range(1, len(self.segments)):
-            prev_radius = self.segments[i-1]['radius']
-            curr_radius = self.segments[i]['radius']
-            # Proper center-to-center distance accounting for both radii
-            segment_spacing = (prev_radius + curr_radius) * spacing_overlap_factor
-            cumulative_distance += segment_spacing
-            target_distances.append(cumulative_distance)
+        history = self.position_history
+        history.append((head_x, head_y))
 
         # Keep history length manageable (enough for all segments to follow)
-        required_history = int(math.ceil(cumulative_distance / max(self.speed, 1))) + 1
-        max_history = max(len(self.segments) * 10, required_history)
-        if len(self.position_history) > max_history:
-            self.position_history = self.position_history[-max_history:]
-
-        # Each segment follows the exact path the head took, positioned at a specific distance behind
-        if len(self.position_history) > 1:
-            for i in range(1, len(self.segments)):
-                segment = self.segments[i]
-
-                # Get pre-calculated target distance for this segment
-                target_distance = target_distances[i]
-
-                # Traverse position history backwards to find the point at target_distance
-                cumulative_distance = 0.0
-                target_pos = None
-
-                for hist_idx in range(len(self.position_history) - 1, 0, -1):
-                    curr_pos = self.position_history[hist_idx]
-                    prev_pos = self.position_history[hist_idx - 1]
-
-                    # Calculate distance between these two history points
-                    dx = curr_pos['x'] - prev_pos['x']
-                    dy = curr_pos['y'] - prev_pos['y']
-                    segment_dist = math.sqrt(dx * dx + dy * dy)
-
-                    # Check if target distance falls within this segment
-                    if cumulative_distance + segment_dist >= target_distance:
-                        # Interpolate between prev_pos and curr_pos
-                        remaining_dist = target_distance - cumulative_distance
-                        if segment_dist > 0:
-                            t = remaining_dist / segment_dist
-                            target_pos = {
-                                'x': prev_pos['x'] + dx * t,
-                                'y': prev_pos['y'] + dy * t
-                            }
-                        else:
-                            target_pos = prev_pos
-                        break
+        target_distances = self.follow_distances
+        required_history = int(math.ceil(target_distances[-1] / max(self.speed, 1))) + 1
+        max_history = max(len(self.segment_xs) * 10, required_history)
+        while len(history) > max_history:
+            history.popleft()
+
+        # Each segment follows the exact path the head took, positioned at a specific distance
+        # behind. Target distances increase down the body, so one walk back through the
+        # history places every segment.
+        if len(history) > 1:
+            segment_count = len(self.segment_xs)
+            i = 1
+            cumulative_distance = 0.0
+            curr_x, curr_y = history[-1]
+            for hist_idx in range(len(history) - 2, -1, -1):
+                if i >= segment_count:
+                    break
+                prev_x, prev_y = history[hist_idx]
+
+                # Calculate distance between these two history points
+                dx = curr_x - prev_x
+                dy = curr_y - prev_y
+                segment_dist = math.sqrt(dx * dx + dy * dy)
+
+                # Place every segment whose target distance falls within this step
+                while i < segment_count and cumulative_distance + segment_dist >= target_distances[i]:
+                    # Interpolate between prev and curr
+                    if segment_dist > 0:
+                        t = (target_distances[i] - cumulative_distance) / segment_dist
+                        self.segment_xs[i] = prev_x + dx * t
+                        self.segment_ys[i] = prev_y + dy * t
+                    else:
+                        self.segment_xs[i] = prev_x
+                        self.segment_ys[i] = prev_y
+                    i += 1
 
-                    cumulative_distance += segment_dist
+                cumulative_distance += segment_dist
+                curr_x = prev_x
+                curr_y = prev_y
 
-                # If we found a valid position in history, move segment there
-                if target_pos:
-                    segment['x'] = target_pos['x']
-                    segment['y'] = target_pos['y']
-                else:
-                    # Fallback: not enough history yet, use oldest position
-                    if self.position_history:
-                        segment['x'] = self.position_history[0]['x']
-                        segment['y'] = self.position_history[0]['y']
+            # Fallback: not enough history yet, use oldest position
+            oldest_x, oldest_y = history[0]
+            for i in range(i, segment_count):
+                self.segment_xs[i] = oldest_x
+                self.segment_ys[i] = oldest_y
+        self.update_bounds()
 
         # Update particles
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        self.particles.update(1)
 
         # Update position attributes for boss system compatibility
-        if self.segments:
-            head = self.segments[0]
-            self.x = head['x'] - head['radius']
-            self.y = head['y'] - head['radius']
-            self.width = head['radius'] * 2
-            self.height = head['radius'] * 2
+        if self.segment_xs:
+            head_radius = self.segment_radii[0]
+            self.x = self.segment_xs[0] - head_radius
+            self.y = self.segment_ys[0] - head_radius
+            self.width = head_radius * 2
+            self.height = head_radius * 2
 
         # Return None (no explosion particles for now)
         return None
@@ -7340,13 +8189,12 @@ class SnakeBoss:
         if self.destruction_complete:
             return []
 
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         bullets = []
 
         # Don't fire if snake is in bottom 25% of screen (prevents undodgeable lateral shots)
-        head = self.segments[0]
         bottom_threshold = SCREEN_HEIGHT * 0.75
-        if head['y'] >= bottom_threshold:
+        if self.segment_ys[0] >= bottom_threshold:
             return bullets  # Too low to fire
 
         if current_time - self.last_fireball_time > self.fireball_cooldown:
@@ -7362,11 +8210,12 @@ class SnakeBoss:
 
     def shoot_fireball(self, target_player):
         """Shoot a large fireball from head toward target player"""
-        head = self.segments[0]
+        head_x = self.segment_xs[0]
+        head_y = self.segment_ys[0]
 
         # Calculate direction to player
-        dx = target_player.x - head['x']
-        dy = target_player.y - head['y']
+        dx = target_player.x - head_x
+        dy = target_player.y - head_y
         dist = math.sqrt(dx * dx + dy * dy)
 
         if dist > 0:
@@ -7375,7 +8224,7 @@ class SnakeBoss:
 
             # Create large fireball (same size as Rubik's orange fireballs)
             fireball_speed = 5
-            return OrangeFireball(head['x'], head['y'], angle_degrees, fireball_speed,
+            return OrangeFireball(head_x, head_y, angle_degrees, fireball_speed,
                                 radius=SNAKE_BOSS_FIREBALL_RADIUS)
         return None
 
@@ -7383,22 +8232,28 @@ class SnakeBoss:
         """Check if bullet hits any segment, returns 'damaged', 'blocked', or None"""
         # Only the tail (last segment) can be damaged, or head in final phase
 
-        # Check each segment for collision
-        for i, segment in enumerate(self.segments):
-            dx = bullet_x - segment['x']
-            dy = bullet_y - segment['y']
-            dist = math.sqrt(dx * dx + dy * dy)
+        # Whole-snake bounding circle first: most bullets are nowhere near it
+        dx = bullet_x - self.bounds_x
+        dy = bullet_y - self.bounds_y
+        if dx * dx + dy * dy >= self.bounds_radius * self.bounds_radius:
+            return None
+
+        # Check each segment for collision (squared distances, no sqrt)
+        tail = len(self.segment_xs) - 1
+        for i, segment_radius in enumerate(self.segment_radii):
+            dx = bullet_x - self.segment_xs[i]
+            dy = bullet_y - self.segment_ys[i]
 
-            if dist < segment['radius']:
+            if dx * dx + dy * dy < segment_radius * segment_radius:
                 # Hit a segment
-                if i == len(self.segments) - 1:
+                if i == tail:
                     # Hit the tail - this is valid damage
                     if self.final_phase:
                         # In final phase, head takes damage
                         self.head_health -= 1
                         return 'damaged'  # Hit vulnerable part - award XP
                     else:
-                        if len(self.segments) == 1:
+                        if tail == 0:
                             # Transition to final phase without removing the head
                             self.final_phase = True
                             self.speed *= SNAKE_BOSS_FINAL_PHASE_SPEED_MULTIPLIER
@@ -7409,9 +8264,12 @@ class SnakeBoss:
                             self.turn_speed = (self.speed / self.turn_radius) * 57.2958
                             self.head_health -= 1
                             return 'damaged'  # Hit vulnerable part - award XP
-                        # Remove tail segment
-                        self.create_segment_explosion(segment['x'], segment['y'])
-                        self.segments.pop()
+                        # Remove tail segment (the bounding circle still encloses the rest)
+                        self.create_segment_explosion(self.segment_xs[i], self.segment_ys[i])
+                        self.segment_xs.pop()
+                        self.segment_ys.pop()
+                        self.segment_radii.pop()
+                        self.follow_distances.pop()
                         return 'damaged'  # Hit vulnerable part - award XP
                 else:
                     # Hit a non-tail segment - consume bullet but no damage/XP
@@ -7421,47 +8279,54 @@ class SnakeBoss:
 
     def create_segment_explosion(self, x, y):
         """Create particle explosion when segment is destroyed"""
+        rng = get_game_random()
         for _ in range(15):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 4)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': random.randint(20, 40),
-                'color': (255, 255, 0)  # Yellow
-            })
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(1, 4)
+            life = rng.randint(20, 40)
+            self.particles.add(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
+                               life, 3, (255, 255, 0))  # Yellow
 
     def collides_with_player(self, player):
         """Check if any part of snake collides with player"""
         if not player.is_alive:
             return False
 
-        for segment in self.segments:
-            dx = player.x - segment['x']
-            dy = player.y - segment['y']
-            dist = math.sqrt(dx * dx + dy * dy)
+        # Player collision radius is roughly half their width
+        player_radius = 20
+        dx = player.x - self.bounds_x
+        dy = player.y - self.bounds_y
+        reach = self.bounds_radius + player_radius
+        if dx * dx + dy * dy >= reach * reach:
+            return False
 
-            # Player collision radius is roughly half their width
-            player_radius = 20
-            if dist < segment['radius'] + player_radius:
+        for x, y, segment_radius in zip(self.segment_xs, self.segment_ys, self.segment_radii):
+            dx = player.x - x
+            dy = player.y - y
+            reach = segment_radius + player_radius
+            if dx * dx + dy * dy < reach * reach:
                 return True
 
         return False
 
     def collides_with_barrier(self, barrier):
         """Check if any segment collides with a barrier"""
-        for segment in self.segments:
-            # Check if segment circle intersects with barrier rectangle
-            closest_x = max(barrier.x, min(segment['x'], barrier.x + barrier.width))
-            closest_y = max(barrier.y, min(segment['y'], barrier.y + barrier.height))
-
-            dx = segment['x'] - closest_x
-            dy = segment['y'] - closest_y
-            dist = math.sqrt(dx * dx + dy * dy)
+        left = barrier.x
+        right = barrier.x + barrier.width
+        top = barrier.y
+        bottom = barrier.y + barrier.height
+
+        # Reject barriers outside the whole snake's bounding circle
+        dx = self.bounds_x - max(left, min(self.bounds_x, right))
+        dy = self.bounds_y - max(top, min(self.bounds_y, bottom))
+        if dx * dx + dy * dy >= self.bounds_radius * self.bounds_radius:
+            return False
 
-            if dist < segment['radius']:
+        for x, y, segment_radius in zip(self.segment_xs, self.segment_ys, self.segment_radii):
+            # Check if segment circle intersects with barrier rectangle
+            dx = x - max(left, min(x, right))
+            dy = y - max(top, min(y, bottom))
+            if dx * dx + dy * dy < segment_radius * segment_radius:
                 return True
 
         return False
@@ -7477,7 +8342,7 @@ class SnakeBoss:
         if not self.destruction_complete:
             return False
         # Wait 2.5 seconds for explosion particles to be visible before transitioning
-        return pygame.time.get_ticks() - self.destruction_start_time > 2500
+        return get_game_ticks() - self.destruction_start_time > 2500
 
     def get_turret_rects(self):
         """This boss has no turrets, return empty list for compatibility"""
@@ -7485,20 +8350,20 @@ class SnakeBoss:
 
     def get_main_body_rect(self):
         """Get collision rectangle for the main body (not used for snake, uses segment collision)"""
-        if self.destruction_complete or len(self.segments) == 0:
+        if self.destruction_complete or len(self.segment_xs) == 0:
             return None
         # Return None since we use custom segment collision detection
         return None
 
     def create_final_explosion(self):
         """Create a massive particle explosion when boss is completely destroyed"""
+        rng = get_game_random()
         explosion_particles = []
 
         # Create explosion at head position
-        if self.segments:
-            head = self.segments[0]
-            center_x = int(head['x'])
-            center_y = int(head['y'])
+        if self.segment_xs:
+            center_x = int(self.segment_xs[0])
+            center_y = int(self.segment_ys[0])
         else:
             center_x = SCREEN_WIDTH // 2
             center_y = 200
@@ -7506,11 +8371,11 @@ class SnakeBoss:
         # Create dramatic explosion with yellows and reds
         for _ in range(80):
             particle = {
-                'x': center_x + random.randint(-60, 60),
-                'y': center_y + random.randint(-60, 60),
-                'vel_x': random.uniform(-10, 10),
-                'vel_y': random.uniform(-10, 4),
-                'color': random.choice([
+                'x': center_x + rng.randint(-60, 60),
+                'y': center_y + rng.randint(-60, 60),
+                'vel_x': rng.uniform(-10, 10),
+                'vel_y': rng.uniform(-10, 4),
+                'color': rng.choice([
                     (255, 255, 0),   # Bright Yellow
                     (255, 220, 0),   # Golden Yellow
                     (255, 200, 0),   # Deep Yellow
@@ -7518,9 +8383,9 @@ class SnakeBoss:
                     (220, 0, 0),     # Deep Red
                     (255, 50, 0),    # Red-Orange
                 ]),
-                'size': random.randint(5, 14),
-                'life': random.randint(1200, 2000),
-                'gravity': random.uniform(0.1, 0.3)
+                'size': rng.randint(5, 14),
+                'life': rng.randint(1200, 2000),
+                'gravity': rng.uniform(0.1, 0.3)
             }
             explosion_particles.append(particle)
 
@@ -7531,21 +8396,18 @@ class SnakeBoss:
         # If boss is destroyed, only draw particles (no segments)
         if self.destruction_complete:
             # Draw particles from segment destruction
-            for particle in self.particles:
-                pygame.draw.circle(screen, particle['color'],
-                                 (int(particle['x']), int(particle['y'])),
-                                 3)
+            self.particles.draw(screen)
             return  # Don't draw snake segments or health bar
 
         # Draw body segments (in reverse so head is on top)
-        for i in range(len(self.segments) - 1, -1, -1):
-            segment = self.segments[i]
+        tail = len(self.segment_xs) - 1
+        for i in range(tail, -1, -1):
+            center_x = int(self.segment_xs[i])
+            center_y = int(self.segment_ys[i])
+            radius = self.segment_radii[i]
 
-            if segment['is_head']:
+            if i == 0:
                 # Draw head with 3D spherical effect (color changes from yellow to red based on health)
-                center_x = int(segment['x'])
-                center_y = int(segment['y'])
-                radius = segment['radius']
 
                 # Calculate health ratio for color interpolation (only in final phase)
                 if self.final_phase and self.head_max_health > 0:
@@ -7593,18 +8455,18 @@ class SnakeBoss:
                     pygame.draw.circle(screen, scale_color, (scale_x, scale_y), scale_radius)
 
                 # Draw mean eyes with sinister black outline
-                eye_offset_x = segment['radius'] // 3
-                eye_offset_y = segment['radius'] // 4
-                eye_radius = segment['radius'] // 6
+                eye_offset_x = radius // 3
+                eye_offset_y = radius // 4
+                eye_radius = radius // 6
 
                 # Determine eye direction based on movement angle
                 angle_rad = math.radians(self.angle)
-                eye_forward_x = math.cos(angle_rad) * (segment['radius'] // 3)
-                eye_forward_y = math.sin(angle_rad) * (segment['radius'] // 3)
+                eye_forward_x = math.cos(angle_rad) * (radius // 3)
+                eye_forward_y = math.sin(angle_rad) * (radius // 3)
 
                 # Left eye
-                left_eye_x = int(segment['x'] + eye_forward_x - eye_offset_y * math.sin(angle_rad))
-                left_eye_y = int(segment['y'] + eye_forward_y + eye_offset_y * math.cos(angle_rad))
+                left_eye_x = int(self.segment_xs[i] + eye_forward_x - eye_offset_y * math.sin(angle_rad))
+                left_eye_y = int(self.segment_ys[i] + eye_forward_y + eye_offset_y * math.cos(angle_rad))
                 # Black outline
                 pygame.draw.circle(screen, (0, 0, 0), (left_eye_x, left_eye_y), eye_radius + 2)
                 # Dark red eye
@@ -7613,8 +8475,8 @@ class SnakeBoss:
                 pygame.draw.circle(screen, (255, 0, 0), (left_eye_x, left_eye_y), eye_radius // 2)
 
                 # Right eye
-                right_eye_x = int(segment['x'] + eye_forward_x + eye_offset_y * math.sin(angle_rad))
-                right_eye_y = int(segment['y'] + eye_forward_y - eye_offset_y * math.cos(angle_rad))
+                right_eye_x = int(self.segment_xs[i] + eye_forward_x + eye_offset_y * math.sin(angle_rad))
+                right_eye_y = int(self.segment_ys[i] + eye_forward_y - eye_offset_y * math.cos(angle_rad))
                 # Black outline
                 pygame.draw.circle(screen, (0, 0, 0), (right_eye_x, right_eye_y), eye_radius + 2)
                 # Dark red eye
@@ -7622,12 +8484,8 @@ class SnakeBoss:
                 # Bright red center for menacing look
                 pygame.draw.circle(screen, (255, 0, 0), (right_eye_x, right_eye_y), eye_radius // 2)
 
-            elif i == len(self.segments) - 1:
+            elif i == tail:
                 # Draw tail (red - vulnerable) with spherical shading
-                center_x = int(segment['x'])
-                center_y = int(segment['y'])
-                radius = segment['radius']
-
                 # Spherical gradient for tail
                 pygame.draw.circle(screen, (150, 0, 0), (center_x, center_y), radius)
                 pygame.draw.circle(screen, (200, 0, 0), (center_x, center_y), int(radius * 0.85))
@@ -7639,10 +8497,6 @@ class SnakeBoss:
                                  int(radius * 0.3))
             else:
                 # Draw body segment with 3D spherical effect (darker golden yellow)
-                center_x = int(segment['x'])
-                center_y = int(segment['y'])
-                radius = segment['radius']
-
                 # Base color - darker golden yellow
                 base_color = (200, 180, 0)
 
@@ -7666,10 +8520,7 @@ class SnakeBoss:
                     pygame.draw.circle(screen, (180, 160, 0), (scale_x, scale_y), scale_radius)
 
         # Draw particles
-        for particle in self.particles:
-            pygame.draw.circle(screen, particle['color'],
-                             (int(particle['x']), int(particle['y'])),
-                             3)
+        self.particles.draw(screen)
 
         # Draw health bar only in final phase
         if self.final_phase and self.head_health > 0:
@@ -7685,9 +8536,9 @@ class SnakeBoss:
             pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 3)
 
             # Label
-            font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 14)
+            font = get_font(14)
             label = f"SNAKE HEAD: {self.head_health}/{self.head_max_health}"
-            text = font.render(label, True, (255, 255, 255))
+            text = render_text(font, label, True, (255, 255, 255))
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, bar_y - 20))
             screen.blit(text, text_rect)
 
@@ -7695,6 +8546,7 @@ class SnakeBoss:
 class RogueTerminalBoss:
     """Seventh boss - Shifting ASCII-art supercomputer with hidden red weakpoints."""
     def __init__(self, encounter):
+        rng = get_game_random()
         self.encounter = max(1, encounter)
         self.speed = ROGUE_TERMINAL_BOSS_SPEED_BASE + (self.encounter - 1) * ROGUE_TERMINAL_BOSS_SPEED_GROWTH
         self.max_health = ROGUE_TERMINAL_BOSS_HEALTH_BASE + (self.encounter - 1) * ROGUE_TERMINAL_BOSS_HEALTH_PER_LEVEL
@@ -7708,23 +8560,29 @@ class RogueTerminalBoss:
         self.height = self.grid_rows * self.symbol_spacing_y
         self.x = SCREEN_WIDTH // 2 - self.width // 2
         self.y = 120
-        self.direction = random.choice([-1, 1])
+        self.direction = rng.choice([-1, 1])
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
 
         self.phase_duration = ROGUE_TERMINAL_BOSS_PHASE_DURATION
         self.phase_index = 0
-        self.last_phase_change = pygame.time.get_ticks()
-        self.last_shot = pygame.time.get_ticks() - 500
+        self.last_phase_change = get_game_ticks()
+        self.last_shot = get_game_ticks() - 500
 
         self.weakpoint_count = ROGUE_TERMINAL_BOSS_WEAKPOINT_COUNT
         self.weakpoint_duration = ROGUE_TERMINAL_BOSS_WEAKPOINT_DURATION
         self.weakpoint_cooldown = ROGUE_TERMINAL_BOSS_WEAKPOINT_COOLDOWN
         self.weakpoint_active = False
-        self.last_weakpoint_change = pygame.time.get_ticks()
+        self.last_weakpoint_change = get_game_ticks()
         self.weakpoint_cells = set()
+        self.weakpoint_rects = {}  # (row, col) -> boss-relative rect of each active weakpoint
 
-        self.font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", ROGUE_TERMINAL_BOSS_SYMBOL_SIZE)
+        self.font = get_font(ROGUE_TERMINAL_BOSS_SYMBOL_SIZE)
         self.forms = self._load_forms()
+        self.cell_tables = [self._build_cell_table(form) for form in self.forms]
+        self.glyph_atlas = {}  # (char, color) -> rendered glyph surface
+        self._build_glyph_atlas()
+        self.scanline = pygame.Surface((self.width, 1), pygame.SRCALPHA)
+        self.scanline.fill((0, 0, 0, 25))
 
         self.destruction_complete = False
         self.destruction_start_time = 0
@@ -7843,7 +8701,7 @@ class RogueTerminalBoss:
             if loaded:
                 return loaded
         except Exception as e:
-            print(f"[DEBUG] Could not load {ROGUE_TERMINAL_BOSS_CUSTOM_ART_FILE}: {e}")
+            LOG.debug("boss", "Could not load %s: %s", ROGUE_TERMINAL_BOSS_CUSTOM_ART_FILE, e)
 
         return forms
 
@@ -7869,38 +8727,67 @@ class RogueTerminalBoss:
     def _normalize_art(self, rows):
         return self._build_art(rows)
 
+    def _build_glyph_atlas(self):
+        """Pre-render every symbol of every form (form color and weakpoint red) plus the glitch set"""
+        for form in self.forms:
+            chars = set("".join(form["template"]))
+            chars.discard(" ")
+            for char in chars:
+                self._glyph(char, form["color"])
+                self._glyph(char, RED)
+                for color in ROGUE_TERMINAL_BOSS_GLITCH_COLORS:
+                    self._glyph(char, color)
+            for char in ROGUE_TERMINAL_BOSS_GLITCH_CHARS:
+                self._glyph(char, form["color"])
+        for char in ROGUE_TERMINAL_BOSS_GLITCH_CHARS:
+            for color in ROGUE_TERMINAL_BOSS_GLITCH_COLORS:
+                self._glyph(char, color)
+
+    def _glyph(self, char, color):
+        """Rendered glyph from the atlas (rendered and stored on first use)"""
+        key = (char, color)
+        glyph = self.glyph_atlas.get(key)
+        if glyph is None:
+            glyph = self.font.render(char, True, color)
+            self.glyph_atlas[key] = glyph
+        return glyph
+
     def _current_form(self):
         return self.forms[self.phase_index]
 
-    def _symbol_cells(self):
-        template = self._current_form()["template"]
+    def _build_cell_table(self, form):
+        """Non-space symbols of a form as (row, col, char, x, y, rect), relative to the boss position"""
         cells = []
-        base_x = int(self.x)
-        base_y = int(self.y)
-        for row_idx, row in enumerate(template):
+        for row_idx, row in enumerate(form["template"]):
             for col_idx, char in enumerate(row):
                 if char == " ":
                     continue
-                x = base_x + col_idx * self.symbol_spacing_x
-                y = base_y + row_idx * self.symbol_spacing_y
+                x = col_idx * self.symbol_spacing_x
+                y = row_idx * self.symbol_spacing_y
                 rect = pygame.Rect(x - 5, y - 5, self.symbol_spacing_x, self.symbol_spacing_y)
                 cells.append((row_idx, col_idx, char, x, y, rect))
         return cells
 
+    def _current_cells(self):
+        """Cell table of the current form (add int(self.x), int(self.y) for screen positions)"""
+        return self.cell_tables[self.phase_index]
+
     def _activate_weakpoints(self):
-        cells = self._symbol_cells()
+        rng = get_game_random()
+        cells = self._current_cells()
         if not cells:
             self.weakpoint_cells = set()
+            self.weakpoint_rects = {}
             return
         cell_set = {(r, c) for r, c, _, _, _, _ in cells}
-        seed = random.choice(cells)
+        seed = rng.choice(cells)
         cluster = {(seed[0], seed[1])}
         neighbors = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
         frontier = [(seed[0], seed[1])]
         while len(cluster) < self.weakpoint_count and frontier:
-            r, c = random.choice(frontier)
+            r, c = rng.choice(frontier)
             frontier.remove((r, c))
-            random.shuffle(neighbors)
+            rng.shuffle(neighbors)
             for dr, dc in neighbors:
                 nr, nc = r + dr, c + dc
                 if (nr, nc) in cell_set and (nr, nc) not in cluster:
@@ -7909,21 +8796,24 @@ class RogueTerminalBoss:
                     if len(cluster) >= self.weakpoint_count:
                         break
         self.weakpoint_cells = cluster
+        # Row-major like the grid, so overlapping hits resolve to the same cell as a full scan
+        self.weakpoint_rects = {(r, c): rect for r, c, _, _, _, rect in cells if (r, c) in cluster}
 
     def update(self, players=None, sound_manager=None):
+        rng = get_game_random()
         if self.destruction_complete:
-            elapsed = pygame.time.get_ticks() - self.destruction_start_time
+            elapsed = get_game_ticks() - self.destruction_start_time
             if not self.death_exploded and elapsed >= self.death_glitch_duration:
                 self.death_exploded = True
                 self._ready_for_final_explosion = True
                 for _ in range(50):
                     self.explosion_effects.append({
-                        'x': self.x + random.randint(-50, self.width + 50),
-                        'y': self.y + random.randint(-30, self.height + 30),
+                        'x': self.x + rng.randint(-50, self.width + 50),
+                        'y': self.y + rng.randint(-30, self.height + 30),
                         'radius': 0,
-                        'growth': random.uniform(5, 14),
-                        'color': random.choice([RED, ORANGE, YELLOW, WHITE, CYAN, (0, 255, 80)]),
-                        'life': random.randint(80, 160)
+                        'growth': rng.uniform(5, 14),
+                        'color': rng.choice([RED, ORANGE, YELLOW, WHITE, CYAN, (0, 255, 80)]),
+                        'life': rng.randint(80, 160)
                     })
             self.explosion_effects = [exp for exp in self.explosion_effects if exp['life'] > 0]
             for explosion in self.explosion_effects:
@@ -7931,7 +8821,7 @@ class RogueTerminalBoss:
                 explosion['life'] -= 1
             return []
 
-        now = pygame.time.get_ticks()
+        now = get_game_ticks()
         self.x += self.speed * self.direction
         if self.x <= 20 or self.x >= SCREEN_WIDTH - self.width - 20:
             self.direction *= -1
@@ -7942,15 +8832,17 @@ class RogueTerminalBoss:
             self.last_phase_change = now
             self.weakpoint_active = False
             self.weakpoint_cells.clear()
+            self.weakpoint_rects.clear()
             self.last_weakpoint_change = now
             self.glitch_until = now + 400
-            self.current_taunt = random.choice(self.taunt_messages)
+            self.current_taunt = rng.choice(self.taunt_messages)
             self.taunt_until = now + 2000
 
         if self.weakpoint_active:
             if now - self.last_weakpoint_change >= self.weakpoint_duration:
                 self.weakpoint_active = False
                 self.weakpoint_cells.clear()
+                self.weakpoint_rects.clear()
                 self.last_weakpoint_change = now
         else:
             if now - self.last_weakpoint_change >= self.weakpoint_cooldown:
@@ -7961,10 +8853,11 @@ class RogueTerminalBoss:
         return []
 
     def shoot(self, players, sound_manager=None):
+        rng = get_game_random()
         if self.destruction_complete:
             return []
 
-        now = pygame.time.get_ticks()
+        now = get_game_ticks()
         phase_name = self._current_form()["name"]
         cooldown_map = {
             "BOOT_SEQ": ROGUE_TERMINAL_BOSS_BOOT_SHOT_COOLDOWN,
@@ -7996,17 +8889,19 @@ class RogueTerminalBoss:
                 if hasattr(target, 'x'):
                     target_x = target.x + getattr(target, 'width', 40) // 2
                     for off in [-25, 0, 25]:
-                        bx = target_x + off + random.randint(-30, 30)
+                        bx = target_x + off + rng.randint(-30, 30)
                         bullets.append(Bullet(bx, bottom, spd * 1.05))
             offsets = [-120, 0, 120]
             for off in offsets:
                 bullets.append(Bullet(center + off, bottom, spd * 0.85))
         else:  # swirl
-            symbol_cells = self._symbol_cells()
+            symbol_cells = self._current_cells()
             if symbol_cells:
+                base_x = int(self.x)
+                base_y = int(self.y)
                 for _ in range(4):
-                    _, _, _, sx, sy, _ = random.choice(symbol_cells)
-                    bullets.append(Bullet(sx, sy, spd * random.uniform(0.6, 1.2)))
+                    _, _, _, sx, sy, _ = rng.choice(symbol_cells)
+                    bullets.append(Bullet(base_x + sx, base_y + sy, spd * rng.uniform(0.6, 1.2)))
             center = int(self.x + self.width // 2)
             angle_base = (now / 350.0)
             for i in range(2):
@@ -8021,10 +8916,13 @@ class RogueTerminalBoss:
     def hit_weakpoint(self, projectile_rect, damage=1):
         if not self.weakpoint_active:
             return False
-        for row, col, _, _, _, rect in self._symbol_cells():
-            if (row, col) in self.weakpoint_cells and projectile_rect.colliderect(rect):
+        # Only the active weakpoints can be hit, tested in boss-relative coordinates
+        local_rect = projectile_rect.move(-int(self.x), -int(self.y))
+        for cell, rect in self.weakpoint_rects.items():
+            if local_rect.colliderect(rect):
                 self.health = max(0, self.health - damage)
-                self.weakpoint_cells.discard((row, col))
+                self.weakpoint_cells.discard(cell)
+                del self.weakpoint_rects[cell]
                 if self.health <= 0:
                     self.start_destruction_sequence()
                 return True
@@ -8044,7 +8942,7 @@ class RogueTerminalBoss:
 
     def start_destruction_sequence(self):
         self.destruction_complete = True
-        self.destruction_start_time = pygame.time.get_ticks()
+        self.destruction_start_time = get_game_ticks()
         self.death_glitch_duration = 3500
         self.death_exploded = False
         self.death_messages = [
@@ -8056,34 +8954,35 @@ class RogueTerminalBoss:
             "GOODBYE... WORLD...",
         ]
         self.death_msg_index = 0
-        self.last_death_msg = pygame.time.get_ticks()
+        self.last_death_msg = get_game_ticks()
         self.current_taunt = "N-N-NO..."
-        self.taunt_until = pygame.time.get_ticks() + self.death_glitch_duration + 1000
+        self.taunt_until = get_game_ticks() + self.death_glitch_duration + 1000
 
     def is_destruction_complete(self):
         if not self.destruction_complete:
             return False
-        elapsed = pygame.time.get_ticks() - self.destruction_start_time
+        elapsed = get_game_ticks() - self.destruction_start_time
         return elapsed > self.death_glitch_duration + 2000
 
     def create_final_explosion(self):
+        rng = get_game_random()
         particles = []
         for _ in range(90):
             particles.append({
-                'x': self.x + random.randint(-80, self.width + 80),
-                'y': self.y + random.randint(-50, self.height + 50),
-                'vel_x': random.uniform(-8, 8),
-                'vel_y': random.uniform(-9, 3),
-                'color': random.choice([(0, 255, 80), (255, 60, 40), (100, 180, 255), (255, 255, 255), (255, 200, 0)]),
-                'size': random.randint(3, 11),
-                'life': random.randint(1000, 1800),
-                'gravity': random.uniform(0.08, 0.25)
+                'x': self.x + rng.randint(-80, self.width + 80),
+                'y': self.y + rng.randint(-50, self.height + 50),
+                'vel_x': rng.uniform(-8, 8),
+                'vel_y': rng.uniform(-9, 3),
+                'color': rng.choice([(0, 255, 80), (255, 60, 40), (100, 180, 255), (255, 255, 255), (255, 200, 0)]),
+                'size': rng.randint(3, 11),
+                'life': rng.randint(1000, 1800),
+                'gravity': rng.uniform(0.08, 0.25)
             })
         return particles
 
     def draw(self, screen):
         if self.destruction_complete:
-            now = pygame.time.get_ticks()
+            now = get_game_ticks()
             elapsed = now - self.destruction_start_time
 
             if elapsed < self.death_glitch_duration:
@@ -8095,24 +8994,28 @@ class RogueTerminalBoss:
                     self.current_taunt = self.death_messages[self.death_msg_index]
                     self.last_death_msg = now
 
-                glitch_colors = [RED, WHITE, CYAN, YELLOW, (0, 255, 80), ORANGE]
+                glitch_colors = ROGUE_TERMINAL_BOSS_GLITCH_COLORS
                 max_offset = int(20 * intensity)
                 corrupt_chance = 0.1 + 0.6 * intensity
                 color_chaos = 0.2 + 0.7 * intensity
-
-                for row, col, char, x, y, _ in self._symbol_cells():
-                    dx = random.randint(-max_offset, max_offset)
-                    dy = random.randint(-max_offset // 2, max_offset // 2)
+                form_color = self._current_form()["color"]
+
+                base_x = int(self.x)
+                base_y = int(self.y)
+                glyphs = []
+                for row, col, char, x, y, _ in self._current_cells():
+                    dx = base_x + random.randint(-max_offset, max_offset)
+                    dy = base_y + random.randint(-max_offset // 2, max_offset // 2)
                     if random.random() < corrupt_chance:
-                        char = random.choice("#@$%!?&*01/\\|_-=+<>[]{}~^")
+                        char = random.choice(ROGUE_TERMINAL_BOSS_GLITCH_CHARS)
                     if random.random() < color_chaos:
                         color = random.choice(glitch_colors)
                     else:
-                        color = self._current_form()["color"]
+                        color = form_color
                     if random.random() < intensity * 0.3:
                         continue
-                    glyph = self.font.render(char, True, color)
-                    screen.blit(glyph, (x + dx, y + dy))
+                    glyphs.append((self._glyph(char, color), (x + dx, y + dy)))
+                screen.blits(glyphs, doreturn=False)
 
                 if intensity > 0.3:
                     num_sparks = int(10 * intensity)
@@ -8131,7 +9034,7 @@ class RogueTerminalBoss:
                         line_surf.fill((*random.choice(glitch_colors)[:3], int(100 * intensity)))
                         screen.blit(line_surf, (int(lx), int(ly)))
 
-                taunt_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 11)
+                taunt_font = get_font(11)
                 blink = (now // 150) % 2 == 0
                 if blink and self.current_taunt:
                     taunt_color = RED if intensity > 0.5 else WHITE
@@ -8143,35 +9046,37 @@ class RogueTerminalBoss:
             for explosion in self.explosion_effects:
                 if explosion['radius'] > 0:
                     alpha = int(255 * (explosion['life'] / 140))
-                    surf = pygame.Surface((int(explosion['radius']) * 2, int(explosion['radius']) * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(surf, explosion['color'], (int(explosion['radius']), int(explosion['radius'])), int(explosion['radius']))
-                    surf.set_alpha(min(255, alpha))
-                    screen.blit(surf, (explosion['x'] - explosion['radius'], explosion['y'] - explosion['radius']))
+                    EffectSprites.draw_circle(screen, explosion['color'], (explosion['x'], explosion['y']), explosion['radius'], min(255, alpha))
             return
 
-        now = pygame.time.get_ticks()
+        now = get_game_ticks()
         phase_color = self._current_form()["color"]
         is_glitching = now < self.glitch_until
 
-        for row, col, char, x, y, _ in self._symbol_cells():
+        base_x = int(self.x)
+        base_y = int(self.y)
+        weakpoint_cells = self.weakpoint_cells
+        glyphs = []
+        for row, col, char, x, y, _ in self._current_cells():
+            x += base_x
+            y += base_y
             if is_glitching:
                 x += random.randint(-6, 6)
                 y += random.randint(-4, 4)
                 if random.random() < 0.15:
                     char = random.choice("#@$%!?&*")
-            symbol_color = RED if (row, col) in self.weakpoint_cells else phase_color
+            symbol_color = RED if (row, col) in weakpoint_cells else phase_color
             if is_glitching and random.random() < 0.3:
                 symbol_color = random.choice([WHITE, CYAN, RED, YELLOW])
-            glyph = self.font.render(char, True, symbol_color)
-            screen.blit(glyph, (x, y))
+            glyphs.append((self._glyph(char, symbol_color), (x, y)))
+        screen.blits(glyphs, doreturn=False)
 
-        for sy in range(int(self.y), int(self.y + self.height), 4):
-            scanline = pygame.Surface((self.width, 1), pygame.SRCALPHA)
-            scanline.fill((0, 0, 0, 25))
-            screen.blit(scanline, (int(self.x), sy))
+        scanline_x = int(self.x)
+        screen.blits([(self.scanline, (scanline_x, sy))
+                      for sy in range(int(self.y), int(self.y + self.height), 4)], doreturn=False)
 
         if now < self.taunt_until and self.current_taunt:
-            taunt_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 11)
+            taunt_font = get_font(11)
             blink = (now // 300) % 2 == 0
             taunt_color = phase_color if blink else (255, 255, 255)
             taunt_surf = taunt_font.render(f"> {self.current_taunt}", True, taunt_color)
@@ -8193,68 +9098,95 @@ class RogueTerminalBoss:
         }
         label = status_msgs.get(form["name"], f"NEXUS-9 [{form['name']}]")
         label += f"  {self.health}/{self.max_health}"
-        text = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 14).render(label, True, form["color"])
+        text = render_text(get_font(14), label, True, form["color"])
         screen.blit(text, (int(self.x), bar_y - 20))
 
 
 class Enemy:
-    def __init__(self, x, y, enemy_type=0):
-        self.x = x
-        self.y = y
-        self.width = 45
-        self.height = 30
+    # Pre-rendered alien sprites shared by every Enemy:
+    # (enemy_type, special_type, shimmer_step, alpha) -> Surface
+    sprite_cache = {}
+
+    def __init__(self, formation, slot, enemy_type=0):
+        """A view onto one slot of an EnemyFormation, which owns position and speed"""
+        rng = get_game_random()
+        self.formation = formation
+        self.slot = slot
+        self.row = slot // formation.cols
+        self.width = ENEMY_WIDTH
+        self.height = ENEMY_HEIGHT
         self.base_speed = BASE_ENEMY_SPEED
-        self.speed = BASE_ENEMY_SPEED
-        self.rect = pygame.Rect(x, y, self.width, self.height)
-        self.direction = 1
         self.enemy_type = enemy_type  # 0-4 for different rows
         self.is_special = False
         self.special_type = None  # 'gold' or 'silver'
         self.afterimage_positions = []  # Track positions for afterimage effect
         self.last_afterimage_time = 0
         # Random offset for shimmer effect so each alien shimmers at different times
-        self.shimmer_offset = random.uniform(0, math.pi * 2)
+        self.shimmer_offset = rng.uniform(0, math.pi * 2)
         # Invincibility properties
         self.is_invincible = False
         self.invincibility_start_time = 0
         self.invincibility_duration = 1000  # 1 second in milliseconds
-        
-    def move(self):
-        # Track position for afterimage if this is a special enemy
-        if self.is_special:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.last_afterimage_time > 50:  # Add afterimage every 50ms
-                self.afterimage_positions.append((self.x, self.y))
-                self.last_afterimage_time = current_time
-                # Keep only last 5 positions
-                if len(self.afterimage_positions) > 5:
-                    self.afterimage_positions.pop(0)
-
-        self.x += self.speed * self.direction
-        self.rect.x = self.x
-        
-    def drop_down(self):
-        self.y += ENEMY_DROP_SPEED
-        self.rect.y = self.y
-        self.direction *= -1
+        self.slot_rect = pygame.Rect(0, 0, self.width, self.height)  # Reused by the rect property
+        
+    @property
+    def x(self):
+        return self.formation.x[self.slot]
+
+    @property
+    def y(self):
+        return self.formation.row_y[self.row]
+
+    @property
+    def speed(self):
+        return self.formation.speed[self.slot]
+
+    @speed.setter
+    def speed(self, value):
+        self.formation.speed[self.slot] = value
+        self.formation.speed_multiplier = None  # Force the next set_speed_multiplier to rewrite
+        self.formation.edge_slots = None  # Edge columns assume regular aliens share one speed
+
+    @property
+    def rect(self):
+        """The slot's Rect moved to its current position; the same object is returned every time"""
+        rect = self.slot_rect
+        rect.x = self.formation.x[self.slot]
+        rect.y = self.formation.row_y[self.row]
+        return rect
+
+    def record_afterimage(self):
+        """Track position for afterimage (special enemies only)"""
+        current_time = get_game_ticks()
+        if current_time - self.last_afterimage_time > 50:  # Add afterimage every 50ms
+            self.afterimage_positions.append((self.x, self.y))
+            self.last_afterimage_time = current_time
+            # Keep only last 5 positions
+            if len(self.afterimage_positions) > 5:
+                self.afterimage_positions.pop(0)
         
     def shoot(self, sound_manager=None):
-        if random.randint(1, 1500) < 3:
-            if sound_manager:
-                sound_manager.play_sound('enemy_shoot', volume_override=0.3)  # Quieter than player
-            return Bullet(self.x + self.width // 2, self.y + self.height, BASE_BULLET_SPEED)
-        return None
+        """Fire a bullet; EnemyFormation.shoot decides which aliens fire each tick"""
+        if sound_manager:
+            sound_manager.play_sound('enemy_shoot', volume_override=0.3)  # Quieter than player
+        return Bullet(self.x + self.width // 2, self.y + self.height, BASE_BULLET_SPEED)
 
-    def get_shimmer_factor(self):
-        """Calculate shimmer brightness factor (1.0 = normal, >1.0 = brighter, <1.0 = dimmer)"""
+    def get_shimmer_step(self):
+        """Current shimmer level as an index into the pre-rendered brightness steps"""
         # Skip shimmer for special enemies (they already have special effects)
         if self.is_special:
-            return 1.0
+            return 0
 
         # Slow sine wave (0.002 is much slower than boss shield's 0.006)
         # Adding shimmer_offset makes each alien shimmer at different times
-        time_factor = pygame.time.get_ticks() * 0.002 + self.shimmer_offset
+        time_factor = get_game_ticks() * 0.002 + self.shimmer_offset
         sine_wave = abs(math.sin(time_factor))
+        return int(sine_wave * (ALIEN_SHIMMER_STEPS - 1) + 0.5)
+
+    @staticmethod
+    def get_shimmer_factor(step):
+        """Shimmer brightness factor for a step (1.0 = normal, >1.0 = brighter, <1.0 = dimmer)"""
+        sine_wave = step / (ALIEN_SHIMMER_STEPS - 1)
 
         if ALIEN_SHIMMER_BRIGHTEN:
             # Brighten mode: shimmer ranges from 1.0 to 1.0+INTENSITY (e.g., 1.0 to 1.3)
@@ -8265,9 +9197,8 @@ class Enemy:
 
         return shimmer
 
-    def apply_shimmer_to_color(self, color):
+    def apply_shimmer_to_color(self, color, shimmer=1.0):
         """Apply shimmer brightness to a color tuple"""
-        shimmer = self.get_shimmer_factor()
         return tuple(min(255, int(c * shimmer)) for c in color)
     
     def _scale_color(self, color, factor):
@@ -8276,7 +9207,7 @@ class Enemy:
     def _get_special_base_color(self):
         return GOLD if self.special_type == 'gold' else SILVER
 
-    def draw_squid_enemy(self, screen, x=None, y=None):
+    def draw_squid_enemy(self, screen, x=None, y=None, shimmer=1.0):
         """Top row - Green squid-like alien (most points) - EVEN BIGGER VERSION"""
         # Main body (green) - expanded further
         draw_x = self.x if x is None else x
@@ -8286,8 +9217,8 @@ class Enemy:
             body_color = self._scale_color(base_color, 1.0)
             dark_green = self._scale_color(base_color, 0.7)
         else:
-            body_color = self.apply_shimmer_to_color((0, 200, 0))
-            dark_green = self.apply_shimmer_to_color((0, 150, 0))
+            body_color = self.apply_shimmer_to_color((0, 200, 0), shimmer)
+            dark_green = self.apply_shimmer_to_color((0, 150, 0), shimmer)
         
         # Body outline - made bigger
         pygame.draw.rect(screen, body_color, (draw_x + 3, draw_y + 2, 39, 26))
@@ -8310,7 +9241,7 @@ class Enemy:
         pygame.draw.rect(screen, dark_green, (draw_x + 31, draw_y + 24, 5, 10))
         pygame.draw.rect(screen, dark_green, (draw_x + 38, draw_y + 26, 5, 8))
         
-    def draw_crab_enemy(self, screen, x=None, y=None):
+    def draw_crab_enemy(self, screen, x=None, y=None, shimmer=1.0):
         """Second row - Red crab-like alien - EVEN BIGGER VERSION"""
         # Main body (red) - expanded further
         draw_x = self.x if x is None else x
@@ -8320,8 +9251,8 @@ class Enemy:
             body_color = self._scale_color(base_color, 1.0)
             dark_red = self._scale_color(base_color, 0.7)
         else:
-            body_color = self.apply_shimmer_to_color((220, 20, 20))
-            dark_red = self.apply_shimmer_to_color((180, 0, 0))
+            body_color = self.apply_shimmer_to_color((220, 20, 20), shimmer)
+            dark_red = self.apply_shimmer_to_color((180, 0, 0), shimmer)
         
         # Main body - bigger
         pygame.draw.rect(screen, body_color, (draw_x + 2, draw_y + 6, 41, 18))
@@ -8348,7 +9279,7 @@ class Enemy:
         pygame.draw.rect(screen, dark_red, (draw_x + 34, draw_y + 24, 4, 6))
         pygame.draw.rect(screen, dark_red, (draw_x + 41, draw_y + 24, 4, 6))
         
-    def draw_octopus_enemy(self, screen, x=None, y=None):
+    def draw_octopus_enemy(self, screen, x=None, y=None, shimmer=1.0):
         """Middle rows - Blue octopus-like alien - EVEN BIGGER VERSION"""
         # Main body (blue) - expanded further
         draw_x = self.x if x is None else x
@@ -8358,8 +9289,8 @@ class Enemy:
             body_color = self._scale_color(base_color, 1.0)
             dark_blue = self._scale_color(base_color, 0.7)
         else:
-            body_color = self.apply_shimmer_to_color((20, 100, 220))
-            dark_blue = self.apply_shimmer_to_color((0, 60, 180))
+            body_color = self.apply_shimmer_to_color((20, 100, 220), shimmer)
+            dark_blue = self.apply_shimmer_to_color((0, 60, 180), shimmer)
         
         # Round head - bigger
         pygame.draw.rect(screen, body_color, (draw_x + 5, draw_y, 35, 24))
@@ -8385,7 +9316,7 @@ class Enemy:
         pygame.draw.rect(screen, dark_blue, (draw_x - 1, draw_y + 26, 4, 4))
         pygame.draw.rect(screen, dark_blue, (draw_x + 42, draw_y + 26, 4, 4))
         
-    def draw_basic_enemy(self, screen, x=None, y=None):
+    def draw_basic_enemy(self, screen, x=None, y=None, shimmer=1.0):
         """Bottom rows - Simple geometric alien - EVEN BIGGER VERSION"""
         # Main body (mixed colors) - expanded further
         draw_x = self.x if x is None else x
@@ -8396,11 +9327,11 @@ class Enemy:
             accent_color = self._scale_color(base_color, 1.2)
         else:
             if self.enemy_type == 3:
-                body_color = self.apply_shimmer_to_color((200, 100, 0))  # Orange
-                accent_color = self.apply_shimmer_to_color((255, 150, 0))
+                body_color = self.apply_shimmer_to_color((200, 100, 0), shimmer)  # Orange
+                accent_color = self.apply_shimmer_to_color((255, 150, 0), shimmer)
             else:
-                body_color = self.apply_shimmer_to_color((150, 0, 150))  # Purple
-                accent_color = self.apply_shimmer_to_color((200, 0, 200))
+                body_color = self.apply_shimmer_to_color((150, 0, 150), shimmer)  # Purple
+                accent_color = self.apply_shimmer_to_color((200, 0, 200), shimmer)
         
         # Simple rectangular body - bigger
         pygame.draw.rect(screen, body_color, (draw_x + 2, draw_y + 4, 41, 22))
@@ -8433,51 +9364,82 @@ class Enemy:
         self.base_speed = self.base_speed * 2
         # Enable invincibility for 1 second
         self.is_invincible = True
-        self.invincibility_start_time = pygame.time.get_ticks()
+        self.invincibility_start_time = get_game_ticks()
+        self.formation.specials.append(self)
+        self.formation.edge_slots = None
 
     def update_invincibility(self):
         """Update invincibility status - disable after duration expires"""
         if self.is_invincible:
-            current_time = pygame.time.get_ticks()
+            current_time = get_game_ticks()
             if current_time - self.invincibility_start_time >= self.invincibility_duration:
                 self.is_invincible = False
 
-    def draw_afterimages(self, screen):
-        """Draw afterimages for special enemies"""
+    def get_afterimage_blits(self):
+        """(sprite, position) pairs for the afterimages trailing a special enemy"""
         if not self.is_special or not self.afterimage_positions:
-            return
+            return []
 
-        # Draw afterimages with fading alpha
+        # Afterimages fade in from oldest to newest
+        blits = []
         for i, (old_x, old_y) in enumerate(self.afterimage_positions):
             alpha = int(50 + (i / len(self.afterimage_positions)) * 100)  # 50-150 alpha
-            afterimage_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            self._draw_enemy_shape(afterimage_surface, 0, 0)
-            afterimage_surface.set_alpha(alpha)
-            screen.blit(afterimage_surface, (old_x, old_y))
+            blits.append((self.get_sprite(0, alpha),
+                          (old_x - ALIEN_SPRITE_PADDING, old_y - ALIEN_SPRITE_PADDING)))
+        return blits
+
+    def draw_afterimages(self, screen):
+        """Draw afterimages for special enemies"""
+        blits = self.get_afterimage_blits()
+        if blits:
+            screen.blits(blits, doreturn=False)
 
-    def _draw_enemy_shape(self, screen, x, y):
+    def _draw_enemy_shape(self, screen, x, y, shimmer=1.0):
         if self.enemy_type == 0:  # Top row
-            self.draw_squid_enemy(screen, x, y)
+            self.draw_squid_enemy(screen, x, y, shimmer)
         elif self.enemy_type == 1:  # Second row
-            self.draw_crab_enemy(screen, x, y)
+            self.draw_crab_enemy(screen, x, y, shimmer)
         elif self.enemy_type == 2:  # Middle row
-            self.draw_octopus_enemy(screen, x, y)
+            self.draw_octopus_enemy(screen, x, y, shimmer)
         else:  # Bottom rows (3 and 4)
-            self.draw_basic_enemy(screen, x, y)
+            self.draw_basic_enemy(screen, x, y, shimmer)
+
+    def get_sprite(self, shimmer_step, alpha=None):
+        """Pre-rendered sprite for this enemy's shape, drawn ALIEN_SPRITE_PADDING in from the corner"""
+        key = (self.enemy_type, self.special_type, shimmer_step, alpha)
+        sprite = Enemy.sprite_cache.get(key)
+        if sprite is None:
+            if alpha is None:
+                sprite = pygame.Surface((self.width + ALIEN_SPRITE_PADDING * 2,
+                                         self.height + ALIEN_SPRITE_PADDING * 2), pygame.SRCALPHA)
+                self._draw_enemy_shape(sprite, ALIEN_SPRITE_PADDING, ALIEN_SPRITE_PADDING,
+                                       self.get_shimmer_factor(shimmer_step))
+            else:
+                sprite = self.get_sprite(shimmer_step).copy()
+                sprite.set_alpha(alpha)
+            Enemy.sprite_cache[key] = sprite
+        return sprite
+
+    def get_draw_blits(self):
+        """(sprite, position) pairs for this enemy, afterimages first"""
+        blits = self.get_afterimage_blits() if self.is_special else []
+        blits.append((self.get_sprite(self.get_shimmer_step()),
+                      (self.x - ALIEN_SPRITE_PADDING, self.y - ALIEN_SPRITE_PADDING)))
+        return blits
 
     def draw(self, screen):
         """Draw the enemy based on its type"""
-        # Draw afterimages first (behind the enemy)
-        if self.is_special:
-            self.draw_afterimages(screen)
+        # Afterimages come first (behind the enemy)
+        screen.blits(self.get_draw_blits(), doreturn=False)
 
-        # Draw the normal enemy
-        self._draw_enemy_shape(screen, self.x, self.y)
+        if self.is_invincible:
+            self.draw_shield(screen)
 
-        # Draw invincibility shield effect
+    def draw_shield(self, screen):
+        """Draw invincibility shield effect"""
         if self.is_invincible:
             # Create a pulsing shield effect
-            current_time = pygame.time.get_ticks()
+            current_time = get_game_ticks()
             pulse = abs(math.sin(current_time * 0.01))  # Pulsing effect
             shield_alpha = int(100 + pulse * 100)  # Alpha between 100-200
 
@@ -8494,14 +9456,388 @@ class Enemy:
 
             screen.blit(shield_surface, (self.x - 10, self.y - 10))
 
+class EnemyFormation:
+    """The regular-level alien grid.
+
+    Positions, speeds and alive flags live in parallel arrays indexed by slot
+    (row * cols + col); each Enemy is a thin view onto its slot. Every row shares
+    one y and the whole grid shares one march direction, so drops are per row.
+    """
+    def __init__(self, rows, cols, start_x, start_y, spacing_x, spacing_y, speed):
+        self.rows = rows
+        self.cols = cols
+        self.direction = 1
+        slot_count = rows * cols
+        self.x = array.array('d', (start_x + (slot % cols) * spacing_x for slot in range(slot_count)))
+        self.row_y = array.array('l', (start_y + row * spacing_y for row in range(rows)))
+        self.speed = array.array('d', [speed]) * slot_count
+        self.alive = bytearray(b'\x01') * slot_count
+        self.row_counts = [cols] * rows
+        self.bottom_row = rows - 1  # Lowest row with a living alien, -1 when empty
+
+        # Row-major, matching the slot order; enemies only holds the living aliens
+        self.slot_enemies = []
+        for slot in range(slot_count):
+            enemy = Enemy(self, slot, slot // cols)  # Row doubles as enemy_type
+            enemy.base_speed = speed
+            self.slot_enemies.append(enemy)
+        self.enemies = list(self.slot_enemies)
+        self.alive_slots = list(range(slot_count))
+        self.specials = []
+        self.speed_multiplier = None  # Last multiplier applied by set_speed_multiplier
+        self.min_speed_multiplier = 1.0  # Progression carried over from a reset grid
+        self.front_enemies = None  # Lowest living alien per column, rebuilt after a kill
+        self.edge_slots = None  # Slots that can touch a screen edge first, see get_edge_slots
+        self.fire_countdown = None  # Shooter rolls left before the next shot (see shoot)
+
+    @classmethod
+    def empty(cls):
+        """A formation with no aliens, used on boss levels"""
+        return cls(0, 0, 0, 0, 0, 0, BASE_ENEMY_SPEED)
+
+    def remove(self, enemy):
+        slot = enemy.slot
+        index = self.alive_slots.index(slot)
+        del self.alive_slots[index]
+        del self.enemies[index]
+        self.alive[slot] = 0
+        self.slot_enemies[slot] = None
+        if enemy in self.specials:
+            self.specials.remove(enemy)
+
+        self.front_enemies = None
+        self.edge_slots = None
+        row = enemy.row
+        self.row_counts[row] -= 1
+        while self.bottom_row >= 0 and not self.row_counts[self.bottom_row]:
+            self.bottom_row -= 1
+
+    def set_speed_multiplier(self, speed_multiplier):
+        """Set every regular alien's speed to base_speed * speed_multiplier (never below min_speed_multiplier)"""
+        speed_multiplier = max(speed_multiplier, self.min_speed_multiplier)
+        if speed_multiplier == self.speed_multiplier:
+            return
+        speed = self.speed
+        for enemy in self.enemies:
+            # Don't override speed for special enemies (they have their own speed boost)
+            if not enemy.is_special:
+                speed[enemy.slot] = enemy.base_speed * speed_multiplier
+        self.speed_multiplier = speed_multiplier
+
+    def step(self):
+        """March every alien one tick, dropping a row and reversing if any touched a screen edge"""
+        for enemy in self.specials:
+            enemy.record_afterimage()
+            enemy.update_invincibility()  # Update invincibility timer
+
+        x = self.x
+        speed = self.speed
+        direction = self.direction
+        for slot in self.alive_slots:
+            x[slot] += speed[slot] * direction
+
+        right_edge = SCREEN_WIDTH - ENEMY_WIDTH
+        edge_hit = False
+        for slot in self.get_edge_slots():
+            if x[slot] <= 0 or x[slot] >= right_edge:
+                edge_hit = True
+                break
+
+        if edge_hit:
+            row_y = self.row_y
+            for row in range(self.rows):
+                row_y[row] += ENEMY_DROP_SPEED
+            self.direction = -direction
+
+    def get_edge_slots(self):
+        """Slots to test against the screen edges: the outermost living regular columns plus specials.
+
+        Regular aliens all march at the same speed, so one alien from the leftmost and one
+        from the rightmost living column bound the rest. Specials move at their own speed
+        and are checked individually. Rebuilt after a kill or a new special.
+        """
+        if self.edge_slots is None:
+            cols = self.cols
+            left = right = None
+            for enemy in self.enemies:
+                if enemy.is_special:
+                    continue
+                col = enemy.slot % cols
+                if left is None or col < left % cols:
+                    left = enemy.slot
+                if right is None or col > right % cols:
+                    right = enemy.slot
+            self.edge_slots = [slot for slot in (left, right) if slot is not None]
+            self.edge_slots.extend(enemy.slot for enemy in self.specials)
+        return self.edge_slots
+
+    def get_front_enemies(self):
+        """Lowest living alien in each column, left to right"""
+        if self.front_enemies is None:
+            self.front_enemies = []
+            for col in range(self.cols):
+                for row in range(self.rows - 1, -1, -1):
+                    enemy = self.slot_enemies[row * self.cols + col]
+                    if enemy is not None:
+                        self.front_enemies.append(enemy)
+                        break
+        return self.front_enemies
+
+    def shoot(self, sound_manager=None):
+        """Return the bullets fired this tick.
+
+        Every eligible alien fires with ENEMY_FIRE_CHANCE per tick. Instead of rolling
+        for each one, the scheduler walks the sequence of (tick, alien) rolls and
+        draws the number of misses before the next hit from the geometric distribution.
+        """
+        shooters = self.get_front_enemies() if ENEMY_FIRE_FRONT_ONLY else self.enemies
+        if not shooters:
+            return []
+
+        rng = get_game_random()
+        if self.fire_countdown is None:
+            self.fire_countdown = self._roll_fire_countdown(rng)
+
+        bullets = []
+        position = self.fire_countdown
+        while position < len(shooters):
+            bullets.append(shooters[position].shoot(sound_manager))
+            position += 1 + self._roll_fire_countdown(rng)
+        self.fire_countdown = position - len(shooters)
+        return bullets
+
+    @staticmethod
+    def _roll_fire_countdown(rng):
+        """Number of misses before the next shot, geometric in ENEMY_FIRE_CHANCE"""
+        return int(math.log(1.0 - rng.random()) / math.log(1.0 - ENEMY_FIRE_CHANCE))
+
+    def get_bottom(self):
+        """Lowest point of the living aliens, or 0 when the grid is empty"""
+        if self.bottom_row < 0:
+            return 0
+        return self.row_y[self.bottom_row] + ENEMY_HEIGHT
+
+    def query(self, rect):
+        """Living aliens whose slot may overlap rect, in slot order.
+
+        Bounds are padded by a pixel because Enemy.rect rounds the float x; callers
+        still confirm hits with colliderect.
+        """
+        found = []
+        x = self.x
+        slot_enemies = self.slot_enemies
+        left = rect.left - ENEMY_WIDTH - 1
+        right = rect.right + 1
+        for row in range(self.rows):
+            if not self.row_counts[row]:
+                continue
+            top = self.row_y[row]
+            if rect.bottom < top - 1 or rect.top > top + ENEMY_HEIGHT + 1:
+                continue
+            first_slot = row * self.cols
+            for slot in range(first_slot, first_slot + self.cols):
+                enemy = slot_enemies[slot]
+                if enemy is not None and left <= x[slot] <= right:
+                    found.append(enemy)
+        return found
+
+    def draw(self, screen):
+        """Draw the grid in a single blits batch, then any invincibility shields on top"""
+        blits = []
+        for enemy in self.enemies:
+            blits.extend(enemy.get_draw_blits())
+        if blits:
+            screen.blits(blits, doreturn=False)
+        for enemy in self.specials:
+            if enemy.is_invincible:
+                enemy.draw_shield(screen)
+
+class EffectSprites:
+    """Shared renderer for the alpha-faded circles of explosions, debris and muzzle flashes.
+
+    Circles up to EFFECT_SPRITE_MAX_RADIUS are drawn once per (color, quantized radius)
+    and faded with set_alpha at blit time. Bigger ones (boss death explosions keep growing
+    past the screen size) are blended as horizontal spans of a solid row surface, which
+    only touches on-screen pixels inside the circle and avoids per-pixel alpha entirely.
+    """
+    circles = {}
+    rows = {}  # color -> solid band of EFFECT_SPAN_ROWS rows as wide as the screen
+    half_widths = {}  # radius -> half width of each EFFECT_SPAN_ROWS band
+
+    @staticmethod
+    def quantize_radius(radius):
+        radius = int(radius)
+        if radius <= EFFECT_EXACT_RADIUS:
+            return radius
+        return (radius + EFFECT_RADIUS_STEP // 2) // EFFECT_RADIUS_STEP * EFFECT_RADIUS_STEP
+
+    @classmethod
+    def get_circle(cls, color, radius):
+        key = (color, radius)
+        sprite = cls.circles.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            cls.circles[key] = sprite
+        return sprite
+
+    @classmethod
+    def draw_circle(cls, screen, color, center, radius, alpha=255):
+        """Filled circle around center faded to alpha (multiplied with any alpha in color)"""
+        radius = cls.quantize_radius(radius)
+        if radius <= 0 or alpha <= 0:
+            return
+        x = int(center[0])
+        y = int(center[1])
+        if radius <= EFFECT_SPRITE_MAX_RADIUS:
+            sprite = cls.get_circle(color, radius)
+            sprite.set_alpha(alpha)
+            screen.blit(sprite, (x - radius, y - radius))
+            return
+
+        cls.draw_spans(screen, color, x, y, radius, alpha)
+
+    @classmethod
+    def get_half_widths(cls, radius):
+        widths = cls.half_widths.get(radius)
+        if widths is None:
+            widths = []
+            for offset in range(-radius, radius, EFFECT_SPAN_ROWS):
+                middle = offset + EFFECT_SPAN_ROWS / 2
+                widths.append(int(math.sqrt(max(0, radius * radius - middle * middle)) + 0.5))
+            cls.half_widths[radius] = widths
+        return widths
+
+    @classmethod
+    def draw_spans(cls, screen, color, x, y, radius, alpha):
+        screen_width, screen_height = screen.get_size()
+        top = y - radius
+        first = max(0, -top) // EFFECT_SPAN_ROWS
+        bottom = min(screen_height, y + radius)
+        if top + first * EFFECT_SPAN_ROWS >= bottom:
+            return
+
+        row = cls.rows.get(color)
+        if row is None or row.get_width() < screen_width:
+            row = pygame.Surface((screen_width, EFFECT_SPAN_ROWS), 0, screen)
+            row.fill(color[:3])
+            cls.rows[color] = row
+        if len(color) > 3:
+            alpha = alpha * color[3] // 255
+        row.set_alpha(alpha)
+
+        spans = []
+        widths = cls.get_half_widths(radius)
+        for index in range(first, len(widths)):
+            band_top = top + index * EFFECT_SPAN_ROWS
+            if band_top >= bottom:
+                break
+            left = max(0, x - widths[index])
+            right = min(screen_width, x + widths[index])
+            if right > left:
+                spans.append((row, (left, band_top), (0, 0, right - left, EFFECT_SPAN_ROWS)))
+        screen.blits(spans, False)
+
+class ParticleSystem:
+    """Pool of simple circle particles stored as parallel arrays instead of per-particle dicts.
+
+    The create_*_explosion helpers still hand out particle dicts; extend() copies them into
+    the columns. Dead particles are swap-removed, so draw order is not preserved.
+    """
+    sprite_cache = {}  # (color, size, alpha) -> pre-rendered circle shared by every pool
+
+    def __init__(self, alpha_divisor=1, gravity=None):
+        self.alpha_divisor = alpha_divisor  # Alpha is life // alpha_divisor; None keeps particles opaque
+        self.gravity = gravity  # When set, overrides each particle's own gravity
+        self.x = array.array('d')
+        self.y = array.array('d')
+        self.vel_x = array.array('d')
+        self.vel_y = array.array('d')
+        self.gravities = array.array('d')
+        self.life = array.array('d')
+        self.size = array.array('i')
+        self.color = []
+
+    def __len__(self):
+        return len(self.life)
+
+    def clear(self):
+        for column in (self.x, self.y, self.vel_x, self.vel_y, self.gravities, self.life, self.size):
+            del column[:]
+        self.color.clear()
+
+    def add(self, x, y, vel_x, vel_y, life, size, color, gravity=0.0):
+        self.x.append(x)
+        self.y.append(y)
+        self.vel_x.append(vel_x)
+        self.vel_y.append(vel_y)
+        self.gravities.append(gravity if self.gravity is None else self.gravity)
+        self.life.append(life)
+        self.size.append(size)
+        self.color.append(color)
+
+    def extend(self, particles):
+        """Add particle dicts (x, y, vel_x, vel_y, life, size, color and optional gravity)"""
+        for particle in particles:
+            self.add(particle['x'], particle['y'], particle['vel_x'], particle['vel_y'],
+                     particle['life'], particle['size'], particle['color'], particle.get('gravity', 0.0))
+
+    def update(self, frame_ms):
+        x, y, vel_x, vel_y, gravities, life = self.x, self.y, self.vel_x, self.vel_y, self.gravities, self.life
+        count = len(life)
+        i = 0
+        while i < count:
+            x[i] += vel_x[i]
+            y[i] += vel_y[i]
+            vel_y[i] += gravities[i]
+            life[i] -= frame_ms
+            if life[i] > 0:
+                i += 1
+                continue
+
+            # Swap the last live particle into this slot; it is updated on the next pass
+            count -= 1
+            if i != count:
+                for column in (x, y, vel_x, vel_y, gravities, life, self.size, self.color):
+                    column[i] = column[count]
+
+        if count < len(life):
+            for column in (x, y, vel_x, vel_y, gravities, life, self.size, self.color):
+                del column[count:]
+
+    @classmethod
+    def get_sprite(cls, color, size, alpha):
+        alpha = min(255, -(-alpha // PARTICLE_ALPHA_STEP) * PARTICLE_ALPHA_STEP)
+        key = (color, size, alpha)
+        sprite = cls.sprite_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, alpha), (size, size), size)
+            cls.sprite_cache[key] = sprite
+        return sprite
+
+    def draw(self, screen):
+        x, y, life, sizes, colors = self.x, self.y, self.life, self.size, self.color
+        divisor = self.alpha_divisor
+        blits = []
+        for i in range(len(life)):
+            alpha = 255 if divisor is None else min(255, int(life[i]) // divisor)
+            if alpha <= 0:
+                continue
+            size = sizes[i]
+            blits.append((self.get_sprite(colors[i], size, alpha), (int(x[i] - size), int(y[i] - size))))
+        if blits:
+            screen.blits(blits, doreturn=False)
+
 class EnemyExplosion:
     """Simple explosion effect when enemy is destroyed"""
     def __init__(self, x, y, enemy_type):
+        rng = get_game_random()
         self.x = x
         self.y = y
         self.enemy_type = enemy_type
-        self.particles = []
-        self.start_time = pygame.time.get_ticks()
+        self.particles = ParticleSystem(gravity=0.1)
+        self.start_time = get_game_ticks()
         self.duration = 500  # 0.5 seconds
         
         # Create explosion particles based on enemy type
@@ -8516,49 +9852,35 @@ class EnemyExplosion:
         explosion_colors = colors[enemy_type] if enemy_type < len(colors) else colors[0]
         
         # Create 8-12 particles
-        for _ in range(random.randint(8, 12)):
-            particle = {
-                'x': x + random.randint(-10, 10),
-                'y': y + random.randint(-10, 10),
-                'vel_x': random.uniform(-3, 3),
-                'vel_y': random.uniform(-3, 3),
-                'color': random.choice(explosion_colors),
-                'size': random.randint(2, 5),
-                'life': random.randint(300, 500)
-            }
-            self.particles.append(particle)
+        for _ in range(rng.randint(8, 12)):
+            particle_x = x + rng.randint(-10, 10)
+            particle_y = y + rng.randint(-10, 10)
+            vel_x = rng.uniform(-3, 3)
+            vel_y = rng.uniform(-3, 3)
+            color = rng.choice(explosion_colors)
+            size = rng.randint(2, 5)
+            life = rng.randint(300, 500)
+            self.particles.add(particle_x, particle_y, vel_x, vel_y, life, size, color)
     
     def update(self):
         """Update explosion animation"""
-        current_time = pygame.time.get_ticks()
+        current_time = get_game_ticks()
         
         # Update particles
-        for particle in self.particles[:]:
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            particle['vel_y'] += 0.1  # Gravity
-            particle['life'] -= 16  # Assuming 60 FPS
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        self.particles.update(get_game_delta_ms())
         
         # Check if explosion is done
         return current_time - self.start_time < self.duration and len(self.particles) > 0
     
     def draw(self, screen):
         """Draw explosion particles"""
-        for particle in self.particles:
-            if particle['life'] > 0:
-                alpha = max(0, min(255, particle['life']))
-                # Create a surface for alpha blending
-                particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-                color_with_alpha = (*particle['color'], alpha)
-                pygame.draw.circle(particle_surface, color_with_alpha, 
-                                 (particle['size'], particle['size']), particle['size'])
-                screen.blit(particle_surface, (int(particle['x'] - particle['size']), 
-                                             int(particle['y'] - particle['size'])))
-
-class Bullet:
+        self.particles.draw(screen)
+
+class Bullet(PooledProjectile):
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', 'rect', 'owner_id', 'pierce_hits',
+                 'can_phase_barriers', 'boss_damage_multiplier', 'counts_for_pinpoint')
+    pool = []
+
     def __init__(self, x, y, speed, owner_id=None, pierce_hits=0, length_multiplier=1.0,
                  can_phase_barriers=False, boss_damage_multiplier=1.0, counts_for_pinpoint=False):
         self.x = x
@@ -8566,7 +9888,7 @@ class Bullet:
         self.width = 5
         self.height = int(15 * length_multiplier)
         self.speed = speed
-        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.place_rect(x, y, self.width, self.height)
         self.owner_id = owner_id
         self.pierce_hits = pierce_hits
         self.can_phase_barriers = can_phase_barriers
@@ -8593,7 +9915,7 @@ class PowerUp:
         self.power_type = power_type
         self.rect = pygame.Rect(x, y, self.width, self.height)
         self.speed = 3
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = get_game_ticks()
         
     def move(self):
         self.y += self.speed
@@ -8603,7 +9925,7 @@ class PowerUp:
         return self.y > SCREEN_HEIGHT
         
     def is_expired(self):
-        return pygame.time.get_ticks() - self.spawn_time > 15000
+        return get_game_ticks() - self.spawn_time > 15000
         
     def draw(self, screen):
         colors = {
@@ -8614,12 +9936,12 @@ class PowerUp:
         }
         color = colors.get(self.power_type, WHITE)
         
-        pulse = abs(math.sin(pygame.time.get_ticks() * 0.01)) * 8
+        pulse = abs(math.sin(get_game_ticks() * 0.01)) * 8
         pygame.draw.circle(screen, color, 
                          (self.x + self.width // 2, self.y + self.height // 2), 
                          self.width // 2 + pulse)
         
-        font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 14)
+        font = get_font(14)
         symbols = {
             'rapid_fire': 'R',
             'invincibility': 'I', 
@@ -8639,7 +9961,7 @@ class LaserBeam:
         # Apply duration multiplier to base duration
         base_duration = 1000  # 1 second base
         self.duration = int(base_duration * duration_multiplier)
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = get_game_ticks()
         self.rect = pygame.Rect(x - self.width // 2, 0, self.width, self.height)
         self.owner_player_id = owner_player_id
         
@@ -8648,11 +9970,11 @@ class LaserBeam:
         self.rect.x = new_x - self.width // 2
         
     def is_active(self):
-        return pygame.time.get_ticks() - self.start_time < self.duration
+        return get_game_ticks() - self.start_time < self.duration
         
     def draw(self, screen):
         if self.is_active():
-            alpha = 150 + abs(math.sin(pygame.time.get_ticks() * 0.02)) * 105
+            alpha = 150 + abs(math.sin(get_game_ticks() * 0.02)) * 105
             laser_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             pygame.draw.rect(laser_surface, (*CYAN, int(alpha)), (0, 0, self.width, self.height))
             screen.blit(laser_surface, (self.x - self.width // 2, 0))
@@ -8664,48 +9986,79 @@ class Barrier:
         self.width = 90
         self.height = 60
         self.max_block_health = max_block_health  # 1 = normal, 2 = reinforced level 1, 3 = reinforced level 2
-        self.block_health = {}  # Dictionary mapping block positions to health
+        self.block_health = bytearray(BARRIER_ROWS * BARRIER_COLS)  # Row-major block health, 0 = no block
+        self.rect = pygame.Rect(x, y, self.width, self.height)  # Bounds of every block, for the broad-phase
+        self.surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.dirty = True  # Surface needs redrawing after a block changed
         self.create_barrier()
 
     def create_barrier(self):
-        for row in range(5):
-            for col in range(8):
+        for row in range(BARRIER_ROWS):
+            for col in range(BARRIER_COLS):
                 if not (row == 0 and (col == 0 or col == 7)) and not (row == 1 and (col <= 1 or col >= 6)):
-                    block_x = self.x + col * 11
-                    block_y = self.y + row * 12
-                    block = pygame.Rect(block_x, block_y, 11, 12)
-                    # Store block with full health
-                    self.block_health[tuple([block.x, block.y, block.width, block.height])] = self.max_block_health
+                    self.block_health[row * BARRIER_COLS + col] = self.max_block_health
+        self.dirty = True
 
     def check_collision(self, bullet_rect):
-        for block_key, health in list(self.block_health.items()):
-            block = pygame.Rect(block_key[0], block_key[1], block_key[2], block_key[3])
-            if block.colliderect(bullet_rect):
-                # Decrease health instead of immediate removal
-                self.block_health[block_key] -= 1
-                if self.block_health[block_key] <= 0:
-                    del self.block_health[block_key]
-                return True
+        """Damage the first block (row by row) the rect overlaps. Returns True if one was hit."""
+        if bullet_rect.width <= 0 or bullet_rect.height <= 0:
+            return False  # Empty rects never collide (same as Rect.colliderect)
+        first_col = max(0, (bullet_rect.left - self.x) // BARRIER_BLOCK_WIDTH)
+        last_col = min(BARRIER_COLS - 1, (bullet_rect.right - 1 - self.x) // BARRIER_BLOCK_WIDTH)
+        first_row = max(0, (bullet_rect.top - self.y) // BARRIER_BLOCK_HEIGHT)
+        last_row = min(BARRIER_ROWS - 1, (bullet_rect.bottom - 1 - self.y) // BARRIER_BLOCK_HEIGHT)
+        block_health = self.block_health
+        for row in range(first_row, last_row + 1):
+            for index in range(row * BARRIER_COLS + first_col, row * BARRIER_COLS + last_col + 1):
+                if block_health[index]:
+                    # Decrease health instead of immediate removal
+                    block_health[index] -= 1
+                    self.dirty = True
+                    return True
         return False
 
+    @staticmethod
+    def resolve_collisions(bullets, barrier_grid):
+        """Test a whole bullet list against the barriers in barrier_grid (a SpatialHash).
+
+        Each bullet damages at most one block; returns the bullets that hit something.
+        """
+        hits = []
+        for bullet in bullets:
+            bullet_rect = bullet.rect
+            for barrier in barrier_grid.query(bullet_rect):
+                if barrier.check_collision(bullet_rect):
+                    hits.append(bullet)
+                    break
+        return hits
+
+    def get_block_color(self, health):
+        # Color based on remaining health
+        if health >= self.max_block_health:
+            return GREEN  # Full health
+        elif health == 2:
+            return YELLOW  # 2 hits remaining (for level 2 reinforced)
+        elif health == 1:
+            if self.max_block_health == 3:
+                return RED  # 1 hit remaining (for level 2 reinforced)
+            elif self.max_block_health == 2:
+                return YELLOW  # 1 hit remaining (for level 1 reinforced)
+        return GREEN  # Fallback
+
+    def redraw_surface(self):
+        """Re-render the cached barrier surface from the health grid"""
+        self.surface.fill((0, 0, 0, 0))
+        for index, health in enumerate(self.block_health):
+            if health:
+                row, col = divmod(index, BARRIER_COLS)
+                block = (col * BARRIER_BLOCK_WIDTH, row * BARRIER_BLOCK_HEIGHT, BARRIER_BLOCK_WIDTH, BARRIER_BLOCK_HEIGHT)
+                pygame.draw.rect(self.surface, self.get_block_color(health), block)
+        self.dirty = False
+
     def draw(self, screen):
-        for block_key, health in self.block_health.items():
-            block = pygame.Rect(block_key[0], block_key[1], block_key[2], block_key[3])
-            # Color based on remaining health
-            if health >= self.max_block_health:
-                color = GREEN  # Full health
-            elif health == 2:
-                color = YELLOW  # 2 hits remaining (for level 2 reinforced)
-            elif health == 1:
-                if self.max_block_health == 3:
-                    color = RED  # 1 hit remaining (for level 2 reinforced)
-                elif self.max_block_health == 2:
-                    color = YELLOW  # 1 hit remaining (for level 1 reinforced)
-                else:
-                    color = GREEN  # Should not happen for normal barriers
-            else:
-                color = GREEN  # Fallback
-            pygame.draw.rect(screen, color, block)
+        if self.dirty:
+            self.redraw_surface()
+        screen.blit(self.surface, (self.x, self.y))
 
 class ProfileNameInputScreen:
     """Screen for entering a profile name (similar to NameInputScreen)"""
@@ -8713,9 +10066,9 @@ class ProfileNameInputScreen:
         self.screen = screen
         self.sound_manager = sound_manager
         self.key_bindings = key_bindings if key_bindings else {}
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 36)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 24)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
+        self.font_large = get_font(36)
+        self.font_medium = get_font(24)
+        self.font_small = get_font(20)
 
         # Name input system
         self.max_name_length = 15
@@ -8901,9 +10254,9 @@ class ProfileSelectionScreen:
         self.sound_manager = sound_manager
         self.profile_manager = profile_manager
         self.key_bindings = key_bindings if key_bindings else {}
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 36)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 24)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 18)
+        self.font_large = get_font(36)
+        self.font_medium = get_font(24)
+        self.font_small = get_font(18)
 
         self.profile_names = profile_manager.get_profile_names()
         self.profile_names.append("Cancel")  # Add cancel option
@@ -8995,9 +10348,9 @@ class UserMenuScreen:
         self.sound_manager = sound_manager
         self.user_manager = user_manager
         self.key_bindings = key_bindings if key_bindings else {}
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 36)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 24)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 18)
+        self.font_large = get_font(36)
+        self.font_medium = get_font(24)
+        self.font_small = get_font(18)
 
         self.selected_index = 0
         self.menu_items = []
@@ -9216,10 +10569,10 @@ class SettingsScreen:
         self.sound_manager = sound_manager
         self.key_bindings = key_bindings
         self.profile_manager = profile_manager
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 32)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 16)
-        self.font_tiny = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 12)
+        self.font_large = get_font(32)
+        self.font_medium = get_font(20)
+        self.font_small = get_font(16)
+        self.font_tiny = get_font(12)
 
         # Options organized as (display_text, binding_key, input_type)
         self.options = [
@@ -9425,7 +10778,7 @@ class SettingsScreen:
         self.starfield.draw(self.screen)
 
         # Title
-        title_text = self.font_large.render("SETTINGS", True, GREEN)
+        title_text = render_text(self.font_large, "SETTINGS", True, GREEN)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
         self.screen.blit(title_text, title_rect)
 
@@ -9433,15 +10786,15 @@ class SettingsScreen:
         if self.awaiting_input:
             # Show appropriate prompt based on input type
             if self.awaiting_input_type == "keyboard":
-                prompt_text = self.font_medium.render("Press any key...", True, YELLOW)
+                prompt_text = render_text(self.font_medium, "Press any key...", True, YELLOW)
             else:
-                prompt_text = self.font_medium.render("Press any button or D-pad direction...", True, YELLOW)
+                prompt_text = render_text(self.font_medium, "Press any button or D-pad direction...", True, YELLOW)
             prompt_rect = prompt_text.get_rect(center=(SCREEN_WIDTH // 2, 500))
             self.screen.blit(prompt_text, prompt_rect)
 
             # Show which setting is being changed
             option_display = self.options[self.selected_option][0]
-            setting_text = self.font_small.render(option_display, True, WHITE)
+            setting_text = render_text(self.font_small, option_display, True, WHITE)
             setting_rect = setting_text.get_rect(center=(SCREEN_WIDTH // 2, 450))
             self.screen.blit(setting_text, setting_rect)
         else:
@@ -9464,15 +10817,15 @@ class SettingsScreen:
             back_button_y = profile_start_y + len(profile_items) * spacing + 50
 
             # Section headers
-            keyboard_header = self.font_small.render("KEYBOARD CONTROLS", True, CYAN)
+            keyboard_header = render_text(self.font_small, "KEYBOARD CONTROLS", True, CYAN)
             keyboard_rect = keyboard_header.get_rect(center=(SCREEN_WIDTH // 2, keyboard_header_y))
             self.screen.blit(keyboard_header, keyboard_rect)
 
-            controller_header = self.font_small.render("CONTROLLER INPUTS", True, CYAN)
+            controller_header = render_text(self.font_small, "CONTROLLER INPUTS", True, CYAN)
             controller_rect = controller_header.get_rect(center=(SCREEN_WIDTH // 2, controller_header_y))
             self.screen.blit(controller_header, controller_rect)
 
-            profile_header = self.font_small.render("PROFILE MANAGEMENT", True, CYAN)
+            profile_header = render_text(self.font_small, "PROFILE MANAGEMENT", True, CYAN)
             profile_rect = profile_header.get_rect(center=(SCREEN_WIDTH // 2, profile_header_y))
             self.screen.blit(profile_header, profile_rect)
 
@@ -9487,20 +10840,20 @@ class SettingsScreen:
 
                 if input_type == "keyboard":
                     key_name = self.get_key_name(self.key_bindings[binding_key])
-                    option_text = self.font_small.render(f"{display_text}: {key_name}", True, color)
+                    option_text = render_text(self.font_small, f"{display_text}: {key_name}", True, color)
                     option_rect = option_text.get_rect(center=(SCREEN_WIDTH // 2, keyboard_start_y + keyboard_index * spacing))
                     keyboard_index += 1
                 elif input_type == "controller":
                     binding_name = self.get_controller_binding_name(self.key_bindings[binding_key])
-                    option_text = self.font_small.render(f"{display_text}: {binding_name}", True, color)
+                    option_text = render_text(self.font_small, f"{display_text}: {binding_name}", True, color)
                     option_rect = option_text.get_rect(center=(SCREEN_WIDTH // 2, controller_start_y + controller_index * spacing))
                     controller_index += 1
                 elif input_type in ["save", "load"]:
-                    option_text = self.font_medium.render(display_text, True, color)
+                    option_text = render_text(self.font_medium, display_text, True, color)
                     option_rect = option_text.get_rect(center=(SCREEN_WIDTH // 2, profile_start_y + profile_index * spacing))
                     profile_index += 1
                 else:  # Back option
-                    option_text = self.font_medium.render(display_text, True, color)
+                    option_text = render_text(self.font_medium, display_text, True, color)
                     option_rect = option_text.get_rect(center=(SCREEN_WIDTH // 2, back_button_y))
 
                 self.screen.blit(option_text, option_rect)
@@ -9510,7 +10863,7 @@ class SettingsScreen:
             current_time = pygame.time.get_ticks()
             if current_time - self.message_time < self.message_duration:
                 # Message is still active
-                message_text = self.font_medium.render(self.message, True, GREEN)
+                message_text = render_text(self.font_medium, self.message, True, GREEN)
                 message_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
                 # Draw a background for the message
                 bg_rect = pygame.Rect(message_rect.x - 10, message_rect.y - 5, message_rect.width + 20, message_rect.height + 10)
@@ -9531,12 +10884,13 @@ class TitleScreen:
         self.key_bindings = key_bindings
         self.user_manager = user_manager
         self.achievement_manager = achievement_manager
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 48)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 28)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(28)
+        self.font_small = get_font(20)
         self.selected_option = 0
 
         # Check if save file exists and add Continue option if it does
+        PERSISTENCE.flush()
         self.has_save_file = os.path.exists("savegame.json")
         if self.has_save_file:
             self.options = ["Continue", "Single Player", "Co-op", "Users", "Settings", "High Scores", "Achievements", "Quit"]
@@ -9671,14 +11025,14 @@ class TitleScreen:
         self.starfield.draw(self.screen)
 
         # Title
-        title_text = self.font_large.render("PLACE INVADERS", True, GREEN)
+        title_text = render_text(self.font_large, "PLACE INVADERS", True, GREEN)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
         self.screen.blit(title_text, title_rect)
 
         # Menu options
         for i, option in enumerate(self.options):
             color = YELLOW if i == self.selected_option else WHITE
-            option_text = self.font_medium.render(option, True, color)
+            option_text = render_text(self.font_medium, option, True, color)
             option_rect = option_text.get_rect(center=(SCREEN_WIDTH // 2, 380 + i * 70))
             self.screen.blit(option_text, option_rect)
 
@@ -9688,13 +11042,13 @@ class TitleScreen:
 
         preview_y = 880
         if single_best:
-            single_text = self.font_small.render(f"Best Single: {single_best['score']:,} - {single_best['name']}", True, CYAN)
+            single_text = render_text(self.font_small, f"Best Single: {single_best['score']:,} - {single_best['name']}", True, CYAN)
             single_rect = single_text.get_rect(center=(SCREEN_WIDTH // 2, preview_y))
             self.screen.blit(single_text, single_rect)
             preview_y += 40
 
         if coop_best:
-            coop_text = self.font_small.render(f"Best Co-op: {coop_best['score']:,} - {coop_best['name']}", True, CYAN)
+            coop_text = render_text(self.font_small, f"Best Co-op: {coop_best['score']:,} - {coop_best['name']}", True, CYAN)
             coop_rect = coop_text.get_rect(center=(SCREEN_WIDTH // 2, preview_y))
             self.screen.blit(coop_text, coop_rect)
 
@@ -9702,8 +11056,8 @@ class TitleScreen:
         active_user_name = active_user["name"] if active_user else "No User"
         current_title = self.achievement_manager.get_current_title() if active_user else "N/A"
 
-        user_text = self.font_small.render(f"User: {active_user_name}", True, CYAN)
-        title_text = self.font_small.render(f"Title: {current_title}", True, CYAN)
+        user_text = render_text(self.font_small, f"User: {active_user_name}", True, CYAN)
+        title_text = render_text(self.font_small, f"Title: {current_title}", True, CYAN)
         user_rect = user_text.get_rect(topright=(SCREEN_WIDTH - 40, 40))
         title_rect = title_text.get_rect(topright=(SCREEN_WIDTH - 40, 75))
         self.screen.blit(user_text, user_rect)
@@ -9716,9 +11070,9 @@ class DebugMenu:
         self.screen = screen
         self.sound_manager = sound_manager
         self.key_bindings = key_bindings if key_bindings else {}
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 36)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 24)
-        self.font_small = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 16)
+        self.font_large = get_font(36)
+        self.font_medium = get_font(24)
+        self.font_small = get_font(16)
         self.selected_index = 0
         self.scroll_offset = 0
 
@@ -9749,6 +11103,7 @@ class DebugMenu:
             'boss_encounter_level': 1,
             'force_rubiks_attack_color': 'Random',
             'force_special_enemy': 'Random',
+            'frame_profiler': False,
             'players': [self._default_player_config(), self._default_player_config(player_id=2)],
         }
 
@@ -9783,6 +11138,8 @@ class DebugMenu:
             {'type': 'int', 'label': 'Boss Encounter Level', 'path': ('boss_encounter_level',), 'min': 1, 'max': 50, 'step': 1},
             {'type': 'label', 'label': 'Special Enemy Testing'},
             {'type': 'choice', 'label': 'Force Last Enemy Type', 'choices': ['Random', 'None', 'Gold', 'Silver'], 'path': ('force_special_enemy',)},
+            {'type': 'label', 'label': 'Diagnostics'},
+            {'type': 'bool', 'label': 'Frame Profiler', 'path': ('frame_profiler',)},
         ]
 
         # Conditionally add Rubik's Cube attack color selector if RubiksCubeBoss is selected
@@ -9984,20 +11341,20 @@ class UFOWarningScreen:
     def __init__(self, screen, level):
         self.screen = screen
         self.level = level
-        self.font_huge = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 48)
-        self.font_large = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 36)
-        self.font_medium = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 24)
-        self.start_time = pygame.time.get_ticks()
+        self.font_huge = get_font(48)
+        self.font_large = get_font(36)
+        self.font_medium = get_font(24)
+        self.start_time = get_game_ticks()
         self.duration = 3000  # 3 seconds
         
     def is_finished(self):
-        return pygame.time.get_ticks() - self.start_time >= self.duration
+        return get_game_ticks() - self.start_time >= self.duration
         
     def draw(self):
         self.screen.fill(BLACK)
         
         # Flashing red background
-        flash_intensity = abs(math.sin(pygame.time.get_ticks() * 0.01)) * 0.3
+        flash_intensity = abs(math.sin(get_game_ticks() * 0.01)) * 0.3
         flash_color = (int(50 * flash_intensity), 0, 0)
         self.screen.fill(flash_color)
         
@@ -10017,7 +11374,7 @@ class UFOWarningScreen:
         self.screen.blit(level_text, level_rect)
         
         # Countdown
-        remaining = (self.duration - (pygame.time.get_ticks() - self.start_time)) / 1000.0
+        remaining = (self.duration - (get_game_ticks() - self.start_time)) / 1000.0
         countdown_text = self.font_medium.render(f"Prepare! {remaining:.1f}s", True, CYAN)
         countdown_rect = countdown_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 150))
         self.screen.blit(countdown_text, countdown_rect)
@@ -10072,16 +11429,131 @@ def is_button_pressed(event, key_bindings, button_binding_key, threshold=0.5):
 
     return False
 
+class InputScript:
+    """Scripted per-tick input for headless simulation.
+
+    frames maps a tick number to an input bitmask (INPUT_LEFT/INPUT_RIGHT/INPUT_FIRE/
+    INPUT_FIRE_PRESS, shifted by INPUT_BITS_PER_PLAYER for player 2). Ticks not listed
+    use the default.
+    """
+    def __init__(self, frames=None, default=0):
+        self.frames = frames if frames else {}
+        self.default = default
+
+    def get_input(self, tick):
+        return self.frames.get(tick, self.default)
+
+    def get_level_up(self, tick):
+        """Recorded level up state for this tick (None lets the game pick upgrades itself)"""
+        return None
+
+
+class AutoPilotScript(InputScript):
+    """Default headless input: sweeps each ship back and forth while tapping fire"""
+    def __init__(self, sweep_ticks=90, fire_interval=4):
+        super().__init__()
+        self.sweep_ticks = sweep_ticks
+        self.fire_interval = fire_interval
+
+    def get_input(self, tick):
+        bits = INPUT_LEFT if (tick // self.sweep_ticks) % 2 == 0 else INPUT_RIGHT
+        if tick % self.fire_interval == 0:
+            bits |= INPUT_FIRE_PRESS
+        # Player 2 mirrors player 1 so co-op ships spread out
+        mirrored = bits ^ (INPUT_LEFT | INPUT_RIGHT)
+        return bits | (mirrored << INPUT_BITS_PER_PLAYER)
+
+
+class SpatialHash:
+    """Uniform grid broad-phase for rect collisions.
+
+    Each object is bucketed into every cell its rect overlaps. query() returns the
+    objects sharing a cell with a rect in insertion order, so a loop that stops at the
+    first colliding candidate hits the same object a scan of the original list would.
+    """
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> list of (insert_index, obj)
+        self.entries = {}  # id(obj) -> ((insert_index, obj), cell keys)
+        self.insert_count = 0
+
+    def clear(self):
+        self.cells.clear()
+        self.entries.clear()
+        self.insert_count = 0
+
+    def _cell_keys(self, rect):
+        size = self.cell_size
+        left = rect.left // size
+        right = max(rect.left, rect.right - 1) // size
+        top = rect.top // size
+        bottom = max(rect.top, rect.bottom - 1) // size
+        return [(cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1)]
+
+    def insert(self, obj, rect):
+        entry = (self.insert_count, obj)
+        self.insert_count += 1
+        keys = self._cell_keys(rect)
+        self.entries[id(obj)] = (entry, keys)
+        for key in keys:
+            bucket = self.cells.get(key)
+            if bucket is None:
+                self.cells[key] = [entry]
+            else:
+                bucket.append(entry)
+
+    def remove(self, obj):
+        record = self.entries.pop(id(obj), None)
+        if record:
+            entry, keys = record
+            for key in keys:
+                self.cells[key].remove(entry)
+
+    def query(self, rect):
+        """Candidates whose cells overlap rect (callers still do the exact colliderect test)"""
+        cells = self.cells
+        found = {}
+        for key in self._cell_keys(rect):
+            bucket = cells.get(key)
+            if bucket:
+                for index, obj in bucket:
+                    found[index] = obj
+        if len(found) < 2:
+            return list(found.values())
+        return [found[index] for index in sorted(found)]
+
+
 class Game:
-    def __init__(self, score_manager, sound_manager, achievement_manager=None, achievement_managers=None, key_bindings=None):
-        self.screen = create_display(fullscreen=True)
+    def __init__(self, score_manager, sound_manager, achievement_manager=None, achievement_managers=None, key_bindings=None, headless=False, seed=None, record_path=None):
+        self.headless = headless
+        self.screen = create_display(fullscreen=not headless)
 
         pygame.display.set_caption("Place Invaders")
         self.clock = pygame.time.Clock()
+        # Gameplay time for every entity (pygame's clock above only limits the frame rate)
+        self.game_clock = GameClock()
+        self.game_clock.install()
+        # Gameplay randomness, seeded so a run can be replayed from its recorded input
+        self.rng = GameRandom(seed)
+        self.rng.install()
+        self.record_path = record_path
+        self.replay_recorder = None
+        self.show_debug_overlay = False
+        self.profiler = FrameProfiler()
+        # Render layers kept between frames (see draw)
+        self.hud_key = None
+        self.hud_blits = []
+        self.flash_overlay = None
+        self.game_over_overlay = None
+        # Collision broad-phase grids, rebuilt at the start of every check_collisions.
+        # Regular aliens are queried through their EnemyFormation instead.
+        self.barrier_grid = SpatialHash()
+        self.player_grid = SpatialHash()
         self.running = True
         self.game_over = False
         self.paused = False
         self.pause_menu = None
+        self.tick_count = 0
         self.score = 0
         self.level = 1
         self.total_enemies_killed = 0
@@ -10172,14 +11644,15 @@ class Game:
         self.players = []
         self.player_bullets = []
         self.enemy_bullets = []
-        self.enemies = []
+        self.enemy_formation = EnemyFormation.empty()
+        self.enemies = self.enemy_formation.enemies
         self.barriers = []
         self.power_ups = []
         self.laser_beams = []
         self.enemy_explosions = []
-        self.boss_explosion_particles = []
-        self.player_explosion_particles = []
-        self.muzzle_flash_particles = []
+        self.boss_explosion_particles = ParticleSystem(alpha_divisor=3, gravity=0.2)
+        self.player_explosion_particles = ParticleSystem(alpha_divisor=2)
+        self.muzzle_flash_particles = ParticleSystem(gravity=0.0)
         self.muzzle_flash_flashes = []  # Bright expanding circles for muzzle flash
         self.screen_shake_intensity = 0
         self.screen_shake_duration = 0
@@ -10188,10 +11661,10 @@ class Game:
         self.boss_explosion_waves = []
         self.available_bosses = [Boss, AlienOverlordBoss, BulletHellBoss, AsteroidFieldBoss, RubiksCubeBoss, SnakeBoss, RogueTerminalBoss]
 
-        self.font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 28)
-        self.small_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 20)
-        self.tiny_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 16)
-        self.powerup_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 12)  # Small font for powerup indicators below ships
+        self.font = get_font(28)
+        self.small_font = get_font(20)
+        self.tiny_font = get_font(16)
+        self.powerup_font = get_font(12)  # Small font for powerup indicators below ships
 
         # Starfield background
         self.starfield = StarField()
@@ -10231,12 +11704,18 @@ class Game:
         if self.sound_manager:
             self.sound_manager.play_sound('menu_select')
         self.paused = True
+        self.game_clock.pause()
             
     def setup_game(self, mode, debug_config=None):
         self.coop_mode = (mode == "coop")
         self.players = []
         self.player_stats = []  # Reset stats
 
+        # Restart the random stream so the run depends only on the seed and the input
+        self.rng.seed(self.rng.initial_seed)
+        if self.record_path:
+            self.replay_recorder = ReplayRecorder(self.rng.initial_seed, mode, debug_config)
+
         # Clear shared repeat bonus tracking for new run
         self.repeat_bonuses_awarded_this_tick.clear()
 
@@ -10244,9 +11723,9 @@ class Game:
         for player_id, manager in self.achievement_managers.items():
             manager.start_new_run(is_coop=self.coop_mode)
 
-        # Delete any existing save file when starting a new game
-        if os.path.exists("savegame.json"):
-            os.remove("savegame.json")
+        # Delete any existing save file when starting a new game (simulations leave it alone)
+        if not self.headless:
+            PERSISTENCE.remove("savegame.json")
 
         if self.coop_mode:
             controller1 = self.controllers[0] if len(self.controllers) > 0 else None
@@ -10296,6 +11775,8 @@ class Game:
             XP_BASE_REQUIREMENT * (1 + XP_INCREASE_RATE) ** (self.xp_system.level - 1)
         )
 
+        self.profiler.enabled = debug_config.get('frame_profiler', False)
+
         # Apply boss testing overrides
         self.debug_force_boss_level = debug_config.get('force_boss_level', False)
         boss_type_name = debug_config.get('force_boss_type', 'Random')
@@ -10333,7 +11814,7 @@ class Game:
             player.is_alive = True
 
             player.invincible = config.get('invincible', False)
-            player.invincible_end_time = pygame.time.get_ticks() + 10_000_000 if player.invincible else 0
+            player.invincible_end_time = get_game_ticks() + 10_000_000 if player.invincible else 0
 
             if config.get('boss_shield', False):
                 player.has_boss_shield_upgrade = True
@@ -10456,11 +11937,11 @@ class Game:
             save_data['player_stats'].append(stats_data)
 
         # Write to file
-        with open(filename, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        PERSISTENCE.save_json(filename, save_data, indent=2)
 
     def load_game(self, filename="savegame.json"):
         """Load game state from a file and setup the game"""
+        PERSISTENCE.flush()
         with open(filename, 'r') as f:
             save_data = json.load(f)
 
@@ -10639,13 +12120,15 @@ class Game:
             self.is_boss_level = self.is_level_a_boss_level(self.level)
         self.boss_shield_granted = False
         self.track_for_all_players("start_level", self.is_boss_level)
+        self.profiler.set_segment(f"level {self.level}")
 
         if self.is_boss_level:
             # ADDED: Show UFO warning before boss level
             self.showing_ufo_warning = True
             self.ufo_warning_screen = UFOWarningScreen(self.screen, self.level)
             self.current_boss = None  # Don't create boss until warning is done
-            self.enemies = []
+            self.enemy_formation = EnemyFormation.empty()
+            self.enemies = self.enemy_formation.enemies
         else:
             self.showing_ufo_warning = False
             self.ufo_warning_screen = None
@@ -10653,6 +12136,7 @@ class Game:
             self.create_enemy_grid()
 
     def create_boss_instance(self):
+        rng = get_game_random()
         # Check for debug override first
         if self.debug_force_boss_type is not None:
             boss_class = self.debug_force_boss_type
@@ -10662,7 +12146,7 @@ class Game:
             # If all bosses are filtered out (shouldn't happen with 4+ bosses), use all
             if not available:
                 available = self.available_bosses
-            boss_class = random.choice(available)
+            boss_class = rng.choice(available)
             # Track this boss for next selection
             self.last_boss_type = boss_class
 
@@ -10697,7 +12181,6 @@ class Game:
             self.barriers.append(Barrier(barrier_x, barrier_y, max_block_health))
             
     def create_enemy_grid(self):
-        self.enemies = []
         rows = 5
         cols = 12
         enemy_spacing_x = 90
@@ -10706,20 +12189,16 @@ class Game:
         start_y = 100
         
         level_speed = self.calculate_enemy_speed_for_level(self.level)
-        
-        for row in range(rows):
-            for col in range(cols):
-                enemy_x = start_x + col * enemy_spacing_x
-                enemy_y = start_y + row * enemy_spacing_y
-                enemy = Enemy(enemy_x, enemy_y, row)  # Pass row as enemy_type
-                enemy.base_speed = level_speed
-                enemy.speed = level_speed
-                self.enemies.append(enemy)
+        self.enemy_formation = EnemyFormation(rows, cols, start_x, start_y,
+                                              enemy_spacing_x, enemy_spacing_y, level_speed)
+        # Shared with the formation, which removes killed aliens from it
+        self.enemies = self.enemy_formation.enemies
                 
         self.update_enemy_speed()
         
     def check_special_enemy_spawn(self):
         """Check if we should spawn a special gold or silver enemy when only 1 enemy remains"""
+        rng = get_game_random()
         # Only spawn in non-boss levels
         if self.is_boss_level:
             return
@@ -10750,13 +12229,13 @@ class Game:
                 # If 'Random', continue with normal random logic below
 
             # Roll for gold enemy (1/50 chance)
-            if random.randint(1, 50) == 1:
+            if rng.randint(1, 50) == 1:
                 enemy.make_special('gold')
                 self.special_enemy_spawned_this_level = True
                 return
 
             # Roll for silver enemy (1/40 chance)
-            if random.randint(1, 40) == 1:
+            if rng.randint(1, 40) == 1:
                 enemy.make_special('silver')
                 self.special_enemy_spawned_this_level = True
                 return
@@ -10765,42 +12244,43 @@ class Game:
             self.special_enemy_spawned_this_level = True
 
     def update_enemy_speed(self):
-        # More aggressive speed increase as enemies are eliminated
-        total_enemies = ENEMY_GRID_TOTAL
         remaining_enemies = len(self.enemies)
         if remaining_enemies > 0:
-            if USE_THRESHOLD_PROGRESSION:
-                # Threshold-based progression: precise control at specific enemy counts
-                # Iterate through thresholds to find the best matching multiplier
-                # (list should be sorted descending, lowest threshold = highest multiplier)
-                speed_multiplier = 1.0  # Default fallback
-                for threshold_enemies, multiplier in ENEMY_SPEED_THRESHOLDS:
-                    if remaining_enemies <= threshold_enemies:
-                        speed_multiplier = multiplier
-                    # Keep iterating to find the lowest applicable threshold
-            else:
-                # Formula-based progression with configurable curve
-                destroyed_ratio = (total_enemies - remaining_enemies) / total_enemies
-                # Apply exponent to curve the progression:
-                # - 1.0 = linear (default)
-                # - 2.0 = quadratic (accelerates faster)
-                # - 0.5 = square root (accelerates slower)
-                curved_ratio = destroyed_ratio ** ENEMY_SPEED_PROGRESSION_EXPONENT
-                speed_multiplier = 1 + curved_ratio * ENEMY_SPEED_MULTIPLIER_MAX
-
-                # Legacy final threshold boost (only in formula mode)
-                if remaining_enemies <= ENEMY_SPEED_FINAL_THRESHOLD:
-                    extra_multiplier = (ENEMY_SPEED_FINAL_THRESHOLD - remaining_enemies + 1) * ENEMY_SPEED_FINAL_MULTIPLIER
-                    speed_multiplier += extra_multiplier
-
-            for enemy in self.enemies:
-                # Don't override speed for special enemies (they have their own speed boost)
-                if not enemy.is_special:
-                    enemy.speed = enemy.base_speed * speed_multiplier
+            self.enemy_formation.set_speed_multiplier(self.get_enemy_speed_multiplier(remaining_enemies))
 
         # Check if we should spawn a special enemy
         self.check_special_enemy_spawn()
 
+    def get_enemy_speed_multiplier(self, remaining_enemies):
+        """Speed multiplier for regular aliens with remaining_enemies of the grid left"""
+        # More aggressive speed increase as enemies are eliminated
+        total_enemies = ENEMY_GRID_TOTAL
+        if USE_THRESHOLD_PROGRESSION:
+            # Threshold-based progression: precise control at specific enemy counts
+            # Iterate through thresholds to find the best matching multiplier
+            # (list should be sorted descending, lowest threshold = highest multiplier)
+            speed_multiplier = 1.0  # Default fallback
+            for threshold_enemies, multiplier in ENEMY_SPEED_THRESHOLDS:
+                if remaining_enemies <= threshold_enemies:
+                    speed_multiplier = multiplier
+                # Keep iterating to find the lowest applicable threshold
+        else:
+            # Formula-based progression with configurable curve
+            destroyed_ratio = (total_enemies - remaining_enemies) / total_enemies
+            # Apply exponent to curve the progression:
+            # - 1.0 = linear (default)
+            # - 2.0 = quadratic (accelerates faster)
+            # - 0.5 = square root (accelerates slower)
+            curved_ratio = destroyed_ratio ** ENEMY_SPEED_PROGRESSION_EXPONENT
+            speed_multiplier = 1 + curved_ratio * ENEMY_SPEED_MULTIPLIER_MAX
+
+            # Legacy final threshold boost (only in formula mode)
+            if remaining_enemies <= ENEMY_SPEED_FINAL_THRESHOLD:
+                extra_multiplier = (ENEMY_SPEED_FINAL_THRESHOLD - remaining_enemies + 1) * ENEMY_SPEED_FINAL_MULTIPLIER
+                speed_multiplier += extra_multiplier
+
+        return speed_multiplier
+
     def track_shot_at_last_enemy(self, player_id=None):
         """Track shots fired when only one enemy remains (for Sharp Shooter achievement)."""
         if player_id is None:
@@ -10855,7 +12335,7 @@ class Game:
         if self.xp_system.level > old_level:
             levels_gained = self.xp_system.level - old_level
             self.pending_level_ups += levels_gained
-            print(f"Player leveled up {levels_gained} time(s)! XP Level: {self.xp_system.level}, Game Level: {self.level}")  # Debug
+            LOG.debug("levels", "Player leveled up %d time(s)! XP Level: %d, Game Level: %d", levels_gained, self.xp_system.level, self.level)
 
             # Track XP level achievement for all players
             self.track_for_all_players("track_xp_level", self.xp_system.level)
@@ -10872,6 +12352,7 @@ class Game:
         return leveled_up
             
     def spawn_power_up(self, player=None):
+        rng = get_game_random()
         bonus_chance = player.upgrades.get_powerup_spawn_bonus() if player else 0
         base_chance = BASE_LUCKY_DROP_CHANCE
 
@@ -10880,7 +12361,7 @@ class Game:
             base_chance = base_chance / 2
 
         drop_chance = base_chance + bonus_chance
-        if random.randint(1, 100) <= drop_chance:
+        if rng.randint(1, 100) <= drop_chance:
             power_types = ['rapid_fire', 'invincibility', 'laser', 'multi_shot']
 
             # Check if player has an active laser (either ready to fire or currently firing)
@@ -10899,17 +12380,17 @@ class Game:
             if player_has_laser:
                 return
 
-            power_type = random.choice(power_types)
-            x = random.randint(100, SCREEN_WIDTH - 100)
+            power_type = rng.choice(power_types)
+            x = rng.randint(100, SCREEN_WIDTH - 100)
             y = 100
             self.power_ups.append(PowerUp(x, y, power_type))
 
             # DEBUG: Track powerup spawn and log details
             self.powerups_spawned_this_level += 1
             powerup_spawn_level = player.upgrades.powerup_spawn_level if player else 0
-            print(f"[POWERUP DEBUG] Level {self.level}: Powerup #{self.powerups_spawned_this_level} spawned! "
-                  f"Type: {power_type}, Drop chance: {drop_chance}% "
-                  f"(base: {base_chance}% + bonus: {bonus_chance}% from {powerup_spawn_level} Lucky Drops upgrades)")
+            LOG.debug("powerups", "Level %d: Powerup #%d spawned! Type: %s, Drop chance: %s%% "
+                      "(base: %s%% + bonus: %s%% from %d Lucky Drops upgrades)", self.level, self.powerups_spawned_this_level,
+                      power_type, drop_chance, base_chance, bonus_chance, powerup_spawn_level)
 
     def handle_events(self):
         if self.showing_stats_screen:
@@ -10927,90 +12408,14 @@ class Game:
                 if event.key == pause_key and not self.game_over:
                     self.open_pause_menu()
                     return None
+                if event.key == DEBUG_OVERLAY_KEY:
+                    self.show_debug_overlay = not self.show_debug_overlay
                 if event.key == self.key_bindings['player1_fire_key'] and not self.game_over:
                     if len(self.players) > 0 and self.players[0].is_alive:
-                        player = self.players[0]
-                        # Determine shot type for stats tracking
-                        if player.has_laser:
-                            shot_stat_type = 'laser'
-                        elif player.has_multi_shot and player.multi_shot_ammo > 0:
-                            shot_stat_type = 'multi'
-                        elif player.rapid_fire and player.rapid_fire_ammo > 0:
-                            shot_stat_type = 'rapid'
-                        else:
-                            shot_stat_type = 'normal'
-
-                        shots = player.shoot(self.sound_manager)
-                        # If shot was blocked by cooldown, queue it for later
-                        if not shots:
-                            player.request_shot()
-                        for shot_type, shot in shots:
-                            if shot_type == 'bullet':
-                                self.sound_manager.play_sound('shoot')
-                                self.player_bullets.append(shot)
-                                # Track shot in stats
-                                if len(self.player_stats) > 0:
-                                    self.player_stats[0].record_shot(shot_stat_type)
-                                # Track shot for Sharp Shooter achievement
-                                self.track_shot_at_last_enemy(player.player_id)
-                                self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                            elif shot_type == 'laser':
-                                self.sound_manager.play_sound('laser')
-                                self.laser_beams.append(shot)
-                                # Track laser shot in stats
-                                if len(self.player_stats) > 0:
-                                    self.player_stats[0].record_shot(shot_stat_type)
-                                # Track laser shot for Sharp Shooter achievement
-                                self.track_shot_at_last_enemy(player.player_id)
-                                self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                            elif shot_type == 'muzzle_flash':
-                                # Add muzzle flash particles to the particle list
-                                self.muzzle_flash_particles.extend(shot)
-                            elif shot_type == 'muzzle_flash_flashes':
-                                # Add muzzle flash circles to the flash list
-                                self.muzzle_flash_flashes.extend(shot)
+                        self.fire_player_shot(0)
                 elif event.key == self.key_bindings['player2_fire_key'] and not self.game_over and self.coop_mode:
                     if len(self.players) > 1 and self.players[1].is_alive:
-                        player = self.players[1]
-                        # Determine shot type for stats tracking
-                        if player.has_laser:
-                            shot_stat_type = 'laser'
-                        elif player.has_multi_shot and player.multi_shot_ammo > 0:
-                            shot_stat_type = 'multi'
-                        elif player.rapid_fire and player.rapid_fire_ammo > 0:
-                            shot_stat_type = 'rapid'
-                        else:
-                            shot_stat_type = 'normal'
-
-                        shots = player.shoot(self.sound_manager)
-                        # If shot was blocked by cooldown, queue it for later
-                        if not shots:
-                            player.request_shot()
-                        for shot_type, shot in shots:
-                            if shot_type == 'bullet':
-                                self.sound_manager.play_sound('shoot')
-                                self.player_bullets.append(shot)
-                                # Track shot in stats
-                                if len(self.player_stats) > 1:
-                                    self.player_stats[1].record_shot(shot_stat_type)
-                                # Track shot for Sharp Shooter achievement
-                                self.track_shot_at_last_enemy(player.player_id)
-                                self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                            elif shot_type == 'laser':
-                                self.sound_manager.play_sound('laser')
-                                self.laser_beams.append(shot)
-                                # Track laser shot in stats
-                                if len(self.player_stats) > 1:
-                                    self.player_stats[1].record_shot(shot_stat_type)
-                                # Track laser shot for Sharp Shooter achievement
-                                self.track_shot_at_last_enemy(player.player_id)
-                                self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                            elif shot_type == 'muzzle_flash':
-                                # Add muzzle flash particles to the particle list
-                                self.muzzle_flash_particles.extend(shot)
-                            elif shot_type == 'muzzle_flash_flashes':
-                                # Add muzzle flash circles to the flash list
-                                self.muzzle_flash_flashes.extend(shot)
+                        self.fire_player_shot(1)
                 elif event.key == pygame.K_r and self.game_over and not self.awaiting_name_input:
                     # FIXED: Check input delay before allowing restart
                     if pygame.time.get_ticks() - self.game_over_time >= self.input_delay_duration:
@@ -11039,45 +12444,7 @@ class Game:
                             # Check which player and use their configured fire button
                             fire_button = self.key_bindings['player1_fire_button'] if i == 0 else self.key_bindings['player2_fire_button']
                             if event.button == fire_button:
-                                # Determine shot type for stats tracking
-                                if player.has_laser:
-                                    shot_stat_type = 'laser'
-                                elif player.has_multi_shot and player.multi_shot_ammo > 0:
-                                    shot_stat_type = 'multi'
-                                elif player.rapid_fire and player.rapid_fire_ammo > 0:
-                                    shot_stat_type = 'rapid'
-                                else:
-                                    shot_stat_type = 'normal'
-
-                                shots = player.shoot(self.sound_manager)
-                                # If shot was blocked by cooldown, queue it for later
-                                if not shots:
-                                    player.request_shot()
-                                for shot_type, shot in shots:
-                                    if shot_type == 'bullet':
-                                        self.sound_manager.play_sound('shoot')
-                                        self.player_bullets.append(shot)
-                                        # Track shot in stats
-                                        if i < len(self.player_stats):
-                                            self.player_stats[i].record_shot(shot_stat_type)
-                                        # Track shot for Sharp Shooter achievement
-                                        self.track_shot_at_last_enemy(player.player_id)
-                                        self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                                    elif shot_type == 'laser':
-                                        self.sound_manager.play_sound('laser')
-                                        self.laser_beams.append(shot)
-                                        # Track laser shot in stats
-                                        if i < len(self.player_stats):
-                                            self.player_stats[i].record_shot(shot_stat_type)
-                                        # Track laser shot for Sharp Shooter achievement
-                                        self.track_shot_at_last_enemy(player.player_id)
-                                        self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                                    elif shot_type == 'muzzle_flash':
-                                        # Add muzzle flash particles to the particle list
-                                        self.muzzle_flash_particles.extend(shot)
-                                    elif shot_type == 'muzzle_flash_flashes':
-                                        # Add muzzle flash circles to the flash list
-                                        self.muzzle_flash_flashes.extend(shot)
+                                self.fire_player_shot(i)
             elif event.type == pygame.JOYHATMOTION:
                 pause_button = self.key_bindings.get('pause_button')
                 if not self.game_over and pause_button in (HAT_LEFT, HAT_RIGHT, HAT_UP, HAT_DOWN):
@@ -11148,102 +12515,102 @@ class Game:
                 self.running = False
                 return None
             elif result == "save_and_quit":
-                print("Saving game and returning to title screen...")
+                LOG.info("persistence", "Saving game and returning to title screen...")
                 self.save_game()
                 self.awaiting_level_up = False
                 self.pending_level_ups = 0  # Clear all pending level-ups
                 del self.level_up_screen
                 return "title"
             elif result == "continue":
-                print("Level up complete, continuing...")  # Debug
-                self.pending_level_ups -= 1  # Process one level-up
-                print(f"Pending level-ups remaining: {self.pending_level_ups}")  # Debug
-
-                # Delete the current level-up screen
                 del self.level_up_screen
+                self.complete_level_up()
+        return None
 
-                # Check if there are more level-ups pending
-                if self.pending_level_ups > 0:
-                    # Keep awaiting_level_up True to show next level-up screen
-                    print(f"Showing next level-up screen...")  # Debug
-                else:
-                    # All level-ups processed
-                    self.awaiting_level_up = False
-                    print("All level-ups processed")  # Debug
+    def complete_level_up(self):
+        """Finish one pending level-up; advance the game level once none remain"""
+        if self.replay_recorder:
+            self.replay_recorder.record_level_up(self.players)
+        LOG.debug("levels", "Level up complete, continuing...")
+        self.pending_level_ups -= 1  # Process one level-up
+        LOG.debug("levels", "Pending level-ups remaining: %d", self.pending_level_ups)
+
+        # Check if there are more level-ups pending
+        if self.pending_level_ups > 0:
+            # Keep awaiting_level_up True to show next level-up screen
+            LOG.debug("levels", "Showing next level-up screen...")
+        else:
+            # All level-ups processed
+            self.awaiting_level_up = False
+            LOG.debug("levels", "All level-ups processed")
 
-                # Check if players have maxed any upgrades (for achievements)
-                for player in self.players:
-                    player_upgrades = player.upgrades
-                    self.track_achievement(player.player_id, "track_upgrade_maxed", "fire_rate", player_upgrades)
-                    self.track_achievement(player.player_id, "track_upgrade_maxed", "shot_speed", player_upgrades)
-                    self.track_achievement(player.player_id, "track_upgrade_maxed", "movement_speed", player_upgrades)
-                    self.track_achievement(player.player_id, "track_upgrade_maxed", "powerup_duration", player_upgrades)
-
-                    # Track specific powerup selections
-                    if player_upgrades.powerup_spawn_level > 0:
-                        self.track_achievement(player.player_id, "track_powerup_selection", "powerup_spawn")
-                    if player_upgrades.ammo_capacity_level > 0:
-                        self.track_achievement(player.player_id, "track_powerup_selection", "ammo_capacity")
-                    if player_upgrades.auto_fire_level > 0:
-                        self.track_achievement(player.player_id, "track_powerup_selection", "auto_fire")
-                    if player_upgrades.extra_bullet_level > 0:
-                        self.track_achievement(player.player_id, "track_powerup_selection", "extra_bullet")
-                    if player_upgrades.reinforced_barriers_level > 0:
-                        self.track_achievement(player.player_id, "track_powerup_selection", "reinforced_barriers")
-                    if player_upgrades.boss_damage_level > 0:
-                        self.track_achievement(player.player_id, "track_powerup_selection", "boss_damage")
-                    if player.has_boss_shield_upgrade:
-                        self.track_achievement(player.player_id, "track_powerup_selection", "boss_shield")
-
-                if self.pending_level_ups == 0:
-                    # DEBUG: Log powerup stats before advancing to next level
-                    if self.enemies_killed_this_level > 0:
-                        drop_rate = (self.powerups_spawned_this_level / self.enemies_killed_this_level) * 100
-                        print(f"\n{'='*70}")
-                        print(f"[POWERUP DEBUG] LEVEL {self.level} SUMMARY:")
-                        print(f"  Enemies killed: {self.enemies_killed_this_level}")
-                        print(f"  Powerups spawned: {self.powerups_spawned_this_level}")
-                        print(f"  Actual drop rate: {drop_rate:.2f}%")
-                        print(f"{'='*70}\n")
-
-                    completed_level = self.level
-                    self.level += 1
-                    print(f"Advanced to game level {self.level} after level up")  # Debug
-
-                    # Track level completion for achievements (all players)
-                    self.track_for_all_players("player_completed_level", completed_level)
-
-                    # Check laser-only level achievement
-                    self.track_for_all_players("check_laser_only_level", self.is_boss_level)
-
-                    # Check sharp shooter achievement (killed last enemy with one shot)
-                    self.track_for_all_players("check_sharp_shooter", 0)  # 0 enemies remaining
-
-                    # Check pinpoint accuracy achievement
-                    self.track_for_all_players("check_pinpoint_accuracy", self.is_boss_level)
-
-                    # Reset powerup tracking for new level
-                    self.powerups_spawned_this_level = 0
-                    self.enemies_killed_this_level = 0
-
-                    # Reset special enemy tracking for new level
-                    self.special_enemy_spawned_this_level = False
-
-                    # Clear all enemy bullets to prevent them from carrying over to the next level
-                    self.enemy_bullets.clear()
-
-                    # Respawn dead players with 1 life if their partner survived
-                    if self.coop_mode and len(self.players) == 2:
-                        if not self.players[0].is_alive and self.players[1].is_alive:
-                            self.players[0].lives = 1
-                            self.players[0].respawn()
-                        elif not self.players[1].is_alive and self.players[0].is_alive:
-                            self.players[1].lives = 1
-                            self.players[1].respawn()
-
-                    self.setup_level()
-                    self.create_barriers()
-        return None
+        # Check if players have maxed any upgrades (for achievements)
+        for player in self.players:
+            player_upgrades = player.upgrades
+            self.track_achievement(player.player_id, "track_upgrade_maxed", "fire_rate", player_upgrades)
+            self.track_achievement(player.player_id, "track_upgrade_maxed", "shot_speed", player_upgrades)
+            self.track_achievement(player.player_id, "track_upgrade_maxed", "movement_speed", player_upgrades)
+            self.track_achievement(player.player_id, "track_upgrade_maxed", "powerup_duration", player_upgrades)
+
+            # Track specific powerup selections
+            if player_upgrades.powerup_spawn_level > 0:
+                self.track_achievement(player.player_id, "track_powerup_selection", "powerup_spawn")
+            if player_upgrades.ammo_capacity_level > 0:
+                self.track_achievement(player.player_id, "track_powerup_selection", "ammo_capacity")
+            if player_upgrades.auto_fire_level > 0:
+                self.track_achievement(player.player_id, "track_powerup_selection", "auto_fire")
+            if player_upgrades.extra_bullet_level > 0:
+                self.track_achievement(player.player_id, "track_powerup_selection", "extra_bullet")
+            if player_upgrades.reinforced_barriers_level > 0:
+                self.track_achievement(player.player_id, "track_powerup_selection", "reinforced_barriers")
+            if player_upgrades.boss_damage_level > 0:
+                self.track_achievement(player.player_id, "track_powerup_selection", "boss_damage")
+            if player.has_boss_shield_upgrade:
+                self.track_achievement(player.player_id, "track_powerup_selection", "boss_shield")
+
+        if self.pending_level_ups == 0:
+            # DEBUG: Log powerup stats before advancing to next level
+            if self.enemies_killed_this_level > 0:
+                drop_rate = (self.powerups_spawned_this_level / self.enemies_killed_this_level) * 100
+                LOG.debug("powerups", "LEVEL %d SUMMARY: enemies killed %d, powerups spawned %d, actual drop rate %.2f%%",
+                          self.level, self.enemies_killed_this_level, self.powerups_spawned_this_level, drop_rate)
+
+            completed_level = self.level
+            self.level += 1
+            LOG.debug("levels", "Advanced to game level %d after level up", self.level)
+
+            # Track level completion for achievements (all players)
+            self.track_for_all_players("player_completed_level", completed_level)
+
+            # Check laser-only level achievement
+            self.track_for_all_players("check_laser_only_level", self.is_boss_level)
+
+            # Check sharp shooter achievement (killed last enemy with one shot)
+            self.track_for_all_players("check_sharp_shooter", 0)  # 0 enemies remaining
+
+            # Check pinpoint accuracy achievement
+            self.track_for_all_players("check_pinpoint_accuracy", self.is_boss_level)
+
+            # Reset powerup tracking for new level
+            self.powerups_spawned_this_level = 0
+            self.enemies_killed_this_level = 0
+
+            # Reset special enemy tracking for new level
+            self.special_enemy_spawned_this_level = False
+
+            # Clear all enemy bullets to prevent them from carrying over to the next level
+            self.clear_enemy_bullets()
+
+            # Respawn dead players with 1 life if their partner survived
+            if self.coop_mode and len(self.players) == 2:
+                if not self.players[0].is_alive and self.players[1].is_alive:
+                    self.players[0].lives = 1
+                    self.players[0].respawn()
+                elif not self.players[1].is_alive and self.players[0].is_alive:
+                    self.players[1].lives = 1
+                    self.players[1].respawn()
+
+            self.setup_level()
+            self.create_barriers()
 
     def handle_stats_screen_events(self):
         """Handle events during stats screen display"""
@@ -11270,74 +12637,11 @@ class Game:
 
                 # Auto-fire: check if fire key is held and auto-fire upgrade is active
                 if keys[self.key_bindings['player1_fire_key']] and self.players[0].is_alive and self.players[0].upgrades.has_auto_fire():
-                    player = self.players[0]
-                    # Determine shot type for stats tracking
-                    if player.has_laser:
-                        shot_stat_type = 'laser'
-                    elif player.has_multi_shot and player.multi_shot_ammo > 0:
-                        shot_stat_type = 'multi'
-                    elif player.rapid_fire and player.rapid_fire_ammo > 0:
-                        shot_stat_type = 'rapid'
-                    else:
-                        shot_stat_type = 'normal'
-
-                    shots = player.shoot(self.sound_manager)
-                    for shot_type, shot in shots:
-                        if shot_type == 'bullet':
-                            self.sound_manager.play_sound('shoot')
-                            self.player_bullets.append(shot)
-                            if len(self.player_stats) > 0:
-                                self.player_stats[0].record_shot(shot_stat_type)
-                            # Track shot at last enemy for sharp shooter achievement (player 1 only)
-                            self.track_shot_at_last_enemy(player.player_id)
-                            self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                        elif shot_type == 'laser':
-                            self.sound_manager.play_sound('laser')
-                            self.laser_beams.append(shot)
-                            if len(self.player_stats) > 0:
-                                self.player_stats[0].record_shot(shot_stat_type)
-                            # Track shot at last enemy for sharp shooter achievement (player 1 only)
-                            self.track_shot_at_last_enemy(player.player_id)
-                            self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                        elif shot_type == 'muzzle_flash':
-                            self.muzzle_flash_particles.extend(shot)
-                        elif shot_type == 'muzzle_flash_flashes':
-                            self.muzzle_flash_flashes.extend(shot)
+                    self.fire_player_shot(0, queue_if_blocked=False)
 
                 # Create shoot callback for player 1 controller auto-fire
                 def player1_shoot():
-                    player = self.players[0]
-                    if player.has_laser:
-                        shot_stat_type = 'laser'
-                    elif player.has_multi_shot and player.multi_shot_ammo > 0:
-                        shot_stat_type = 'multi'
-                    elif player.rapid_fire and player.rapid_fire_ammo > 0:
-                        shot_stat_type = 'rapid'
-                    else:
-                        shot_stat_type = 'normal'
-
-                    shots = player.shoot(self.sound_manager)
-                    for shot_type, shot in shots:
-                        if shot_type == 'bullet':
-                            self.sound_manager.play_sound('shoot')
-                            self.player_bullets.append(shot)
-                            if len(self.player_stats) > 0:
-                                self.player_stats[0].record_shot(shot_stat_type)
-                            # Track shot at last enemy for sharp shooter achievement (player 1 only)
-                            self.track_shot_at_last_enemy(player.player_id)
-                            self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                        elif shot_type == 'laser':
-                            self.sound_manager.play_sound('laser')
-                            self.laser_beams.append(shot)
-                            if len(self.player_stats) > 0:
-                                self.player_stats[0].record_shot(shot_stat_type)
-                            # Track shot at last enemy for sharp shooter achievement (player 1 only)
-                            self.track_shot_at_last_enemy(player.player_id)
-                            self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                        elif shot_type == 'muzzle_flash':
-                            self.muzzle_flash_particles.extend(shot)
-                        elif shot_type == 'muzzle_flash_flashes':
-                            self.muzzle_flash_flashes.extend(shot)
+                    self.fire_player_shot(0, queue_if_blocked=False)
 
                 self.players[0].handle_controller_input(
                     player1_shoot,
@@ -11354,66 +12658,11 @@ class Game:
                         self.players[1].move_right()
                     # Auto-fire for player 2
                     if keys[self.key_bindings['player2_fire_key']] and self.players[1].is_alive and self.players[1].upgrades.has_auto_fire():
-                        player = self.players[1]
-                        # Determine shot type for stats tracking
-                        if player.has_laser:
-                            shot_stat_type = 'laser'
-                        elif player.has_multi_shot and player.multi_shot_ammo > 0:
-                            shot_stat_type = 'multi'
-                        elif player.rapid_fire and player.rapid_fire_ammo > 0:
-                            shot_stat_type = 'rapid'
-                        else:
-                            shot_stat_type = 'normal'
-
-                        shots = player.shoot(self.sound_manager)
-                        for shot_type, shot in shots:
-                            if shot_type == 'bullet':
-                                self.sound_manager.play_sound('shoot')
-                                self.player_bullets.append(shot)
-                                if len(self.player_stats) > 1:
-                                    self.player_stats[1].record_shot(shot_stat_type)
-                                self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                            elif shot_type == 'laser':
-                                self.sound_manager.play_sound('laser')
-                                self.laser_beams.append(shot)
-                                if len(self.player_stats) > 1:
-                                    self.player_stats[1].record_shot(shot_stat_type)
-                                self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                            elif shot_type == 'muzzle_flash':
-                                self.muzzle_flash_particles.extend(shot)
-                            elif shot_type == 'muzzle_flash_flashes':
-                                self.muzzle_flash_flashes.extend(shot)
+                        self.fire_player_shot(1, queue_if_blocked=False)
                 else:
                     # Create shoot callback for player 2 controller auto-fire
                     def player2_shoot():
-                        player = self.players[1]
-                        if player.has_laser:
-                            shot_stat_type = 'laser'
-                        elif player.has_multi_shot and player.multi_shot_ammo > 0:
-                            shot_stat_type = 'multi'
-                        elif player.rapid_fire and player.rapid_fire_ammo > 0:
-                            shot_stat_type = 'rapid'
-                        else:
-                            shot_stat_type = 'normal'
-
-                        shots = player.shoot(self.sound_manager)
-                        for shot_type, shot in shots:
-                            if shot_type == 'bullet':
-                                self.sound_manager.play_sound('shoot')
-                                self.player_bullets.append(shot)
-                                if len(self.player_stats) > 1:
-                                    self.player_stats[1].record_shot(shot_stat_type)
-                                self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                            elif shot_type == 'laser':
-                                self.sound_manager.play_sound('laser')
-                                self.laser_beams.append(shot)
-                                if len(self.player_stats) > 1:
-                                    self.player_stats[1].record_shot(shot_stat_type)
-                                self.track_shot_for_achievements(player.player_id, shot_stat_type)
-                            elif shot_type == 'muzzle_flash':
-                                self.muzzle_flash_particles.extend(shot)
-                            elif shot_type == 'muzzle_flash_flashes':
-                                self.muzzle_flash_flashes.extend(shot)
+                        self.fire_player_shot(1, queue_if_blocked=False)
 
                     self.players[1].handle_controller_input(
                         player2_shoot,
@@ -11457,27 +12706,23 @@ class Game:
                 level_complete = True
 
         if level_complete:
-            print(f"Level complete! pending_level_ups: {self.pending_level_ups}")  # Debug
+            LOG.debug("levels", "Level complete! pending_level_ups: %d", self.pending_level_ups)
             # Check if player leveled up during this level - show level up screen first
             if self.pending_level_ups > 0:
-                print(f"Showing level up screen ({self.pending_level_ups} level(s) pending)...")  # Debug
+                LOG.debug("levels", "Showing level up screen (%d level(s) pending)...", self.pending_level_ups)
                 self.awaiting_level_up = True
                 return False  # Don't advance game level yet, wait for upgrade selection
 
             # DEBUG: Log powerup stats before advancing to next level
             if self.enemies_killed_this_level > 0:
                 drop_rate = (self.powerups_spawned_this_level / self.enemies_killed_this_level) * 100
-                print(f"\n{'='*70}")
-                print(f"[POWERUP DEBUG] LEVEL {self.level} SUMMARY:")
-                print(f"  Enemies killed: {self.enemies_killed_this_level}")
-                print(f"  Powerups spawned: {self.powerups_spawned_this_level}")
-                print(f"  Actual drop rate: {drop_rate:.2f}%")
-                print(f"{'='*70}\n")
+                LOG.debug("powerups", "LEVEL %d SUMMARY: enemies killed %d, powerups spawned %d, actual drop rate %.2f%%",
+                          self.level, self.enemies_killed_this_level, self.powerups_spawned_this_level, drop_rate)
 
             # No level up pending, advance to next level
             completed_level = self.level  # Save the level that was just completed
             self.level += 1
-            print(f"Advanced to game level {self.level}")  # Debug
+            LOG.debug("levels", "Advanced to game level %d", self.level)
 
             # Track level completion for achievements (all players)
             self.track_for_all_players("player_completed_level", completed_level)
@@ -11499,7 +12744,7 @@ class Game:
             self.special_enemy_spawned_this_level = False
 
             # Clear all enemy bullets to prevent them from carrying over to the next level
-            self.enemy_bullets.clear()
+            self.clear_enemy_bullets()
 
             # Respawn dead players with 1 life if their partner survived
             if self.coop_mode and len(self.players) == 2:
@@ -11534,8 +12779,8 @@ class Game:
                 manager.save()
 
             # Delete save file on game over
-            if os.path.exists("savegame.json"):
-                os.remove("savegame.json")
+            if not self.headless:
+                PERSISTENCE.remove("savegame.json")
 
             # Set final stats for all players
             for i, stats in enumerate(self.player_stats):
@@ -11553,6 +12798,12 @@ class Game:
         return game_over 
     
     def update(self):
+        # Advance game time by one tick; every timer and lifetime below reads from it
+        frame_ms = self.game_clock.advance()
+        input_bits = self.collect_input_bits()
+        if self.replay_recorder:
+            self.replay_recorder.record_tick(input_bits)
+
         # ADDED: Handle UFO warning screen
         if self.showing_ufo_warning:
             if self.ufo_warning_screen.is_finished():
@@ -11563,6 +12814,7 @@ class Game:
                 boss_name = self.current_boss.__class__.__name__
                 for stat in self.player_stats:
                     stat.record_boss_encounter(boss_name)
+                self.profiler.set_segment(f"level {self.level} {boss_name}")
 
                 # Track boss encounter start for achievement timing
                 self.track_for_all_players("start_boss_encounter")
@@ -11574,24 +12826,12 @@ class Game:
             return  # Don't update game during warning
 
         # Update player explosion particles (even during game over so death animation plays)
-        for particle in self.player_explosion_particles[:]:
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            particle['vel_y'] += particle['gravity']  # Apply particle's gravity
-            particle['life'] -= 16  # Assuming 60 FPS
-
-            if particle['life'] <= 0:
-                self.player_explosion_particles.remove(particle)
+        self.profiler.start("particles")
+        self.player_explosion_particles.update(frame_ms)
 
         # Update boss explosion particles (even during game over)
-        for particle in self.boss_explosion_particles[:]:
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            particle['vel_y'] += 0.2  # Gravity
-            particle['life'] -= 16  # Assuming 60 FPS
-
-            if particle['life'] <= 0:
-                self.boss_explosion_particles.remove(particle)
+        self.boss_explosion_particles.update(frame_ms)
+        self.profiler.stop("particles")
 
         if self.game_over or self.awaiting_level_up:
             return
@@ -11661,9 +12901,9 @@ class Game:
                 if not already_awarded:
                     self.add_xp(REPEAT_ACHIEVEMENT_XP)
                     self.repeat_bonuses_awarded_this_tick.add(achievement.id)
-                    print(f"[DEBUG] Awarded {REPEAT_ACHIEVEMENT_XP} XP for repeat achievement '{achievement.name}' (player {player_id})")
+                    LOG.debug("achievements", "Awarded %d XP for repeat achievement %r (player %d)", REPEAT_ACHIEVEMENT_XP, achievement.name, player_id)
                 else:
-                    print(f"[DEBUG] Skipping repeat XP for '{achievement.name}' (player {player_id}) - already awarded this update")
+                    LOG.debug("achievements", "Skipping repeat XP for %r (player %d) - already awarded this update", achievement.name, player_id)
 
                 # In coop, suppress duplicate repeat notifications for the same event.
                 if not (self.coop_mode and already_awarded):
@@ -11680,12 +12920,12 @@ class Game:
 
         # Update screen effects
         if self.screen_shake_duration > 0:
-            self.screen_shake_duration -= 16  # Assuming 60 FPS
+            self.screen_shake_duration -= frame_ms
             if self.screen_shake_duration <= 0:
                 self.screen_shake_intensity = 0
 
         if self.screen_flash_duration > 0:
-            self.screen_flash_duration -= 16
+            self.screen_flash_duration -= frame_ms
             self.screen_flash_intensity = max(0, int(255 * (self.screen_flash_duration / 1500)))
 
         # Update starfield (with parallax effect during Asteroid Field Boss)
@@ -11703,18 +12943,14 @@ class Game:
                 self.boss_explosion_waves.remove(wave)
 
         # Update muzzle flash particles
-        for particle in self.muzzle_flash_particles[:]:
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            particle['life'] -= 16  # Assuming 60 FPS
-
-            if particle['life'] <= 0:
-                self.muzzle_flash_particles.remove(particle)
+        self.profiler.start("particles")
+        self.muzzle_flash_particles.update(frame_ms)
+        self.profiler.stop("particles")
 
         # Update muzzle flash circles (bright expanding flashes)
         for flash in self.muzzle_flash_flashes[:]:
             flash['radius'] += flash['growth_speed']
-            flash['life'] -= 16  # Assuming 60 FPS
+            flash['life'] -= frame_ms
 
             if flash['life'] <= 0 or flash['radius'] >= flash['max_radius']:
                 self.muzzle_flash_flashes.remove(flash)
@@ -11729,10 +12965,17 @@ class Game:
                     self.track_achievement(bullet.owner_id, "track_pinpoint_miss")
                 self.player_bullets.remove(bullet)
                 
-        for bullet in self.enemy_bullets[:]:
+        # Compact surviving enemy bullets in place, recycling the ones that left the screen
+        enemy_bullets = self.enemy_bullets
+        kept = 0
+        for bullet in enemy_bullets:
             bullet.move()
             if bullet.is_off_screen():
-                self.enemy_bullets.remove(bullet)
+                bullet.release()
+            else:
+                enemy_bullets[kept] = bullet
+                kept += 1
+        del enemy_bullets[kept:]
                 
         for power_up in self.power_ups[:]:
             power_up.move()
@@ -11753,7 +12996,9 @@ class Game:
         
         # Update boss or regular enemies
         if self.is_boss_level and self.current_boss:
+            self.profiler.start("boss.update")
             boss_explosion_particles = self.current_boss.update(self.players, self.sound_manager)
+            self.profiler.stop("boss.update")
             # Capture player explosion particles from boss update (e.g., AlienOverlordBoss hand attacks)
             if boss_explosion_particles:
                 self.player_explosion_particles.extend(boss_explosion_particles)
@@ -11782,27 +13027,20 @@ class Game:
                     self._rubiks_boss_tracked = True
 
             # Boss shooting
+            self.profiler.start("boss.shoot")
             boss_bullets = self.current_boss.shoot(self.players, self.sound_manager)
+            self.profiler.stop("boss.shoot")
             self.enemy_bullets.extend(boss_bullets)
         else:
             # Regular enemy movement
-            edge_hit = False
-            for enemy in self.enemies:
-                enemy.move()
-                enemy.update_invincibility()  # Update invincibility timer
-                if enemy.x <= 0 or enemy.x >= SCREEN_WIDTH - enemy.width:
-                    edge_hit = True
-                    
-            if edge_hit:
-                for enemy in self.enemies:
-                    enemy.drop_down()
-                    
-            for enemy in self.enemies:
-                bullet = enemy.shoot(self.sound_manager)
-                if bullet:
-                    self.enemy_bullets.append(bullet)
+            self.profiler.start("enemies")
+            self.enemy_formation.step()
+            self.enemy_bullets.extend(self.enemy_formation.shoot(self.sound_manager))
+            self.profiler.stop("enemies")
                 
+        self.profiler.start("collisions")
         self.check_collisions()
+        self.profiler.stop("collisions")
         
         # Check level completion first
         if self.check_level_complete():
@@ -11813,13 +13051,7 @@ class Game:
             
         # CHANGED: Check if enemies reached bottom - kill player and reset aliens
         if not self.is_boss_level:
-            aliens_reached_bottom = False
-            for enemy in self.enemies:
-                if enemy.y + enemy.height >= SCREEN_HEIGHT - 200:  # Near bottom
-                    aliens_reached_bottom = True
-                    break
-            
-            if aliens_reached_bottom:
+            if self.enemy_formation.get_bottom() >= SCREEN_HEIGHT - 200:  # Near bottom
                 # Kill all alive players
                 for player in self.players:
                     if player.is_alive:
@@ -11829,13 +13061,12 @@ class Game:
                             if explosion_particles:
                                 self.player_explosion_particles.extend(explosion_particles)
                 
-                # Reset alien positions but keep their speed
-                current_speeds = [enemy.speed for enemy in self.enemies]
+                # Reset alien positions but keep the speed they had progressed to
+                speed_multiplier = max(self.get_enemy_speed_multiplier(len(self.enemies)),
+                                       self.enemy_formation.min_speed_multiplier)
                 self.create_enemy_grid()
-                # Restore the progressed speeds
-                for i, enemy in enumerate(self.enemies):
-                    if i < len(current_speeds):
-                        enemy.speed = current_speeds[i]
+                self.enemy_formation.min_speed_multiplier = speed_multiplier
+                self.enemy_formation.set_speed_multiplier(speed_multiplier)
         elif self.current_boss:
             # Check if boss reached player (not applicable to SnakeBoss which uses collision detection)
             if not isinstance(self.current_boss, SnakeBoss):
@@ -11852,7 +13083,24 @@ class Game:
                             self.awaiting_name_input = True
                             self.name_input_screen = NameInputScreen(self.screen, self.score, self.level, self.coop_mode, self.key_bindings)
                     
+    def clear_enemy_bullets(self):
+        """Remove every enemy projectile, returning pooled ones to their free lists"""
+        for bullet in self.enemy_bullets:
+            bullet.release()
+        self.enemy_bullets.clear()
+
+    def rebuild_collision_grids(self):
+        """Bucket this tick's barriers and players for the collision queries"""
+        self.barrier_grid.clear()
+        for barrier in self.barriers:
+            self.barrier_grid.insert(barrier, barrier.rect)
+        self.player_grid.clear()
+        for player in self.players:
+            self.player_grid.insert(player, player.rect)
+
     def check_collisions(self):
+        rng = get_game_random()
+        self.rebuild_collision_grids()
         # Player bullets vs enemies
         for bullet in self.player_bullets[:]:
             owner = next((p for p in self.players if p.player_id == bullet.owner_id), None)
@@ -11887,15 +13135,21 @@ class Game:
                             if self.current_boss.is_defeated():
                                 # Boss completely destroyed - EPIC EXPLOSION SEQUENCE
                                 self.score += 1000
-                                head = self.current_boss.segments[0] if self.current_boss.segments else {'x': SCREEN_WIDTH // 2, 'y': 200}
-                                self.add_xp(200, int(head['x']), int(head['y']))
+                                snake = self.current_boss
+                                if snake.segment_xs:
+                                    head_x = int(snake.segment_xs[0])
+                                    head_y = int(snake.segment_ys[0])
+                                else:
+                                    head_x = SCREEN_WIDTH // 2
+                                    head_y = 200
+                                self.add_xp(200, head_x, head_y)
 
                                 # Track boss defeat achievement (all players)
                                 boss_name = self.current_boss.__class__.__name__
                                 self.track_for_all_players("player_defeated_boss", boss_name)
 
                                 # Clear all enemy bullets
-                                self.enemy_bullets.clear()
+                                self.clear_enemy_bullets()
 
                                 # Play explosion sound
                                 self.sound_manager.play_sound('explosion_large')
@@ -11913,9 +13167,6 @@ class Game:
                                 self.screen_flash_duration = 1000
 
                                 # CREATE EXPLOSION WAVES
-                                head_x = int(head['x'])
-                                head_y = int(head['y'])
-
                                 for i in range(3):  # 3 expanding shock waves
                                     wave = {
                                         'x': head_x,
@@ -11930,7 +13181,7 @@ class Game:
 
                                 # Mark boss as destroyed (don't set to None - let game loop handle it)
                                 self.current_boss.destruction_complete = True
-                                self.current_boss.destruction_start_time = pygame.time.get_ticks()
+                                self.current_boss.destruction_start_time = get_game_ticks()
                             else:
                                 # Hit vulnerable part but not defeated - award small XP
                                 self.score += 10
@@ -11962,7 +13213,7 @@ class Game:
                             self.add_xp(200, self.current_boss.x + self.current_boss.width // 2, self.current_boss.y)
                             boss_name = self.current_boss.__class__.__name__
                             self.track_for_all_players("player_defeated_boss", boss_name)
-                            self.enemy_bullets.clear()
+                            self.clear_enemy_bullets()
                             self.current_boss._pending_game_effects = True
                     else:
                         pass
@@ -12016,7 +13267,7 @@ class Game:
                             self.track_for_all_players("player_defeated_boss", boss_name)
 
                             # Clear all enemy bullets immediately when boss is destroyed
-                            self.enemy_bullets.clear()
+                            self.clear_enemy_bullets()
 
                             # PLAY LARGE EXPLOSION SOUND
                             self.sound_manager.play_sound('explosion_large')
@@ -12044,7 +13295,7 @@ class Game:
                                     'radius': 0,
                                     'max_radius': 300 + i * 100,
                                     'growth_speed': 8 + i * 2,
-                                    'color': random.choice([(255, 200, 0), (255, 100, 0), (255, 255, 255)]),
+                                    'color': rng.choice([(255, 200, 0), (255, 100, 0), (255, 255, 255)]),
                                     'thickness': 8 - i,
                                     'life': 180 - i * 20
                                 }
@@ -12055,7 +13306,7 @@ class Game:
                         if bullet.pierce_hits > 0:
                             bullet.pierce_hits -= 1
             else:
-                for enemy in self.enemies[:]:
+                for enemy in self.enemy_formation.query(bullet.rect):
                     if bullet.rect.colliderect(enemy.rect):
                         # Skip collision if enemy is invincible
                         if enemy.is_invincible:
@@ -12074,7 +13325,7 @@ class Game:
                         is_special_enemy = enemy.is_special
                         special_type = enemy.special_type
 
-                        self.enemies.remove(enemy)
+                        self.enemy_formation.remove(enemy)
                         if len(self.enemies) == 1:
                             self.track_for_all_players("check_sharp_shooter", 1)
                         self.score += 10
@@ -12126,7 +13377,7 @@ class Game:
                     # Special handling for RubiksCubeBoss with lasers
                     if isinstance(self.current_boss, RubiksCubeBoss):
                         # Laser continuously damages squares
-                        if pygame.time.get_ticks() % 100 == 0:  # Damage every 100ms
+                        if rng.randint(1, 100) == 1:  # Damage on about 1 tick in 100
                             if self.current_boss.take_square_damage(laser.rect, 2):
                                 if pygame.time.get_ticks() % 200 == 0:
                                     self.sound_manager.play_sound('ufo_hit', volume_override=0.4)
@@ -12136,7 +13387,7 @@ class Game:
 
                     # Special handling for RogueTerminalBoss weakpoints with lasers
                     if isinstance(self.current_boss, RogueTerminalBoss):
-                        if pygame.time.get_ticks() % 100 == 0:
+                        if rng.randint(1, 100) == 1:
                             if self.current_boss.hit_weakpoint(laser.rect, 2):
                                 if pygame.time.get_ticks() % 200 == 0:
                                     self.sound_manager.play_sound('ufo_hit', volume_override=0.5)
@@ -12150,7 +13401,7 @@ class Game:
                                     self.add_xp(200, self.current_boss.x + self.current_boss.width // 2, self.current_boss.y)
                                     boss_name = self.current_boss.__class__.__name__
                                     self.track_for_all_players("player_defeated_boss", boss_name)
-                                    self.enemy_bullets.clear()
+                                    self.clear_enemy_bullets()
                                     self.sound_manager.play_sound('explosion_large')
                                     self.boss_explosion_particles.extend(self.current_boss.create_final_explosion())
                                     self.grant_post_boss_shield()
@@ -12190,14 +13441,14 @@ class Game:
                             self.track_for_all_players("player_defeated_boss", boss_name)
 
                             # Clear all enemy bullets immediately when boss is destroyed
-                            self.enemy_bullets.clear()
+                            self.clear_enemy_bullets()
 
                             self.grant_post_boss_shield()
                         else:
                             self.score += 15
                             self.add_xp(8, main_body_rect.centerx, main_body_rect.centery)
                 else:
-                    for enemy in self.enemies[:]:
+                    for enemy in self.enemy_formation.query(laser.rect):
                         if laser.rect.colliderect(enemy.rect):
                             # Skip collision if enemy is invincible
                             if enemy.is_invincible:
@@ -12213,7 +13464,7 @@ class Game:
                             is_special_enemy = enemy.is_special
                             special_type = enemy.special_type
 
-                            self.enemies.remove(enemy)
+                            self.enemy_formation.remove(enemy)
                             if len(self.enemies) == 1:
                                 self.track_for_all_players("check_sharp_shooter", 1)
                             self.score += 10
@@ -12254,30 +13505,28 @@ class Game:
 
         self.update_enemy_speed()
                         
-        # Player bullets vs barriers
-        for bullet in self.player_bullets[:]:
-            # Barrier phasing bullets should ignore barrier collisions entirely
-            if getattr(bullet, 'can_phase_barriers', False):
-                continue
-            for barrier in self.barriers:
-                if barrier.check_collision(bullet.rect) and not getattr(bullet, 'can_phase_barriers', False):
-                    if bullet.owner_id and getattr(bullet, "counts_for_pinpoint", False):
-                        self.track_achievement(bullet.owner_id, "track_pinpoint_miss")
-                    self.player_bullets.remove(bullet)
-                    break
-                    
-        # Enemy bullets vs barriers
-        for bullet in self.enemy_bullets[:]:
-            for barrier in self.barriers:
-                if barrier.check_collision(bullet.rect):
-                    # White ball and green laser persist through barriers
-                    if not isinstance(bullet, (WhiteBall, GreenLaser)):
-                        self.enemy_bullets.remove(bullet)
-                    break
+        # Player bullets vs barriers (barrier phasing bullets ignore barrier collisions entirely)
+        solid_bullets = [bullet for bullet in self.player_bullets if not getattr(bullet, 'can_phase_barriers', False)]
+        blocked = Barrier.resolve_collisions(solid_bullets, self.barrier_grid)
+        if blocked:
+            for bullet in blocked:
+                if bullet.owner_id and getattr(bullet, "counts_for_pinpoint", False):
+                    self.track_achievement(bullet.owner_id, "track_pinpoint_miss")
+            blocked_ids = {id(bullet) for bullet in blocked}
+            self.player_bullets[:] = [bullet for bullet in self.player_bullets if id(bullet) not in blocked_ids]
+
+        # Enemy bullets vs barriers (white ball and green laser persist through barriers)
+        blocked = [bullet for bullet in Barrier.resolve_collisions(self.enemy_bullets, self.barrier_grid)
+                   if not isinstance(bullet, (WhiteBall, GreenLaser))]
+        if blocked:
+            blocked_ids = {id(bullet) for bullet in blocked}
+            self.enemy_bullets[:] = [bullet for bullet in self.enemy_bullets if id(bullet) not in blocked_ids]
+            for bullet in blocked:
+                bullet.release()
                     
         # Power-ups vs players
         for power_up in self.power_ups[:]:
-            for player in self.players:
+            for player in self.player_grid.query(power_up.rect):
                 if player.is_alive and power_up.rect.colliderect(player.rect):
                     self.power_ups.remove(power_up)
                     self.sound_manager.play_sound('powerup', volume_override=0.7)
@@ -12288,8 +13537,9 @@ class Game:
                     
         # Enemy bullets vs players
         for bullet in self.enemy_bullets[:]:
-            for i, player in enumerate(self.players):
+            for player in self.player_grid.query(bullet.rect):
                 if player.is_alive and bullet.rect.colliderect(player.rect):
+                    i = self.players.index(player)
                     was_alive = player.lives > 0
                     took_damage, explosion_particles = player.take_damage(self.sound_manager)
                     if took_damage:
@@ -12304,6 +13554,7 @@ class Game:
                         # Don't remove green laser or white ball when they hit player - they persist
                         if not isinstance(bullet, (GreenLaser, WhiteBall)):
                             self.enemy_bullets.remove(bullet)
+                            bullet.release()
                         break
 
         # Asteroids vs players (for Asteroid Field Boss)
@@ -12398,8 +13649,8 @@ class Game:
         self.laser_beams = []
         self.floating_texts = []
         self.enemy_explosions = []
-        self.boss_explosion_particles = []
-        self.player_explosion_particles = []
+        self.boss_explosion_particles.clear()
+        self.player_explosion_particles.clear()
         self.screen_shake_intensity = 0
         self.screen_shake_duration = 0
         self.screen_flash_intensity = 0
@@ -12428,20 +13679,8 @@ class Game:
         if self.showing_ufo_warning and self.ufo_warning_screen:
             self.ufo_warning_screen.draw()
             return
-            
-        self.screen.fill(BLACK)
-
-        # Draw starfield background (after black fill, before everything else)
-        self.starfield.draw(self.screen)
 
-        # SCREEN FLASH EFFECT - Apply early for maximum impact
-        if self.screen_flash_intensity > 0:
-            # Fill screen with bright color based on flash intensity
-            flash_color = (min(255, self.screen_flash_intensity), 
-                          min(255, self.screen_flash_intensity), 
-                          min(255, self.screen_flash_intensity))
-            self.screen.fill(flash_color)
-        
+        # The level up, name input and stats screens paint their own background
         # Handle level up screen
         if self.awaiting_level_up:
             if not hasattr(self, 'level_up_screen'):
@@ -12462,14 +13701,11 @@ class Game:
             self.stats_screen.draw()
             return
 
+        # Background layer
+        self.draw_background()
+
+        # Entity layer
         if not self.game_over:
-            # Simple screen shake - just use a random background color pulse
-            if self.screen_shake_intensity > 0:
-                # Make the background flash red/orange during shake
-                shake_color = (min(255, self.screen_shake_intensity * 3), 
-                              min(255, self.screen_shake_intensity), 0)
-                self.screen.fill(shake_color)
-    
             for laser in self.laser_beams:
                 laser.draw(self.screen)
                 
@@ -12484,51 +13720,29 @@ class Game:
                 
             # Draw boss or regular enemies
             if self.is_boss_level and self.current_boss:
+                self.profiler.start("boss.draw")
                 self.current_boss.draw(self.screen)
+                self.profiler.stop("boss.draw")
             else:
-                for enemy in self.enemies:
-                    enemy.draw(self.screen)
+                self.enemy_formation.draw(self.screen)
 
             # Draw enemy explosions
             for explosion in self.enemy_explosions:
                 explosion.draw(self.screen)
 
             # Draw boss explosion particles
-            for particle in self.boss_explosion_particles:
-                if particle['life'] > 0:
-                    alpha = max(0, min(255, particle['life'] // 3))
-                    particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-                    color_with_alpha = (*particle['color'], alpha)
-                    pygame.draw.circle(particle_surface, color_with_alpha,
-                                     (particle['size'], particle['size']), particle['size'])
-                    self.screen.blit(particle_surface, (int(particle['x'] - particle['size']),
-                                                     int(particle['y'] - particle['size'])))
-
-            # Draw muzzle flash particles
-            for particle in self.muzzle_flash_particles:
-                if particle['life'] > 0:
-                    # Fade out quickly based on remaining life
-                    alpha = max(0, min(255, particle['life']))
-                    particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-                    color_with_alpha = (*particle['color'], alpha)
-                    pygame.draw.circle(particle_surface, color_with_alpha,
-                                     (particle['size'], particle['size']), particle['size'])
-                    self.screen.blit(particle_surface, (int(particle['x'] - particle['size']),
-                                                     int(particle['y'] - particle['size'])))
+            self.boss_explosion_particles.draw(self.screen)
+
+            # Draw muzzle flash particles (fade out quickly based on remaining life)
+            self.muzzle_flash_particles.draw(self.screen)
 
             # Draw muzzle flash circles (bright expanding flashes)
             for flash in self.muzzle_flash_flashes:
                 if flash['life'] > 0 and flash['radius'] < flash['max_radius']:
                     # Fade out as life decreases
                     alpha = max(0, min(255, int(255 * (flash['life'] / 120))))
-                    surface_size = int(flash['radius'] * 2 + 4)
-                    flash_surface = pygame.Surface((surface_size, surface_size), pygame.SRCALPHA)
-                    color_with_alpha = (*flash['color'], alpha)
-                    center = (surface_size // 2, surface_size // 2)
                     # Draw filled circle for bright flash
-                    pygame.draw.circle(flash_surface, color_with_alpha, center, int(flash['radius']))
-                    self.screen.blit(flash_surface, (int(flash['x'] - flash['radius']),
-                                                   int(flash['y'] - flash['radius'])))
+                    EffectSprites.draw_circle(self.screen, flash['color'], (flash['x'], flash['y']), flash['radius'], alpha)
 
             for barrier in self.barriers:
                 barrier.draw(self.screen)
@@ -12545,89 +13759,29 @@ class Game:
             notification.draw(self.screen)
 
         # Draw player explosion particles (outside game_over check so they're always visible)
-        for particle in self.player_explosion_particles:
-            if particle['life'] > 0:
-                alpha = max(0, min(255, particle['life'] // 2))
-                particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-                color_with_alpha = (*particle['color'], alpha)
-                pygame.draw.circle(particle_surface, color_with_alpha,
-                                 (particle['size'], particle['size']), particle['size'])
-                self.screen.blit(particle_surface, (int(particle['x'] - particle['size']),
-                                                 int(particle['y'] - particle['size'])))
-
-        # UI - Clean retro style
-        score_text = self.small_font.render(f"SCORE {self.score:,}", True, GREEN)
-        level_text = self.small_font.render(f"LEVEL {self.level}", True, CYAN)
-
-        self.screen.blit(score_text, (20, 20))
-        self.screen.blit(level_text, (20, 50))
-
-        # Player lives display
-        if self.coop_mode:
-            lives_text1 = self.small_font.render(f"P1 {self.players[0].lives} {'X' if not self.players[0].is_alive else ''}", True, GREEN if self.players[0].is_alive else RED)
-            lives_text2 = self.small_font.render(f"P2 {self.players[1].lives} {'X' if not self.players[1].is_alive else ''}", True, BLUE if self.players[1].is_alive else RED)
-            self.screen.blit(lives_text1, (20, 80))
-            self.screen.blit(lives_text2, (20, 110))
-
-            # Boss counter for co-op mode
-            levels_to_boss = self.levels_until_next_boss(self.level)
-            if levels_to_boss == 0:
-                boss_text = self.small_font.render(f"BOSS LEVEL!", True, RED)
-            else:
-                boss_text = self.small_font.render(f"{levels_to_boss} To Next Boss", True, YELLOW)
-            self.screen.blit(boss_text, (20, 140))
-        else:
-            if self.players:
-                lives_text = self.small_font.render(f"LIVES {self.players[0].lives}", True, WHITE)
-                self.screen.blit(lives_text, (20, 80))
-
-                # Boss counter for single player mode
-                levels_to_boss = self.levels_until_next_boss(self.level)
-                if levels_to_boss == 0:
-                    boss_text = self.small_font.render(f"BOSS LEVEL!", True, RED)
-                else:
-                    boss_text = self.small_font.render(f"{levels_to_boss} To Next Boss", True, YELLOW)
-                self.screen.blit(boss_text, (20, 110))
-
-        # XP Bar - Clean retro style
-        bar_width = 250
-        bar_height = 20
-        bar_x = SCREEN_WIDTH - bar_width - 20
-        bar_y = 20
-
-        # XP Bar background
-        pygame.draw.rect(self.screen, GRAY, (bar_x, bar_y, bar_width, bar_height))
-
-        # XP Progress
-        progress = self.xp_system.get_xp_progress()
-        progress_width = int(bar_width * progress)
-        pygame.draw.rect(self.screen, GOLD, (bar_x, bar_y, progress_width, bar_height))
+        self.player_explosion_particles.draw(self.screen)
 
-        # XP Bar border
-        pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+        # HUD layer
+        self.screen.blits(self.get_hud_blits(), False)
 
-        # XP level text
-        xp_level_text = self.small_font.render(f"XP LV {self.xp_system.level}", True, GOLD)
-        self.screen.blit(xp_level_text, (bar_x, bar_y + bar_height + 5))
-        
         # Power-up status is now displayed below each player's ship (see Player.draw())
         
         # Game over screen with comprehensive player stats
         if self.game_over and not self.awaiting_name_input:
             # Draw semi-transparent background
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
+            if self.game_over_overlay is None:
+                self.game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert(self.screen)
+                self.game_over_overlay.set_alpha(200)
+            self.screen.blit(self.game_over_overlay, (0, 0))
 
             # Title
-            game_over_text = self.font.render("GAME OVER", True, RED)
+            game_over_text = render_text(self.font, "GAME OVER", True, RED)
             text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, 50))
             self.screen.blit(game_over_text, text_rect)
 
             # Draw stats for each player
-            stats_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 12)
-            header_font = pygame.font.Font("assets/fonts/PressStart2P-Regular.ttf", 14)
+            stats_font = get_font(12)
+            header_font = get_font(14)
 
             num_players = len(self.player_stats)
             if num_players == 1:
@@ -12644,9 +13798,9 @@ class Game:
             # Controls
             if pygame.time.get_ticks() - self.game_over_time < self.input_delay_duration:
                 remaining = (self.input_delay_duration - (pygame.time.get_ticks() - self.game_over_time)) / 1000.0
-                controls_text = self.small_font.render(f"Controls unlocking in {remaining:.1f}s...", True, YELLOW)
+                controls_text = render_text(self.small_font, f"Controls unlocking in {remaining:.1f}s...", True, YELLOW)
             else:
-                controls_text = self.small_font.render("R/A: Restart | ESC/B: Title Menu", True, WHITE)
+                controls_text = render_text(self.small_font, "R/A: Restart | ESC/B: Title Menu", True, WHITE)
 
             controls_rect = controls_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 40))
             self.screen.blit(controls_text, controls_rect)
@@ -12655,13 +13809,81 @@ class Game:
             self.pause_menu.draw()
 
         # Draw instructions and screen flash, then update display
+        self.profiler.start("display")
         self.update_display()
+        self.profiler.stop("display")
+
+    def draw_background(self):
+        """Starfield, or the shake/flash color when one covers the whole screen anyway"""
+        if self.screen_shake_intensity > 0 and not self.game_over:
+            # Simple screen shake - make the background flash red/orange
+            shake_color = (min(255, self.screen_shake_intensity * 3),
+                           min(255, self.screen_shake_intensity), 0)
+            self.screen.fill(shake_color)
+        elif self.screen_flash_intensity > 0:
+            # SCREEN FLASH EFFECT - Fill screen with bright color based on flash intensity
+            flash_level = min(255, self.screen_flash_intensity)
+            self.screen.fill((flash_level, flash_level, flash_level))
+        else:
+            self.screen.fill(BLACK)
+            self.starfield.draw(self.screen)
+
+    def get_hud_blits(self):
+        """(surface, position) pairs for the HUD, re-rendered only when a value on it changes"""
+        bar_width = 250
+        progress_width = int(bar_width * self.xp_system.get_xp_progress())
+        hud_key = (self.score, self.level, self.coop_mode, self.xp_system.level, progress_width,
+                   tuple((player.lives, player.is_alive) for player in self.players))
+        if hud_key == self.hud_key:
+            return self.hud_blits
+        self.hud_key = hud_key
+
+        # UI - Clean retro style
+        blits = [
+            (render_text(self.small_font, f"SCORE {self.score:,}", True, GREEN), (20, 20)),
+            (render_text(self.small_font, f"LEVEL {self.level}", True, CYAN), (20, 50)),
+        ]
+
+        # Player lives display
+        boss_counter_y = None
+        if self.coop_mode:
+            blits.append((render_text(self.small_font, f"P1 {self.players[0].lives} {'X' if not self.players[0].is_alive else ''}", True, GREEN if self.players[0].is_alive else RED), (20, 80)))
+            blits.append((render_text(self.small_font, f"P2 {self.players[1].lives} {'X' if not self.players[1].is_alive else ''}", True, BLUE if self.players[1].is_alive else RED), (20, 110)))
+            boss_counter_y = 140
+        elif self.players:
+            blits.append((render_text(self.small_font, f"LIVES {self.players[0].lives}", True, WHITE), (20, 80)))
+            boss_counter_y = 110
+
+        # Boss counter
+        if boss_counter_y is not None:
+            levels_to_boss = self.levels_until_next_boss(self.level)
+            if levels_to_boss == 0:
+                boss_text = render_text(self.small_font, f"BOSS LEVEL!", True, RED)
+            else:
+                boss_text = render_text(self.small_font, f"{levels_to_boss} To Next Boss", True, YELLOW)
+            blits.append((boss_text, (20, boss_counter_y)))
+
+        # XP Bar - background, progress and border
+        bar_height = 20
+        bar_x = SCREEN_WIDTH - bar_width - 20
+        bar_y = 20
+        xp_bar = pygame.Surface((bar_width, bar_height))
+        xp_bar.fill(GRAY)
+        pygame.draw.rect(xp_bar, GOLD, (0, 0, progress_width, bar_height))
+        pygame.draw.rect(xp_bar, WHITE, (0, 0, bar_width, bar_height), 2)
+        blits.append((xp_bar, (bar_x, bar_y)))
+
+        # XP level text
+        blits.append((render_text(self.small_font, f"XP LV {self.xp_system.level}", True, GOLD), (bar_x, bar_y + bar_height + 5)))
+
+        self.hud_blits = blits
+        return blits
 
     def draw_player_stats(self, stats, stats_font, header_font, x, y, player):
         """Draw comprehensive stats for a single player"""
         # Player header
         player_color = GREEN if stats.player_id == 1 else BLUE
-        header_text = header_font.render(f"PLAYER {stats.player_id}", True, player_color)
+        header_text = render_text(header_font, f"PLAYER {stats.player_id}", True, player_color)
         self.screen.blit(header_text, (x, y))
         y += 40
 
@@ -12695,7 +13917,7 @@ class Game:
         # Draw all stats
         for line in stat_lines:
             if line:  # Skip empty lines
-                text = stats_font.render(line, True, WHITE)
+                text = render_text(stats_font, line, True, WHITE)
                 self.screen.blit(text, (x, y))
             y += 25
 
@@ -12703,20 +13925,55 @@ class Game:
         """Update the display"""
         # INTENSE WHITE FLASH OVERLAY - This goes over everything for maximum effect
         if self.screen_flash_intensity > 0:
-            flash_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            flash_surface.fill((255, 255, 255))
-            flash_surface.set_alpha(self.screen_flash_intensity)
-            self.screen.blit(flash_surface, (0, 0))
+            if self.flash_overlay is None:
+                self.flash_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert(self.screen)
+                self.flash_overlay.fill(WHITE)
+            self.flash_overlay.set_alpha(self.screen_flash_intensity)
+            self.screen.blit(self.flash_overlay, (0, 0))
+
+        if self.show_debug_overlay:
+            self.draw_debug_overlay()
+        if self.profiler.enabled:
+            self.profiler.draw(self.screen, self.powerup_font)
 
         pygame.display.flip()
+
+    def draw_debug_overlay(self):
+        """Frame rate and cache counters in the top left corner (toggled with DEBUG_OVERLAY_KEY)"""
+        lines = [
+            f"FPS: {self.clock.get_fps():.1f}",
+            f"Tick: {self.game_clock.tick_count}",
+            f"Fonts: {len(FONT_CACHE.fonts)} cached, {FONT_CACHE.misses} misses",
+            f"Text: {len(TEXT_CACHE.surfaces)} cached, {TEXT_CACHE.hits} hits, {TEXT_CACHE.misses} misses",
+        ]
+        y = 10
+        for line in lines:
+            text = render_text(self.powerup_font, line, True, YELLOW)
+            background = pygame.Rect(8, y - 2, text.get_width() + 4, text.get_height() + 4)
+            pygame.draw.rect(self.screen, BLACK, background)
+            self.screen.blit(text, (10, y))
+            y += text.get_height() + 6
         
     def run(self):
+        self.game_clock.install()
+        self.rng.install()
+        try:
+            return self.run_frames()
+        finally:
+            self.profiler.finish()
+            self.game_clock.uninstall()
+            self.rng.uninstall()
+            if self.replay_recorder:
+                self.replay_recorder.save(self.record_path)
+
+    def run_frames(self):
         result = None
         while self.running and not result:
             if self.paused and self.pause_menu:
                 pause_action = self.pause_menu.handle_events()
                 if pause_action == "resume":
                     self.paused = False
+                    self.game_clock.resume()
                 elif pause_action == "quit":
                     result = "title"
                 elif pause_action == "save_and_quit":
@@ -12831,11 +14088,15 @@ class Game:
                 resume_action = self.pause_menu.update()
                 if resume_action == "resume":
                     self.paused = False
+                    self.game_clock.resume()
                 self.draw()
                 self.clock.tick(60)
                 continue
 
+            self.profiler.begin_frame()
+            self.profiler.start("events")
             action = self.handle_events()
+            self.profiler.stop("events")
             if action == "restart":
                 self.restart_game()
             elif action == "title":
@@ -12846,9 +14107,16 @@ class Game:
                     self.clock.tick(60)
                     continue
                 if not self.awaiting_name_input and not self.awaiting_level_up:
+                    self.profiler.start("input")
                     self.handle_input()
+                    self.profiler.stop("input")
+                    self.profiler.start("update")
                     self.update()
+                    self.profiler.stop("update")
+                self.profiler.start("draw")
                 self.draw()
+                self.profiler.stop("draw")
+                self.profiler.end_frame()
                 delta_time = self.clock.tick(60) / 1000.0  # Convert to seconds
                 # Track play time for all players
                 self.track_for_all_players("track_play_time", delta_time)
@@ -12859,6 +14127,121 @@ class Game:
 
         return result
 
+    def fire_player_shot(self, player_index, queue_if_blocked=True):
+        """Fire for a player the same way a fire button press does (queue_if_blocked=False for held auto-fire)"""
+        player = self.players[player_index]
+        player.input_bits |= INPUT_FIRE_PRESS if queue_if_blocked else INPUT_FIRE
+        if player.has_laser:
+            shot_stat_type = 'laser'
+        elif player.has_multi_shot and player.multi_shot_ammo > 0:
+            shot_stat_type = 'multi'
+        elif player.rapid_fire and player.rapid_fire_ammo > 0:
+            shot_stat_type = 'rapid'
+        else:
+            shot_stat_type = 'normal'
+
+        shots = player.shoot(self.sound_manager)
+        # If shot was blocked by cooldown, queue it for later
+        if not shots and queue_if_blocked:
+            player.request_shot()
+        for shot_type, shot in shots:
+            if shot_type == 'bullet':
+                self.sound_manager.play_sound('shoot')
+                self.player_bullets.append(shot)
+                if player_index < len(self.player_stats):
+                    self.player_stats[player_index].record_shot(shot_stat_type)
+                self.track_shot_at_last_enemy(player.player_id)
+                self.track_shot_for_achievements(player.player_id, shot_stat_type)
+            elif shot_type == 'laser':
+                self.sound_manager.play_sound('laser')
+                self.laser_beams.append(shot)
+                if player_index < len(self.player_stats):
+                    self.player_stats[player_index].record_shot(shot_stat_type)
+                self.track_shot_at_last_enemy(player.player_id)
+                self.track_shot_for_achievements(player.player_id, shot_stat_type)
+            elif shot_type == 'muzzle_flash':
+                self.muzzle_flash_particles.extend(shot)
+            elif shot_type == 'muzzle_flash_flashes':
+                self.muzzle_flash_flashes.extend(shot)
+
+    def apply_input_bits(self, bits):
+        """Apply one tick of scripted input (replaces handle_events/handle_input when headless)"""
+        if self.game_over or self.awaiting_level_up:
+            return
+
+        player_mask = (1 << INPUT_BITS_PER_PLAYER) - 1
+        # Fire presses first, as handle_events runs before handle_input
+        for i, player in enumerate(self.players):
+            player_bits = (bits >> (i * INPUT_BITS_PER_PLAYER)) & player_mask
+            if player_bits & INPUT_FIRE_PRESS and player.is_alive:
+                self.fire_player_shot(i)
+
+        for i, player in enumerate(self.players):
+            player_bits = (bits >> (i * INPUT_BITS_PER_PLAYER)) & player_mask
+            if player_bits & INPUT_LEFT:
+                player.move_left()
+            if player_bits & INPUT_RIGHT:
+                player.move_right()
+            if player_bits & INPUT_FIRE and player.is_alive and player.upgrades.has_auto_fire():
+                # Held fire - same as auto-fire in handle_input
+                self.fire_player_shot(i, queue_if_blocked=False)
+
+    def collect_input_bits(self):
+        """Pack and clear the input every player took since the last tick"""
+        bits = 0
+        for i, player in enumerate(self.players):
+            bits |= player.input_bits << (i * INPUT_BITS_PER_PLAYER)
+            player.input_bits = 0
+        return bits
+
+    def apply_level_up_state(self, state):
+        """Restore the upgrades and lives a recorded level up screen left each player with"""
+        for player, player_state in zip(self.players, state):
+            for name, level in player_state["upgrades"].items():
+                setattr(player.upgrades, name, level)
+            player.lives = player_state["lives"]
+            if player.upgrades.boss_shield_level > 0 and not player.has_boss_shield_upgrade:
+                player.unlock_boss_shield()
+        self.complete_level_up()
+
+    def auto_level_up(self):
+        """Pick an upgrade for every player without showing the level up screen (headless)"""
+        stat_names = ["shot_speed", "fire_rate", "movement_speed", "powerup_duration"]
+        offset = self.xp_system.level - self.pending_level_ups
+        for player in self.players:
+            # Rotate through the base upgrades so long simulations spread them out
+            for i in range(len(stat_names)):
+                stat_name = stat_names[(offset + i) % len(stat_names)]
+                if player.upgrades.can_upgrade(stat_name):
+                    player.upgrades.upgrade_stat(stat_name)
+                    break
+        self.complete_level_up()
+
+    def run_headless(self, ticks, input_script=None):
+        """Simulate up to `ticks` fixed-timestep updates with no rendering or frame limiting.
+
+        Returns the number of ticks actually simulated (the run stops early on game over).
+        """
+        if input_script is None:
+            input_script = AutoPilotScript()
+
+        self.game_clock.install()
+        self.rng.install()
+        simulated = 0
+        while simulated < ticks and self.running and not self.game_over:
+            self.tick_count = simulated
+            while self.awaiting_level_up:
+                state = input_script.get_level_up(simulated)
+                if state:
+                    self.apply_level_up_state(state)
+                else:
+                    self.auto_level_up()
+            self.apply_input_bits(input_script.get_input(simulated))
+            self.update()
+            simulated += 1
+
+        return simulated
+
 def create_achievement_managers(user_manager, mode="single"):
     """Create achievement managers based on game mode
 
@@ -12902,7 +14285,73 @@ def create_achievement_managers(user_manager, mode="single"):
 
     return managers
 
+def get_command_line_value(flag, default=None):
+    """Return the value following `flag` in sys.argv, or default if absent"""
+    if flag in sys.argv:
+        index = sys.argv.index(flag)
+        if index + 1 < len(sys.argv):
+            return sys.argv[index + 1]
+    return default
+
+def run_headless_simulation(ticks, mode="single", seed=None, record_path=None, replay=None):
+    """Run a render-free simulation and report ticks per second.
+
+    With a replay (ReplayScript) the run's seed, mode and input come from the file instead.
+    """
+    if replay:
+        seed = replay.seed
+        mode = replay.mode
+        ticks = len(replay)
+
+    score_manager = HighScoreManager()
+    sound_manager = SoundManager()
+    # Throwaway achievement managers so simulations never touch saved progress
+    achievement_managers = {1: AchievementManager(None)}
+    if mode == "coop":
+        achievement_managers[2] = AchievementManager(None)
+
+    game = Game(score_manager, sound_manager, achievement_managers=achievement_managers, headless=True,
+                seed=seed, record_path=record_path)
+    game.setup_game(mode, replay.debug_config if replay else None)
+
+    start_time = time.perf_counter()
+    simulated = game.run_headless(ticks, replay)
+    elapsed = time.perf_counter() - start_time
+
+    ticks_per_second = simulated / elapsed if elapsed > 0 else float('inf')
+    LOG.flush()  # Keep queued log lines ahead of the summary
+    print(f"Headless run: {simulated} ticks in {elapsed:.2f}s ({ticks_per_second:.0f} ticks/sec, "
+          f"{ticks_per_second / 60:.1f}x real time), seed {game.rng.initial_seed}")
+    print(f"  Level {game.level}, score {game.score}, XP level {game.xp_system.level}, "
+          f"game over: {game.game_over}")
+    if game.replay_recorder:
+        game.replay_recorder.save(record_path)
+    return game
+
 def main():
+    log_spec = get_command_line_value("--log")
+    if log_spec:
+        LOG.configure(log_spec)
+    log_file = get_command_line_value("--log-file")
+    if log_file:
+        LOG.open_file(log_file)
+
+    # Load every font size up front so no screen opens the TTF mid-game
+    FONT_CACHE.preload()
+
+    seed = get_command_line_value("--seed")
+    seed = int(seed) if seed is not None else None
+    record_path = get_command_line_value("--record")
+
+    if HEADLESS:
+        ticks = int(get_command_line_value("--ticks", HEADLESS_DEFAULT_TICKS))
+        mode = "coop" if "--coop" in sys.argv else "single"
+        replay_path = get_command_line_value("--replay")
+        replay = ReplayScript(replay_path) if replay_path else None
+        run_headless_simulation(ticks, mode, seed, record_path, replay)
+        pygame.quit()
+        return
+
     score_manager = HighScoreManager()
 
     # Initialize sound manager
@@ -13074,7 +14523,8 @@ def main():
                 elif debug_action == "start":
                     game_mode = debug_config.get('mode', 'single')
                     achievement_managers = create_achievement_managers(user_manager, game_mode)
-                    game = Game(score_manager, sound_manager, achievement_managers=achievement_managers, key_bindings=key_bindings)
+                    game = Game(score_manager, sound_manager, achievement_managers=achievement_managers, key_bindings=key_bindings,
+                                seed=seed, record_path=record_path)
                     game.setup_game(game_mode, debug_config)
                     result = game.run()
 
@@ -13088,6 +14538,7 @@ def main():
             elif action == "continue":
                 # Load saved game - first read save file to determine game mode
                 try:
+                    PERSISTENCE.flush()
                     with open("savegame.json", 'r') as f:
                         save_data = json.load(f)
                     game_mode = "coop" if save_data.get('coop_mode', False) else "single"
@@ -13103,11 +14554,12 @@ def main():
                         pygame.quit()
                         sys.exit()
                 except FileNotFoundError:
-                    print("Save file not found!")
+                    LOG.error("persistence", "Save file not found!")
                     break  # Go back to title screen
             elif action in ["single", "coop"]:
                 achievement_managers = create_achievement_managers(user_manager, action)
-                game = Game(score_manager, sound_manager, achievement_managers=achievement_managers, key_bindings=key_bindings)
+                game = Game(score_manager, sound_manager, achievement_managers=achievement_managers, key_bindings=key_bindings,
+                            seed=seed, record_path=record_path)
                 game.setup_game(action)
                 result = game.run()
 